@@ -29,3 +29,5 @@ from .report import report_group
 from .tag import tag_all
 from .tag import tag_group
 from .util import print_tags
+from .util import create_snapshot_store
+from .util import print_scan_metrics
@@ -31,9 +31,14 @@ from itertools import groupby
 from jinja2 import Environment, FileSystemLoader
 from rich.console import Console
 from taggercore.model import ResourceWithTagDiffs, Tag
+from taggercore.scanner import ScanBackend, ScanMetrics
 from taggercore.usecase import scan_and_compare_resources
 
-from taggercli.commands.util import print_tags
+from taggercli.commands.util import (
+    print_tags,
+    create_snapshot_store,
+    print_scan_metrics,
+)
 from taggercli.config import get_config, init_config
 
 console = Console()
@@ -52,6 +57,18 @@ def create_report_from_cli(
     output_path: Optional[str] = typer.Option(
         None, help="output path for the created html report"
     ),
+    backend: ScanBackend = typer.Option(
+        ScanBackend.SKEW, help="backend used for finding resources"
+    ),
+    cache_ttl: int = typer.Option(
+        15, help="minutes a scan snapshot is reused, 0 disables snapshots"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="scan again even if a valid snapshot exists"
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="show wall time, resources and API calls per service"
+    ),
 ):
     init_config()
     config = get_config()
@@ -62,9 +79,14 @@ def create_report_from_cli(
     if not tags:
         console.print("No Tags found. Please specify them in your config file")
     print_tags(console, "Creating report with the following tags", tags)
-    resources_with_diffs = scan_and_compare_resources(region, tags)
+    metrics = ScanMetrics() if timings else None
+    resources_with_diffs = scan_and_compare_resources(
+        region, tags, backend, create_snapshot_store(cache_ttl), refresh, metrics
+    )
     console.print("Scanning completed")
     console.print(f"Found {len(resources_with_diffs)} resources")
+    if metrics:
+        print_scan_metrics(console, metrics)
     dashboard_data = prepare_data_for_dashboard_template(
         account_id, datetime.now(timezone.utc), resources_with_diffs
     )
@@ -106,7 +128,7 @@ def prepare_data_for_dashboard_template(
 
 
 def metrics_for_dashboard_by_service(
-    resources_by_service: Dict[str, List[ResourceWithTagDiffs]]
+    resources_by_service: Dict[str, List[ResourceWithTagDiffs]],
 ) -> Dict[str, Dict[str, int]]:
     metrics_by_service = {}
 
@@ -27,10 +27,15 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from taggercore.model import Resource, Tag, TaggingResult
-from taggercore.usecase import scan_region_and_global
+from taggercore.scanner import ScanBackend, ScanMetrics
+from taggercore.usecase import invalidate_snapshots, scan_region_and_global
 from taggercore.usecase.perform_tagging import perform_tagging
 
-from taggercli.commands.util import print_tags
+from taggercli.commands.util import (
+    print_tags,
+    create_snapshot_store,
+    print_scan_metrics,
+)
 from taggercli.config import get_config, init_config
 
 console = Console()
@@ -39,12 +44,34 @@ tag_group = typer.Typer()
 
 
 @tag_group.command("all")
-def tag_all(region: Optional[str] = typer.Option(None, help="AWS region code")):
+def tag_all(
+    region: Optional[str] = typer.Option(None, help="AWS region code"),
+    backend: ScanBackend = typer.Option(
+        ScanBackend.SKEW, help="backend used for finding resources"
+    ),
+    cache_ttl: int = typer.Option(
+        15, help="minutes a scan snapshot is reused, 0 disables snapshots"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="scan again even if a valid snapshot exists"
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="show wall time, resources and API calls per service"
+    ),
+):
     init_config()
     config = get_config()
     if region is None:
         region = config.default_region
-    resources = scan_region_and_global(region)
+    metrics = ScanMetrics() if timings else None
+    snapshot_store = create_snapshot_store(cache_ttl)
+    resources = scan_region_and_global(
+        region,
+        backend=backend,
+        snapshot_store=snapshot_store,
+        force_refresh=refresh,
+        metrics=metrics,
+    )
     regional_resources = resources[region]
     global_resources = resources["global"]
     console.print(f"Scanning completed", style="bold green")
@@ -52,12 +79,16 @@ def tag_all(region: Optional[str] = typer.Option(None, help="AWS region code")):
         f"Found [green]{len(regional_resources)}[/green] resources in region [default]{region}[/default]"
     )
     console.print(f"Found [green]{len(global_resources)}[/green] global resources")
+    if metrics:
+        print_scan_metrics(console, metrics)
     if typer.confirm("Show detailed resource list?"):
         show_detailed_tables(region, regional_resources, global_resources)
     tags = config.tags
     print_tags(console, "Found following tags", tags)
     if typer.confirm("Do you want to apply those tags ?"):
         result = apply_tags(regional_resources + global_resources, tags)
+        # the snapshots still contain the tags from before tagging
+        invalidate_snapshots([region, "global"], snapshot_store)
         print_tagging_result(result)
 
 
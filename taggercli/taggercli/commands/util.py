@@ -21,14 +21,43 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import List
+from datetime import timedelta
+from typing import List, Optional
 
 from rich.console import Console
 from rich.columns import Columns
 from rich.panel import Panel
+from rich.table import Table
+from taggercore.cache import SnapshotStore
 from taggercore.model import Tag
+from taggercore.scanner import ScanMetrics
 
 
 def print_tags(console: Console, message: str, tags: List[Tag]) -> None:
     console.print(message)
     console.print(Columns(Panel(f"{tag.key}: {tag.value}") for tag in tags))
+
+
+def create_snapshot_store(cache_ttl: int) -> Optional[SnapshotStore]:
+    """Creates a store for scan snapshots, a :param cache_ttl (in minutes) of 0 or less disables snapshots"""
+    if cache_ttl <= 0:
+        return None
+    return SnapshotStore(timedelta(minutes=cache_ttl))
+
+
+def print_scan_metrics(console: Console, metrics: ScanMetrics) -> None:
+    table = Table(title="Scan timings")
+    table.add_column("Service")
+    table.add_column("Wall time (s)", justify="right")
+    table.add_column("Resources", justify="right")
+    table.add_column("API calls", justify="right")
+    table.add_column("Retries", justify="right")
+    for service in metrics.services:
+        table.add_row(
+            service.service_uri,
+            f"{service.wall_time:.2f}",
+            str(service.resources),
+            str(service.api_calls),
+            str(service.retries),
+        )
+    console.print(table)
@@ -21,7 +21,10 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+from unittest.mock import ANY
+
 from taggercore.model import Tag, Resource
+from taggercore.scanner import ScanBackend
 from typer.testing import CliRunner
 
 from taggercli.config.config import Config
@@ -85,7 +88,13 @@ class TestTag:
         assert actual.stdout.find(
             f"Found {len(scanned_resources['eu-central-1'])} resources in region eu-central-1"
         )
-        scan_mock.assert_called_once_with("eu-central-1")
+        scan_mock.assert_called_once_with(
+            "eu-central-1",
+            backend=ScanBackend.SKEW,
+            snapshot_store=ANY,
+            force_refresh=False,
+            metrics=None,
+        )
 
     def test_tag_all_with_region_input(self, mocker):
         expected_region = "eu-west-1"
@@ -132,9 +141,21 @@ class TestTag:
         mocker.patch("taggercli.commands.tag.init_config")
         mocker.patch("taggercli.commands.tag.get_config", return_value=some_config)
         perform_tagging_mock = mocker.patch("taggercli.commands.tag.perform_tagging")
+        invalidate_mock = mocker.patch("taggercli.commands.tag.invalidate_snapshots")
 
         actual = runner.invoke(
-            cli, ["tag", "all", "--region", expected_region], input="y\n y\n"
+            cli,
+            [
+                "tag",
+                "all",
+                "--region",
+                expected_region,
+                "--cache-ttl",
+                "0",
+                "--refresh",
+                "--timings",
+            ],
+            input="y\n y\n",
         )
 
         assert not actual.exception
@@ -146,5 +167,13 @@ class TestTag:
         assert actual.stdout.find(
             f"Found {len(scanned_resources[expected_region])} resources in region eu-central-1"
         )
-        scan_mock.assert_called_once_with(expected_region)
+        scan_mock.assert_called_once_with(
+            expected_region,
+            backend=ScanBackend.SKEW,
+            snapshot_store=None,
+            force_refresh=True,
+            metrics=ANY,
+        )
+        assert "Scan timings" in actual.stdout
         perform_tagging_mock.assert_called_with(expected_resources, expected_tags)
+        invalidate_mock.assert_called_once_with([expected_region, "global"], None)
@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .tagger_path import TAGGER_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_BUCKET_REGION_FILE = TAGGER_PATH.joinpath("bucket_regions.json")
+
+
+class BucketRegionCache:
+    """Remembers the region of S3 buckets across runs
+
+    Entries do not expire, as a bucket stays in its region. A bucket which is deleted and recreated under the same
+    name may be located in another region though, callers invalidate its entry once a call to the cached region
+    shows that the bucket is not located there anymore.
+    If the cache file can not be written (e.g. in AWS Lambda, where only /tmp is writable) the regions are only kept
+    in memory for the lifetime of the process.
+
+    """
+
+    _shared: Optional["BucketRegionCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Path = DEFAULT_BUCKET_REGION_FILE):
+        """
+
+        :param path: file the bucket regions are stored in
+        """
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._regions = self._load()
+
+    @classmethod
+    def shared(cls) -> "BucketRegionCache":
+        """
+
+        :return: the cache at the default path, one instance per process which is shared by all S3 scanners
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, bucket_name: str) -> Optional[str]:
+        with self._lock:
+            return self._regions.get(bucket_name)
+
+    def put(self, bucket_name: str, region: str) -> None:
+        with self._lock:
+            self._regions[bucket_name] = region
+
+    def invalidate(self, bucket_name: str) -> None:
+        with self._lock:
+            self._regions.pop(bucket_name, None)
+
+    def save(self) -> None:
+        """Writes the cache to disk, failures are logged and the regions stay in memory"""
+        # every writer uses its own temporary file, caches of other threads or processes may save at the same time
+        temporary_file = self._path.with_name(
+            f"{self._path.stem}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                with open(temporary_file, "w") as file:
+                    json.dump(self._regions, file)
+            os.replace(temporary_file, self._path)
+        except OSError as error:
+            logger.warning(f"Failed to save bucket regions to {self._path}: {error}")
+            try:
+                os.remove(temporary_file)
+            except OSError:
+                pass
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            if not self._path.is_file():
+                return {}
+            with open(self._path) as file:
+                return json.load(file)
+        except (OSError, ValueError) as error:
+            logger.warning(f"Ignoring unreadable bucket regions {self._path}: {error}")
+            return {}
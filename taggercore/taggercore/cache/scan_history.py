@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+from .tagger_path import TAGGER_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_SCAN_HISTORY_FILE = TAGGER_PATH.joinpath("scan_history.json")
+
+
+class ScanHistory:
+    """Remembers how many resources each service returned per account and region
+
+    Services which did not return any resources in their last scan are only probed every :param probe_interval runs,
+    all other services are scanned on every run.
+
+    """
+
+    def __init__(
+        self,
+        probe_interval: int = 5,
+        full_sweep: bool = False,
+        path: Path = DEFAULT_SCAN_HISTORY_FILE,
+    ):
+        """
+
+        :param probe_interval: empty services are scanned again after being skipped :param probe_interval - 1 times
+        :param full_sweep: scan all services regardless of their history, the history is still updated
+        :param path: file the history is stored in
+        """
+        self._probe_interval = probe_interval
+        self._full_sweep = full_sweep
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._history = self._load()
+
+    def should_scan(self, account_id: str, region: str, service: str) -> bool:
+        if self._full_sweep:
+            return True
+        with self._lock:
+            entry = self._history.get(self._key(account_id, region), {}).get(service)
+        if entry is None or entry["resources"] > 0:
+            return True
+        return entry["skipped_runs"] + 1 >= self._probe_interval
+
+    def record_scan(
+        self, account_id: str, region: str, service: str, number_of_resources: int
+    ) -> None:
+        with self._lock:
+            self._history.setdefault(self._key(account_id, region), {})[service] = {
+                "resources": number_of_resources,
+                "skipped_runs": 0,
+            }
+
+    def record_skip(self, account_id: str, region: str, service: str) -> None:
+        with self._lock:
+            entry = self._history[self._key(account_id, region)][service]
+            entry["skipped_runs"] += 1
+
+    def save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file = self._path.with_suffix(".tmp")
+        with self._lock:
+            with open(temporary_file, "w") as file:
+                json.dump(self._history, file)
+            os.replace(temporary_file, self._path)
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if not self._path.is_file():
+            return {}
+        try:
+            with open(self._path) as file:
+                return json.load(file)
+        except ValueError as error:
+            logger.warning(f"Ignoring unreadable scan history {self._path}: {error}")
+            return {}
+
+    @staticmethod
+    def _key(account_id: str, region: str) -> str:
+        return f"{account_id}/{region}"
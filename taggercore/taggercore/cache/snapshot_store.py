@@ -0,0 +1,201 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from taggercore.model import Resource, Tag
+from .tagger_path import TAGGER_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_SNAPSHOT_PATH = TAGGER_PATH.joinpath("snapshots/")
+GLOBAL_SCOPE = "global"
+DEFAULT_BACKEND = "skew"
+
+
+class SnapshotStore:
+    """Persists scan results on disk so that subsequent runs can reuse them
+
+    One snapshot is kept per account, region (or 'global' for global resources) and scan backend, as backends
+    differ in the resources they find.
+    A snapshot is only reused if it is younger than the configured TTL and was created with the same excluded
+    resource types. Snapshots are outdated once resources were tagged and should be invalidated.
+
+    """
+
+    def __init__(self, ttl: timedelta, path: Path = DEFAULT_SNAPSHOT_PATH):
+        """
+
+        :param ttl: maximum age of a snapshot which is reused
+        :param path: directory the snapshots are stored in
+        """
+        self._ttl = ttl
+        self._path = Path(path)
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @property
+    def path(self):
+        return self._path
+
+    def load(
+        self,
+        account_id: str,
+        region: str,
+        resource_types_to_exclude: List[str],
+        backend: str = DEFAULT_BACKEND,
+    ) -> Optional[List[Resource]]:
+        """
+
+        :param account_id: AWS account id
+        :param region: AWS region code or 'global'
+        :param resource_types_to_exclude: resource types excluded in the scan
+        :param backend: name of the backend used for the scan
+        :return: resources of the snapshot or None if no valid snapshot exists
+        """
+        snapshot_file = self._snapshot_file(account_id, region, backend)
+        if not snapshot_file.is_file():
+            return None
+        try:
+            with open(snapshot_file) as file:
+                snapshot = json.load(file)
+            created_at = datetime.fromisoformat(snapshot["created_at"])
+            if (
+                snapshot["account_id"] != account_id
+                or snapshot["region"] != region
+                or snapshot["backend"] != backend
+            ):
+                return None
+            if sorted(snapshot["resource_types_to_exclude"]) != sorted(
+                resource_types_to_exclude
+            ):
+                return None
+            if datetime.now(timezone.utc) - created_at > self._ttl:
+                return None
+            resources = [_to_resource(resource) for resource in snapshot["resources"]]
+        except (ValueError, KeyError, TypeError) as error:
+            logger.warning(f"Ignoring unreadable snapshot {snapshot_file}: {error}")
+            return None
+        logger.info(
+            f"Using snapshot for {account_id}/{region} created at {created_at.isoformat()}"
+        )
+        return resources
+
+    def save(
+        self,
+        account_id: str,
+        region: str,
+        resource_types_to_exclude: List[str],
+        resources: List[Resource],
+        backend: str = DEFAULT_BACKEND,
+    ) -> None:
+        """Stores :param resources as snapshot, an existing snapshot for :param account_id, :param region and
+        :param backend is replaced
+
+        See load for a description of the parameters
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        snapshot_file = self._snapshot_file(account_id, region, backend)
+        snapshot = {
+            "account_id": account_id,
+            "region": region,
+            "backend": backend,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "resource_types_to_exclude": sorted(resource_types_to_exclude),
+            "resources": [_to_dict(resource) for resource in resources],
+        }
+        temporary_file = snapshot_file.with_suffix(".tmp")
+        with open(temporary_file, "w") as file:
+            json.dump(snapshot, file)
+        os.replace(temporary_file, snapshot_file)
+
+    def load_or_scan(
+        self,
+        account_id: str,
+        region: str,
+        resource_types_to_exclude: List[str],
+        scan: Callable[[], List[Resource]],
+        force_refresh: bool = False,
+        backend: str = DEFAULT_BACKEND,
+    ) -> List[Resource]:
+        """Returns the resources of a valid snapshot, otherwise calls :param scan and stores its result
+
+        :param scan: function performing the scan
+        :param force_refresh: ignore existing snapshots
+        See load for a description of the other parameters
+        """
+        if not force_refresh:
+            resources = self.load(
+                account_id, region, resource_types_to_exclude, backend
+            )
+            if resources is not None:
+                return resources
+        resources = scan()
+        self.save(account_id, region, resource_types_to_exclude, resources, backend)
+        return resources
+
+    def invalidate(self, account_id: str, region: str) -> None:
+        """Removes the snapshots of all backends for :param account_id and :param region
+
+        See load for a description of the parameters
+        """
+        for snapshot_file in self._path.glob(f"{account_id}_{region}_*.json"):
+            try:
+                snapshot_file.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _snapshot_file(self, account_id: str, region: str, backend: str) -> Path:
+        return self._path.joinpath(f"{account_id}_{region}_{backend}.json")
+
+
+def _to_dict(resource: Resource) -> Dict[str, Any]:
+    return {
+        "arn": resource.arn,
+        "id": resource.id,
+        "region": resource.region,
+        "resource_type": resource.resource_type,
+        "current_tags": [[tag.key, tag.value] for tag in resource.current_tags],
+        "name": resource.kwargs.get("name"),
+    }
+
+
+def _to_resource(resource_dict: Dict[str, Any]) -> Resource:
+    resource = Resource(
+        arn=resource_dict["arn"],
+        id=resource_dict["id"],
+        resource_type=resource_dict["resource_type"],
+        current_tags=[Tag(key, value) for key, value in resource_dict["current_tags"]],
+        name=resource_dict["name"],
+    )
+    # the region of resources with manipulated ARNs (e.g. S3 buckets) can not be derived from the ARN
+    resource.region = resource_dict["region"]
+    return resource
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from taggercore.model import Tag, TaggingResult
+from .tagger_path import TAGGER_PATH
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_TAGGING_JOURNAL_FILE = TAGGER_PATH.joinpath("tagging_journal.ndjson")
+SUCCESSFUL = "successful"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+class TaggingJournalMismatchError(Exception):
+    """Raised if a journal is resumed with other tags than the run it was started for"""
+
+
+class TaggingJournal:
+    """Records the result of every completed batch of a tagging run, one JSON object per line
+
+    The first line holds the tags of the run. Each further line is written as soon as its batch is completed, so the
+    journal survives runs which are interrupted. Resources which were tagged or skipped according to the journal do
+    not need to be tagged again when the run is resumed with the same tags.
+
+    """
+
+    def __init__(self, path: Path = DEFAULT_TAGGING_JOURNAL_FILE):
+        """
+
+        :param path: file the journal is appended to
+        """
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def start(self, tags: List[Tag]) -> None:
+        """Starts the journal of a new run, an existing journal is replaced
+
+        :param tags: tags applied by the run
+        """
+        line = json.dumps({"tags": _tag_pairs(tags)})
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "w") as file:
+                file.write(line + "\n")
+
+    def exists(self) -> bool:
+        return self._path.is_file()
+
+    def verify(self, tags: List[Tag]) -> None:
+        """Checks that the journal was started for a run applying :param tags
+
+        :param tags: tags applied by the resumed run
+        :raises TaggingJournalMismatchError: if the journal was started with other tags or has no header
+        """
+        with self._lock, open(self._path) as file:
+            first_line = file.readline()
+        try:
+            journaled_tags = json.loads(first_line).get("tags")
+        except ValueError:
+            journaled_tags = None
+        if journaled_tags is None:
+            raise TaggingJournalMismatchError(
+                f"Journal {self._path} does not record the tags of its run"
+            )
+        if sorted(map(tuple, journaled_tags)) != sorted(map(tuple, _tag_pairs(tags))):
+            raise TaggingJournalMismatchError(
+                f"Journal {self._path} was started with other tags, it can not be resumed"
+            )
+
+    def record(self, tagging_result: TaggingResult) -> None:
+        """Appends the result of a completed batch
+
+        :param tagging_result: result of the batch
+        """
+        line = json.dumps(
+            {
+                "successful_arns": tagging_result.successful_arns,
+                "failed_arns": tagging_result.failed_arns,
+                "skipped_arns": tagging_result.skipped_arns,
+            }
+        )
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "a") as file:
+                file.write(line + "\n")
+
+    def load(self) -> TaggingResult:
+        """Merges all recorded batches, if an ARN was recorded more than once its latest result counts
+
+        :return: a single tagging result
+        """
+        outcomes = self._load_outcomes()
+        return TaggingResult(
+            [arn for arn, (outcome, _) in outcomes.items() if outcome == SUCCESSFUL],
+            {
+                arn: error_msg
+                for arn, (outcome, error_msg) in outcomes.items()
+                if outcome == FAILED
+            },
+            [arn for arn, (outcome, _) in outcomes.items() if outcome == SKIPPED],
+        )
+
+    def completed_arns(self) -> Set[str]:
+        """
+
+        :return: ARNs which were tagged or skipped, failed ARNs are not completed
+        """
+        return {
+            arn
+            for arn, (outcome, _) in self._load_outcomes().items()
+            if outcome != FAILED
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._path.is_file():
+                self._path.unlink()
+
+    def _load_outcomes(self) -> Dict[str, Tuple[str, str]]:
+        outcomes = {}
+        if not self._path.is_file():
+            return outcomes
+        with self._lock, open(self._path) as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line might be incomplete if the run was killed while writing it
+                    logger.warning(f"Ignoring unreadable line in {self._path}")
+                    continue
+                for arn in entry.get("successful_arns", []):
+                    outcomes[arn] = (SUCCESSFUL, "")
+                for arn, error_msg in entry.get("failed_arns", {}).items():
+                    outcomes[arn] = (FAILED, error_msg)
+                for arn in entry.get("skipped_arns", []):
+                    outcomes[arn] = (SKIPPED, "")
+        return outcomes
+
+
+def _tag_pairs(tags: List[Tag]) -> List[List[str]]:
+    return [[tag.key, tag.value] for tag in tags]
@@ -0,0 +1,104 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_FINISHED = object()
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = 1
+) -> List[R]:
+    """Applies :param func to every item of :param items using a bounded thread pool
+
+    The order of the returned results matches the order of :param items.
+    With :param max_workers <= 1 no thread pool is created and the items are processed one after another.
+
+    :param func: function to apply, has to be thread safe
+    :param items: items to process
+    :param max_workers: maximum number of threads working on :param items at the same time
+    :return: results of :param func in the order of :param items
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def stream_concurrently(
+    functions: Iterable[Callable[[], Iterable[T]]], max_workers: int = 1
+) -> Iterator[T]:
+    """Yields the items produced by :param functions as soon as they are available
+
+    Every function returns an iterable (e.g. a generator) which is consumed on a bounded thread pool.
+    Items of different functions are interleaved in the order they arrive, items of a single function keep their order.
+    With :param max_workers <= 1 the functions are consumed one after another in the current thread.
+    An exception raised by a function is re-raised to the consumer, remaining functions are stopped.
+
+    :param functions: functions returning the items to yield, have to be thread safe
+    :param max_workers: maximum number of functions consumed at the same time
+    :return: items of all :param functions
+    """
+    functions = list(functions)
+    if max_workers <= 1 or len(functions) <= 1:
+        for function in functions:
+            yield from function()
+        return
+
+    items = queue.Queue()
+    cancelled = threading.Event()
+
+    def produce(function: Callable[[], Iterable[T]]) -> None:
+        try:
+            if not cancelled.is_set():
+                for item in function():
+                    items.put((item, None))
+                    if cancelled.is_set():
+                        break
+        except Exception as error:
+            items.put((_FINISHED, error))
+        else:
+            items.put((_FINISHED, None))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(functions))) as executor:
+        for function in functions:
+            executor.submit(produce, function)
+        running = len(functions)
+        try:
+            while running:
+                item, error = items.get()
+                if item is _FINISHED:
+                    running -= 1
+                    if error:
+                        raise error
+                else:
+                    yield item
+        finally:
+            cancelled.set()
@@ -22,5 +22,8 @@
 # under the License.
 #
 from .config_error import TaggercoreConfigError
+from .retry_policy import RetryPolicy, RETRYABLE_ERROR_CODES
+from .quota_governor import QuotaGovernor, TokenBucket, DEFAULT_RATES
 from .config import set_config, get_config, Config, ensure_config_is_set
 from .credentials import Credentials
+from .session import create_session, create_client
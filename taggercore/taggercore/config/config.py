@@ -21,12 +21,15 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+from functools import wraps
 from typing import Callable
 
 import skew
 
 from . import TaggercoreConfigError
 from .credentials import Credentials
+from .quota_governor import QuotaGovernor
+from .retry_policy import RetryPolicy
 
 
 class Config:
@@ -35,10 +38,14 @@ class Config:
         credentials: Credentials = None,
         profile: str = None,
         account_id: str = None,
+        retry_policy: RetryPolicy = None,
+        quota_governor: QuotaGovernor = None,
     ):
         self._credentials = credentials
         self._profile = profile
         self._account_id = account_id
+        self._retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self._quota_governor = quota_governor if quota_governor else QuotaGovernor()
 
     @property
     def credentials(self):
@@ -52,6 +59,14 @@ class Config:
     def account_id(self):
         return self._account_id
 
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @property
+    def quota_governor(self):
+        return self._quota_governor
+
 
 _config: Config = Config()
 
@@ -90,13 +105,14 @@ def ensure_config_is_set(func: Callable):
     :return:
     """
 
-    def function_wrapper(*args):
+    @wraps(func)
+    def function_wrapper(*args, **kwargs):
         config = get_config()
         if not config.profile and not config.account_id:
             raise TaggercoreConfigError(
                 f"No profile and no account id found. Please set the configuration before using {func}"
             )
         else:
-            return func(*args)
+            return func(*args, **kwargs)
 
     return function_wrapper
@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from botocore.client import BaseClient
+
+logger = logging.getLogger(__name__)
+
+ANY = "*"
+# Requests per second by (service, region, operation), '*' matches any region or operation
+DEFAULT_RATES = {
+    ("resourcegroupstaggingapi", ANY, "TagResources"): 5.0,
+    ("resourcegroupstaggingapi", ANY, "GetResources"): 10.0,
+    ("iam", ANY, ANY): 10.0,
+}
+
+
+class TokenBucket:
+    """Hands out tokens at a fixed rate, callers wait until a token is available"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+
+        :param rate: tokens per second
+        :param burst: maximum number of tokens which can be saved up, defaults to :param rate but at least 1
+        """
+        self._rate = rate
+        self._burst = burst if burst else max(rate, 1.0)
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Takes a token and waits until it is due
+
+        :return: seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+            # the token is reserved right away, so concurrent callers queue up behind each other
+            self._tokens -= 1
+            wait_time = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class QuotaGovernor:
+    """Limits the rate of AWS API calls of all clients it governs
+
+    Calls are throttled per (service, region, operation) with one token bucket each, so concurrent scanners and
+    taggers together stay below the API rate limits instead of running into throttling errors.
+
+    """
+
+    def __init__(self, rates: Optional[Dict[Tuple[str, str, str], float]] = None):
+        """
+
+        :param rates: requests per second by (service, region, operation), '*' matches any region or operation,
+        calls without a matching rate are not limited, defaults to DEFAULT_RATES
+        """
+        self._rates = rates if rates is not None else DEFAULT_RATES
+        self._buckets: Dict[Tuple[str, str, str], Optional[TokenBucket]] = {}
+        self._wait_times: Dict[Tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def wait_times(self) -> Dict[Tuple[str, str, str], float]:
+        """Seconds calls had to wait so far by (service, region, operation)"""
+        with self._lock:
+            return dict(self._wait_times)
+
+    def rate(self, service: str, region: str, operation: str) -> Optional[float]:
+        """
+
+        :return: requests per second for the operation or None if it is not limited
+        """
+        for key in [
+            (service, region, operation),
+            (service, region, ANY),
+            (service, ANY, operation),
+            (service, ANY, ANY),
+        ]:
+            if key in self._rates:
+                return self._rates[key]
+        return None
+
+    def acquire(self, service: str, region: str, operation: str) -> float:
+        """Waits until the call is allowed by the rate limit
+
+        :return: seconds waited
+        """
+        key = (service, region, operation)
+        with self._lock:
+            if key not in self._buckets:
+                rate = self.rate(service, region, operation)
+                self._buckets[key] = TokenBucket(rate) if rate else None
+            bucket = self._buckets[key]
+        if not bucket:
+            return 0.0
+        wait_time = bucket.acquire()
+        if wait_time > 0:
+            with self._lock:
+                self._wait_times[key] = self._wait_times.get(key, 0.0) + wait_time
+        return wait_time
+
+    def govern(self, client: BaseClient) -> BaseClient:
+        """Lets every call of :param client wait for its rate limit
+
+        :param client: boto3 client
+        :return: the same client
+        """
+        service = client.meta.service_model.service_name
+        region = client.meta.region_name or ""
+
+        def before_call(model: Any, **kwargs) -> None:
+            self.acquire(service, region, model.name)
+
+        client.meta.events.register("before-call.*.*", before_call)
+        return client
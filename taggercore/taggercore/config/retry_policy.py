@@ -0,0 +1,146 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import random
+import threading
+from typing import List, Optional
+
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
+
+RETRYABLE_ERROR_CODES = [
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "SlowDown",
+    "ProvisionedThroughputExceededException",
+    "ServiceUnavailable",
+    "InternalError",
+    "InternalFailure",
+    "InternalServiceError",
+    "RequestTimeout",
+]
+
+
+class RetryPolicy:
+    """Decides whether and when failed AWS calls are retried
+
+    Retries are delayed with exponential backoff plus jitter, so concurrent callers do not retry in lockstep.
+    All retries share one budget, once it is used up no call is retried anymore.
+    Clients of scanners use client_config, which lets botocore retry in its standard retry mode.
+    Clients of taggers use caller_retry_client_config, their calls are retried by the tagger itself.
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_budget: int = 100,
+        retryable_error_codes: Optional[List[str]] = None,
+    ):
+        """
+
+        :param max_attempts: maximum number of attempts per call, including the first one
+        :param base_delay: delay in seconds before the first retry, doubled with every further attempt
+        :param max_delay: upper bound of the delay in seconds
+        :param retry_budget: maximum number of retries of all calls using this policy
+        :param retryable_error_codes: error codes of ClientErrors which are retried, defaults to RETRYABLE_ERROR_CODES
+        """
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._remaining_budget = retry_budget
+        self._retryable_error_codes = (
+            retryable_error_codes
+            if retryable_error_codes is not None
+            else RETRYABLE_ERROR_CODES
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def remaining_budget(self) -> int:
+        return self._remaining_budget
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+
+        :param error: error raised by a call
+        :return: True for throttling, server side and connection errors
+        """
+        if isinstance(error, ClientError):
+            return (
+                error.response.get("Error", {}).get("Code")
+                in self._retryable_error_codes
+            )
+        return isinstance(error, (ConnectionError, HTTPClientError))
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Checks if a failed attempt is retried and takes the retry from the budget
+
+        :param error: error raised by the attempt
+        :param attempt: number of the failed attempt, starting with 1
+        :return: True if the call should be retried
+        """
+        if attempt >= self._max_attempts or not self.is_retryable(error):
+            return False
+        with self._lock:
+            if self._remaining_budget <= 0:
+                return False
+            self._remaining_budget -= 1
+            return True
+
+    def backoff(self, attempt: int) -> float:
+        """
+
+        :param attempt: number of the failed attempt, starting with 1
+        :return: seconds to wait before the next attempt, between half and the full exponential delay
+        """
+        delay = min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def client_config(self) -> BotoConfig:
+        """
+
+        :return: botocore config which lets clients retry up to max_attempts with backoff and jitter
+        """
+        return BotoConfig(
+            retries={"mode": "standard", "total_max_attempts": self._max_attempts}
+        )
+
+    def caller_retry_client_config(self) -> BotoConfig:
+        """
+
+        :return: botocore config which disables retries of botocore, so every retry of the caller is taken from the
+        budget instead of being multiplied by botocore's own attempts
+        """
+        return BotoConfig(retries={"mode": "standard", "total_max_attempts": 1})
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from typing import Optional
+
+import boto3
+from botocore.client import BaseClient
+
+from .config import get_config
+from .config_error import TaggercoreConfigError
+
+
+def create_session() -> boto3.Session:
+    """Creates a boto3 Session from the global taggercore config
+
+    Credentials take precedence over the configured profile.
+    :raises TaggercoreConfigError
+    :return: a boto3 Session
+    """
+    credentials = get_config().credentials
+    if credentials:
+        return boto3.Session(**credentials)
+    else:
+        profile = get_config().profile
+        if not profile:
+            raise TaggercoreConfigError(
+                "No profile and no credentials found. Please set the configuration before creating a session"
+            )
+        return boto3.Session(profile_name=profile)
+
+
+def create_client(service_name: str, region_name: Optional[str] = None) -> BaseClient:
+    """Creates a boto3 Client which retries according to the configured retry policy
+
+    Its calls are rate limited by the configured quota governor.
+
+    :param service_name: name of the AWS service, e.g. 'ec2'
+    :param region_name: AWS region code
+    :raises TaggercoreConfigError
+    :return: a boto3 Client
+    """
+    config = get_config()
+    client = create_session().client(
+        service_name,
+        region_name=region_name,
+        config=config.retry_policy.client_config(),
+    )
+    return config.quota_governor.govern(client)
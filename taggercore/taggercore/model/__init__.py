@@ -23,6 +23,7 @@
 #
 from .tag import Tag
 from .tagging_result import TaggingResult
+from .tagging_result_accumulator import TaggingResultAccumulator
 from .resource import Resource
 from .tag_diff_type import TagDiffType
 from .tag_diff import TagDiff
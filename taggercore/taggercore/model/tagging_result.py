@@ -21,23 +21,36 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class TaggingResult:
-    def __init__(self, successful_arns: List[str], failed_arns: Dict[str, str]):
+    def __init__(
+        self,
+        successful_arns: List[str],
+        failed_arns: Dict[str, str],
+        skipped_arns: Optional[List[str]] = None,
+    ):
+        """
+
+        :param successful_arns: ARNs of resources which were tagged
+        :param failed_arns: ARNs of resources which could not be tagged mapped to the error message
+        :param skipped_arns: ARNs of resources which were not tagged, as they already had all tags
+        """
         self._successful_arns = successful_arns
         self._failed_arns = failed_arns
+        self._skipped_arns = skipped_arns if skipped_arns is not None else []
 
     def __eq__(self, other):
         return (
             self._successful_arns == other.successful_arns
             and self._failed_arns == other.failed_arns
+            and self._skipped_arns == other.skipped_arns
         )
 
     def __repr__(self):
-        return "Successful: {} , Failed: {}".format(
-            self._successful_arns, self._failed_arns
+        return "Successful: {} , Failed: {} , Skipped: {}".format(
+            self._successful_arns, self._failed_arns, self._skipped_arns
         )
 
     @property
@@ -47,3 +60,7 @@ class TaggingResult:
     @property
     def failed_arns(self):
         return self._failed_arns
+
+    @property
+    def skipped_arns(self):
+        return self._skipped_arns
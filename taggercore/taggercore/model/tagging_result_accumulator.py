@@ -0,0 +1,182 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from .tagging_result import TaggingResult
+
+SUCCESSFUL = "successful"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+class TaggingResultAccumulator:
+    """Merges the tagging results of many batches into one, keeping a count of successful, failed and skipped ARNs
+
+    Adding a result only appends its ARNs, instead of copying everything merged so far. If a spill path is given,
+    the ARNs are written to that file as one JSON object per line instead of being kept in memory, so memory stays
+    flat no matter how many resources are tagged.
+
+    """
+
+    def __init__(self, spill_path: Optional[Path] = None):
+        """
+
+        :param spill_path: file the ARNs are written to instead of being kept in memory, it is overwritten
+        """
+        self._successful_arns = []
+        self._failed_arns = {}
+        self._skipped_arns = []
+        self._successful_count = 0
+        self._failed_count = 0
+        self._skipped_count = 0
+        # failed ARNs are counted once, even if they fail in several results, e.g. of a resent batch
+        self._spilled_failed_arns = set()
+        self._lock = threading.Lock()
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._spill_file = None
+        if self._spill_path:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self._spill_path, "w")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def spill_path(self) -> Optional[Path]:
+        return self._spill_path
+
+    @property
+    def successful_count(self) -> int:
+        return self._successful_count
+
+    @property
+    def failed_count(self) -> int:
+        return self._failed_count
+
+    @property
+    def skipped_count(self) -> int:
+        return self._skipped_count
+
+    def add(self, tagging_result: TaggingResult) -> None:
+        """Merges :param tagging_result into the accumulated result, can be called from several threads
+
+        :param tagging_result: result of a batch
+        """
+        with self._lock:
+            self._successful_count += len(tagging_result.successful_arns)
+            self._skipped_count += len(tagging_result.skipped_arns)
+            counted_failed_arns = (
+                self._spilled_failed_arns if self._spill_path else self._failed_arns
+            )
+            self._failed_count += len(
+                [
+                    arn
+                    for arn in tagging_result.failed_arns
+                    if arn not in counted_failed_arns
+                ]
+            )
+            if self._spill_path:
+                self._spilled_failed_arns.update(tagging_result.failed_arns)
+                self._spill(tagging_result)
+            else:
+                self._successful_arns.extend(tagging_result.successful_arns)
+                self._failed_arns.update(tagging_result.failed_arns)
+                self._skipped_arns.extend(tagging_result.skipped_arns)
+
+    def summary(self) -> Dict[str, int]:
+        """
+
+        :return: number of successful, failed and skipped ARNs
+        """
+        return {
+            SUCCESSFUL: self._successful_count,
+            FAILED: self._failed_count,
+            SKIPPED: self._skipped_count,
+        }
+
+    def records(self) -> Iterator[Tuple[str, str, str]]:
+        """Yields every accumulated ARN, reading the spill file line by line if there is one
+
+        :return: tuples of ARN, outcome (successful, failed or skipped) and error message
+        """
+        if self._spill_path:
+            with self._lock:
+                if not self._spill_file.closed:
+                    self._spill_file.flush()
+            with open(self._spill_path) as file:
+                for line in file:
+                    record = json.loads(line)
+                    yield record["arn"], record["outcome"], record.get("error", "")
+        else:
+            for arn in self._successful_arns:
+                yield arn, SUCCESSFUL, ""
+            for arn, error_msg in self._failed_arns.items():
+                yield arn, FAILED, error_msg
+            for arn in self._skipped_arns:
+                yield arn, SKIPPED, ""
+
+    def tagging_result(self) -> TaggingResult:
+        """Builds a single tagging result, which holds all accumulated ARNs in memory
+
+        :return: the accumulated tagging result
+        """
+        if not self._spill_path:
+            return TaggingResult(
+                list(self._successful_arns),
+                dict(self._failed_arns),
+                list(self._skipped_arns),
+            )
+        tagging_result = TaggingResult([], {}, [])
+        for arn, outcome, error_msg in self.records():
+            if outcome == SUCCESSFUL:
+                tagging_result.successful_arns.append(arn)
+            elif outcome == FAILED:
+                tagging_result.failed_arns[arn] = error_msg
+            else:
+                tagging_result.skipped_arns.append(arn)
+        return tagging_result
+
+    def close(self) -> None:
+        """Closes the spill file, its content is kept"""
+        with self._lock:
+            if self._spill_file:
+                self._spill_file.close()
+
+    def _spill(self, tagging_result: TaggingResult) -> None:
+        for arn in tagging_result.successful_arns:
+            self._spill_file.write(
+                json.dumps({"arn": arn, "outcome": SUCCESSFUL}) + "\n"
+            )
+        for arn, error_msg in tagging_result.failed_arns.items():
+            self._spill_file.write(
+                json.dumps({"arn": arn, "outcome": FAILED, "error": error_msg}) + "\n"
+            )
+        for arn in tagging_result.skipped_arns:
+            self._spill_file.write(json.dumps({"arn": arn, "outcome": SKIPPED}) + "\n")
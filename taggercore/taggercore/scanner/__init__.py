@@ -23,6 +23,18 @@
 #
 from .util import create_resource
 from .util import sort_resources
+from .util import enabled_regions
+from .util import is_service_available
+from .scan_backend import ScanBackend
+from .scan_metrics import ScanMetrics, ServiceScanMetrics
+from .tagging_api_scanner import TaggingApiScanner
+from .service_scanner import ServiceScanner
+from .iam_scanner import IamScanner
+from .ec2_scanner import Ec2Scanner
+from .s3_scanner import S3Scanner
+from .route53_scanner import Route53Scanner
+from .cloudfront_scanner import CloudFrontScanner
+from .service_scanner_factory import ServiceScannerFactory
 from .global_scanner import GLOBAL_SERVICES
 from .global_scanner import GlobalScanner
 from .region_scanner import RegionScanner
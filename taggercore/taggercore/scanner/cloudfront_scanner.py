@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Any, Iterator, List, Optional
+
+from taggercore.concurrency import map_concurrently
+from taggercore.model import Resource, Tag
+from taggercore.scanner.scan_metrics import ScanMetrics
+from taggercore.scanner.service_scanner import ServiceScanner
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class CloudFrontScanner(ServiceScanner):
+    """Scans CloudFront distributions, tags are fetched for many distributions at the same time"""
+
+    service = "cloudfront"
+
+    def __init__(
+        self,
+        region: str,
+        metrics: Optional[ScanMetrics] = None,
+        max_workers: int = 8,
+    ):
+        """
+
+        :param region: AWS region code, CloudFront is only available via us-east-1
+        :param metrics: collects wall time, resources, API calls and retries of the scan
+        :param max_workers: number of distributions whose tags are fetched at the same time
+        """
+        super().__init__(region, metrics)
+        self._max_workers = max_workers
+
+    def _iter_resources(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        if "distribution" in resource_types_to_exclude:
+            return
+        logger.info(f"Scanning {self.service_uri}")
+        client = self._create_client("cloudfront")
+        distributions = [
+            distribution
+            for page in client.get_paginator("list_distributions").paginate()
+            for distribution in page["DistributionList"].get("Items", [])
+        ]
+        tags = map_concurrently(
+            lambda distribution: self._distribution_tags(client, distribution["ARN"]),
+            distributions,
+            self._max_workers,
+        )
+        for distribution, distribution_tags in zip(distributions, tags):
+            yield Resource(
+                arn=distribution["ARN"],
+                id=distribution["Id"],
+                resource_type="distribution",
+                current_tags=distribution_tags,
+                name=distribution["DomainName"],
+            )
+
+    @staticmethod
+    def _distribution_tags(client: Any, arn: str) -> List[Tag]:
+        response = client.list_tags_for_resource(Resource=arn)
+        return [
+            Tag(tag["Key"], tag["Value"]) for tag in response["Tags"].get("Items", [])
+        ]
@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from collections import defaultdict
+from typing import Dict, Iterator, List
+
+import skew
+
+from taggercore.model import Resource, Tag
+from taggercore.scanner.service_scanner import ServiceScanner
+from taggercore.scanner.util import create_resource
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class Ec2Scanner(ServiceScanner):
+    """Scans EC2 resources via skew and joins the tags of all resources from a single DescribeTags stream
+
+    skew fetches the tags of EC2 resources one resource at a time, which results in one API call per instance,
+    volume, snapshot, network interface etc.
+
+    """
+
+    service = "ec2"
+
+    def _iter_resources(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        tags_by_resource_id = self._tags_by_resource_id()
+        logger.info(f"Scanning {self.service_uri}")
+        for resource in skew.scan(self.service_uri):
+            if resource.resourcetype in resource_types_to_exclude:
+                continue
+            yield create_resource(resource, tags_by_resource_id.get(resource.id, []))
+
+    def _tags_by_resource_id(self) -> Dict[str, List[Tag]]:
+        logger.info(f"Fetching tags of EC2 resources in {self._region}")
+        paginator = self._create_client("ec2").get_paginator("describe_tags")
+        tags_by_resource_id = defaultdict(list)
+        for page in paginator.paginate():
+            for tag in page["Tags"]:
+                tags_by_resource_id[tag["ResourceId"]].append(
+                    Tag(tag["Key"], tag["Value"])
+                )
+        return tags_by_resource_id
@@ -22,39 +22,135 @@
 # under the License.
 #
 import logging
-from typing import List
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, Optional
 
 import skew
 
+from taggercore.concurrency import stream_concurrently
 from taggercore.config import ensure_config_is_set
 from taggercore.model import Resource
 from taggercore.scanner import create_resource, sort_resources
+from taggercore.scanner.scan_backend import ScanBackend
+from taggercore.scanner.scan_metrics import ScanMetrics
+from taggercore.scanner.service_scanner_factory import ServiceScannerFactory
+from taggercore.scanner.tagging_api_scanner import TaggingApiScanner
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 GLOBAL_SERVICES = ["route53", "cloudfront", "iam"]
+# global services only have one endpoint, which is located in us-east-1
+GLOBAL_SERVICES_REGION = "us-east-1"
 
 
 class GlobalScanner:
-    @staticmethod
+    def __init__(
+        self,
+        backend: ScanBackend = ScanBackend.SKEW,
+        max_workers: int = len(GLOBAL_SERVICES),
+        metrics: Optional[ScanMetrics] = None,
+    ):
+        """
+
+        :param backend: backend used for finding resources, services not covered by the backend are scanned via skew
+        :param max_workers: number of services which are scanned at the same time, 1 scans them one after another
+        :param metrics: collects wall time, resources, API calls and retries per scanned service
+        """
+        self._backend = backend
+        self._max_workers = max_workers
+        self._metrics = metrics
+
     @ensure_config_is_set
-    def scan(resource_types_to_exclude: List[str]) -> List[Resource]:
+    def scan(self, resource_types_to_exclude: List[str]) -> List[Resource]:
         """
 
         :param resource_types_to_exclude: resource types which should not be included in the returned resources
         types are specified as they appear in the ARN pattern e.g. 'restapi'. See the 'type' attribute in the
         individual resource classes (https://github.com/tobHai/skew/tree/develop/skew/resources/aws)
-        :return:
+        :return: resources sorted by service and resource type
+        """
+        return sort_resources(list(self.iter_scan(resource_types_to_exclude)))
+
+    @ensure_config_is_set
+    def iter_scan(self, resource_types_to_exclude: List[str]) -> Iterator[Resource]:
+        """Yields resources as soon as they are returned by AWS, the order of the resources is not defined
+
+        :param resource_types_to_exclude: see scan
+        :return: generator of resources
         """
-        all_scanned_resources = []
-        for service in GLOBAL_SERVICES:
-            service_uri = "arn:aws:" + service + ":*:*:*/*"
-            resources = skew.scan(service_uri)
-            logger.debug(f"Scanning {service_uri}")
-            for resource in resources:
-                if resource.resourcetype in resource_types_to_exclude:
-                    continue
-                else:
-                    all_scanned_resources.append(create_resource(resource))
+        return self._iter_scan_global(resource_types_to_exclude)
+
+    def _iter_scan_global(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        yield from stream_concurrently(
+            self._scan_tasks(resource_types_to_exclude), self._max_workers
+        )
         logger.info("Scanning completed for global services")
-        return sort_resources(all_scanned_resources)
+
+    def _scan_tasks(
+        self, resource_types_to_exclude: List[str]
+    ) -> List[Callable[[], Iterable[Resource]]]:
+        scan_tasks = []
+        services = GLOBAL_SERVICES
+        if self._backend == ScanBackend.TAGGING_API:
+            scan_tasks.append(
+                partial(
+                    TaggingApiScanner(GLOBAL_SERVICES_REGION, self._metrics).iter_scan,
+                    services,
+                    resource_types_to_exclude,
+                )
+            )
+            services = [
+                service
+                for service in services
+                if not TaggingApiScanner.supports(service)
+            ]
+        for service in services:
+            service_scanner = ServiceScannerFactory.scanner_for_service(service)
+            if service_scanner:
+                scan_tasks.append(
+                    partial(
+                        service_scanner(
+                            GLOBAL_SERVICES_REGION, self._metrics
+                        ).iter_scan,
+                        resource_types_to_exclude,
+                    )
+                )
+                continue
+            service_uri = "arn:aws:" + service + ":" + GLOBAL_SERVICES_REGION + ":*:*/*"
+            scan_tasks.append(
+                partial(self._scan_service, service_uri, resource_types_to_exclude)
+            )
+        return scan_tasks
+
+    def _scan_service(
+        self, service_uri: str, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        logger.debug(f"Scanning {service_uri}")
+        resources = skew.scan(service_uri)
+        if self._metrics:
+            resources = self._metrics.measure(service_uri, resources)
+        for resource in resources:
+            if resource.resourcetype in resource_types_to_exclude:
+                continue
+            yield GlobalScanner.remove_region(create_resource(resource))
+
+    @staticmethod
+    def remove_region(resource: Resource) -> Resource:
+        """Global resources are addressed without a region, even though they are listed via a regional endpoint
+
+        :param resource: resource found via the endpoint in GLOBAL_SERVICES_REGION
+        :return: resource with an empty region in its ARN
+        """
+        if not resource.region:
+            return resource
+        arn_parts = resource.arn.split(":", 5)
+        arn_parts[3] = ""
+        return Resource(
+            ":".join(arn_parts),
+            resource.id,
+            resource.resource_type,
+            resource.current_tags,
+            **resource.kwargs,
+        )
@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from botocore.exceptions import ClientError
+
+from taggercore.concurrency import map_concurrently
+from taggercore.model import Resource, Tag
+from taggercore.scanner.scan_metrics import ScanMetrics
+from taggercore.scanner.service_scanner import ServiceScanner
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class IamScanner(ServiceScanner):
+    """Scans IAM users, roles, customer managed policies and instance profiles via GetAccountAuthorizationDetails
+
+    A few paginated calls return all principals including their tags, instead of one call per principal.
+    Customer managed policies are returned without tags, their tags are fetched through a bounded thread pool.
+    Instance profiles which are not attached to any role are listed via ListInstanceProfiles.
+    Names are passed on as 'name' kwarg, as IAM resources are tagged by name (see IamTagger).
+
+    """
+
+    service = "iam"
+
+    def __init__(
+        self, region: str, metrics: Optional[ScanMetrics] = None, max_workers: int = 8
+    ):
+        """
+
+        :param region: AWS region code
+        :param metrics: collects wall time, resources, API calls and retries of the scan
+        :param max_workers: number of policies or instance profiles whose tags are fetched at the same time
+        """
+        super().__init__(region, metrics)
+        self._max_workers = max_workers
+
+    def _iter_resources(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        filters = self._filters(resource_types_to_exclude)
+        if not filters:
+            return
+        logger.info(
+            f"Scanning IAM {', '.join(filters)} via GetAccountAuthorizationDetails"
+        )
+        client = self._create_client("iam")
+        paginator = client.get_paginator("get_account_authorization_details")
+        # instance profiles are listed for every role they are attached to
+        instance_profile_arns = set()
+        for page in paginator.paginate(Filter=filters):
+            for resource in self._resources_of_page(
+                client, page, instance_profile_arns
+            ):
+                if resource.resource_type not in resource_types_to_exclude:
+                    yield resource
+        if "instance-profile" not in resource_types_to_exclude:
+            yield from self._unattached_instance_profiles(client, instance_profile_arns)
+
+    def _resources_of_page(
+        self, client: Any, page: Dict[str, Any], instance_profile_arns: Set[str]
+    ) -> Iterator[Resource]:
+        for user in page.get("UserDetailList", []):
+            yield self.create_resource(user, "user", "UserName")
+        for role in page.get("RoleDetailList", []):
+            yield self.create_resource(role, "role", "RoleName")
+            for instance_profile in role.get("InstanceProfileList", []):
+                if instance_profile["Arn"] not in instance_profile_arns:
+                    instance_profile_arns.add(instance_profile["Arn"])
+                    yield self.create_resource(
+                        instance_profile, "instance-profile", "InstanceProfileName"
+                    )
+        policies = page.get("Policies", [])
+        # ManagedPolicyDetail carries no tags
+        policy_tags = map_concurrently(
+            lambda policy: self._tags(client.list_policy_tags, PolicyArn=policy["Arn"]),
+            policies,
+            self._max_workers,
+        )
+        for policy, tags in zip(policies, policy_tags):
+            yield self.create_resource(policy, "policy", "PolicyName", tags)
+
+    def _unattached_instance_profiles(
+        self, client: Any, instance_profile_arns: Set[str]
+    ) -> Iterator[Resource]:
+        paginator = client.get_paginator("list_instance_profiles")
+        for page in paginator.paginate():
+            instance_profiles = [
+                instance_profile
+                for instance_profile in page.get("InstanceProfiles", [])
+                if instance_profile["Arn"] not in instance_profile_arns
+            ]
+            # ListInstanceProfiles does not return tags
+            instance_profile_tags = map_concurrently(
+                lambda instance_profile: self._tags(
+                    client.list_instance_profile_tags,
+                    InstanceProfileName=instance_profile["InstanceProfileName"],
+                ),
+                instance_profiles,
+                self._max_workers,
+            )
+            for instance_profile, tags in zip(instance_profiles, instance_profile_tags):
+                instance_profile_arns.add(instance_profile["Arn"])
+                yield self.create_resource(
+                    instance_profile, "instance-profile", "InstanceProfileName", tags
+                )
+
+    @staticmethod
+    def _tags(list_tags: Any, **identifier: str) -> List[Tag]:
+        try:
+            response = list_tags(**identifier)
+        except ClientError as error:
+            logger.warning(f"Failed to get tags of {identifier}: {error}")
+            return []
+        return [Tag(tag["Key"], tag["Value"]) for tag in response.get("Tags", [])]
+
+    @staticmethod
+    def _filters(resource_types_to_exclude: List[str]) -> List[str]:
+        filters = []
+        if "user" not in resource_types_to_exclude:
+            filters.append("User")
+        if (
+            "role" not in resource_types_to_exclude
+            or "instance-profile" not in resource_types_to_exclude
+        ):
+            filters.append("Role")
+        if "policy" not in resource_types_to_exclude:
+            filters.append("LocalManagedPolicy")
+        return filters
+
+    @staticmethod
+    def create_resource(
+        details: Dict[str, Any],
+        resource_type: str,
+        name_key: str,
+        tags: Optional[List[Tag]] = None,
+    ) -> Resource:
+        """Map an entry of the authorization details to a taggercore resource
+
+        :param details: entry of UserDetailList, RoleDetailList, InstanceProfileList or Policies
+        :param resource_type: resource type as named in skew
+        :param name_key: key of the name in :param details
+        :param tags: tags of the entity, defaults to the tags in :param details
+        :return: resource named like the IAM entity
+        """
+        if tags is None:
+            tags = [Tag(tag["Key"], tag["Value"]) for tag in details.get("Tags", [])]
+        return Resource(
+            arn=details["Arn"],
+            id=details[name_key],
+            resource_type=resource_type,
+            current_tags=tags,
+            name=details[name_key],
+        )
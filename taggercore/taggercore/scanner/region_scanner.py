@@ -22,27 +22,59 @@
 # under the License.
 #
 import logging
-from typing import List
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, Optional
 
 import skew as skew
 
-from taggercore.config import ensure_config_is_set
+from taggercore.cache import ScanHistory
+from taggercore.concurrency import stream_concurrently
+from taggercore.config import ensure_config_is_set, get_config
 from taggercore.manipulation import ArnManipulationStrategyFactory
 from taggercore.model import Resource
-from taggercore.scanner import create_resource, sort_resources
+from taggercore.scanner import create_resource, is_service_available, sort_resources
 from taggercore.scanner.global_scanner import GLOBAL_SERVICES
+from taggercore.scanner.scan_backend import ScanBackend
+from taggercore.scanner.scan_metrics import ScanMetrics
+from taggercore.scanner.service_scanner_factory import ServiceScannerFactory
+from taggercore.scanner.tagging_api_scanner import TaggingApiScanner
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
 class RegionScanner:
-    def __init__(self, region: str):
+    def __init__(
+        self,
+        region: str,
+        max_workers: int = 1,
+        backend: ScanBackend = ScanBackend.SKEW,
+        scan_history: Optional[ScanHistory] = None,
+        metrics: Optional[ScanMetrics] = None,
+    ):
         """
 
         :param region: AWS region code (https://docs.aws.amazon.com/general/latest/gr/rande.html for a full list)
+        :param max_workers: number of services which are scanned at the same time, 1 scans them one after another
+        :param backend: backend used for finding resources, services not covered by the backend are scanned via skew
+        :param scan_history: if set, services which returned no resources in previous scans are only probed
+        periodically instead of being scanned on every run
+        :param metrics: collects wall time, resources, API calls and retries per scanned service
         """
         self._region = region
+        self._max_workers = max_workers
+        self._backend = backend
+        self._scan_history = scan_history
+        self._metrics = metrics
+        self._skipped_services: List[str] = []
+
+    @property
+    def skipped_services(self) -> List[str]:
+        """
+
+        :return: services which were not scanned during the last scan
+        """
+        return list(self._skipped_services)
 
     @ensure_config_is_set
     def scan(self, resource_types_to_exclude: List[str]) -> List[Resource]:
@@ -51,31 +83,129 @@ class RegionScanner:
         :param resource_types_to_exclude: resource types which should not be included in the returned resources
         types are specified as they appear in the ARN pattern e.g. 'restapi'. See the 'type' attribute in the
         individual resource classes (https://github.com/tobHai/skew/tree/develop/skew/resources/aws)
-        :return:
+        :return: resources sorted by service and resource type
         """
-        resources = self._scan_region(resource_types_to_exclude)
-        resources_with_manipulated_arns = (
-            self.manipulate_arn(resource) for resource in resources
-        )
-        return list(resources_with_manipulated_arns)
+        return sort_resources(list(self.iter_scan(resource_types_to_exclude)))
+
+    @ensure_config_is_set
+    def iter_scan(self, resource_types_to_exclude: List[str]) -> Iterator[Resource]:
+        """Yields resources as soon as they are returned by AWS, the order of the resources is not defined
+
+        :param resource_types_to_exclude: see scan
+        :return: generator of resources
+        """
+        return self._iter_scan_region(resource_types_to_exclude)
 
-    def _scan_region(self, resource_types_to_exclude: List[str]) -> List[Resource]:
+    def _iter_scan_region(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
         arn = skew.ARN()
         logger.info("Starting to scan in region {}".format(self._region))
-        all_scanned_resources = []
+        services = [
+            service
+            for service in arn.service.choices()
+            if service not in GLOBAL_SERVICES
+        ]
+        self._skipped_services = []
+        services = self._remove_unavailable_services(services)
+        if self._scan_history:
+            services = self._prune_services(services)
+        yield from stream_concurrently(
+            self._scan_tasks(services, resource_types_to_exclude), self._max_workers
+        )
+        if self._scan_history:
+            self._scan_history.save()
+        logger.info("Scanning completed for region {}".format(self._region))
 
-        for service in arn.service.choices():
-            if service in GLOBAL_SERVICES:
+    def _scan_tasks(
+        self, services: List[str], resource_types_to_exclude: List[str]
+    ) -> List[Callable[[], Iterable[Resource]]]:
+        scan_tasks = []
+        if self._backend == ScanBackend.TAGGING_API:
+            tagging_api_services = [
+                service for service in services if TaggingApiScanner.supports(service)
+            ]
+            services = [
+                service for service in services if service not in tagging_api_services
+            ]
+            scan_tasks.append(
+                partial(
+                    TaggingApiScanner(self._region, self._metrics).iter_scan,
+                    tagging_api_services,
+                    resource_types_to_exclude,
+                )
+            )
+        for service in services:
+            scan_tasks.append(
+                partial(self._scan_service, service, resource_types_to_exclude)
+            )
+        return scan_tasks
+
+    def _remove_unavailable_services(self, services: List[str]) -> List[str]:
+        unavailable_services = [
+            service
+            for service in services
+            if not is_service_available(service, self._region)
+        ]
+        if unavailable_services:
+            logger.info(
+                f"Skipping services not available in region {self._region}: {unavailable_services}"
+            )
+            self._skipped_services.extend(unavailable_services)
+        return [service for service in services if service not in unavailable_services]
+
+    def _prune_services(self, services: List[str]) -> List[str]:
+        account_id = get_config().account_id
+        services_to_scan = []
+        for service in services:
+            if self._scan_history.should_scan(account_id, self._region, service):
+                services_to_scan.append(service)
+            else:
+                self._scan_history.record_skip(account_id, self._region, service)
+                self._skipped_services.append(service)
+        pruned_services = [
+            service for service in services if service not in services_to_scan
+        ]
+        if pruned_services:
+            logger.info(
+                f"Skipping services without resources in previous scans: {pruned_services}"
+            )
+        return services_to_scan
+
+    def _scan_service(
+        self, service: str, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        number_of_resources = 0
+        for resource in self._service_resources(service, resource_types_to_exclude):
+            number_of_resources += 1
+            yield resource
+        if self._scan_history:
+            self._scan_history.record_scan(
+                get_config().account_id, self._region, service, number_of_resources
+            )
+
+    def _service_resources(
+        self, service: str, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        service_scanner = ServiceScannerFactory.scanner_for_service(service)
+        if service_scanner:
+            return service_scanner(self._region, self._metrics).iter_scan(
+                resource_types_to_exclude
+            )
+        return self._scan_with_skew(service, resource_types_to_exclude)
+
+    def _scan_with_skew(
+        self, service: str, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        service_uri = "arn:aws:" + service + ":" + self._region + ":*:*/*"
+        logger.info(f"Scanning {service_uri}")
+        resources = skew.scan(service_uri)
+        if self._metrics:
+            resources = self._metrics.measure(service_uri, resources)
+        for resource in resources:
+            if resource.resourcetype in resource_types_to_exclude:
                 continue
-            service_uri = "arn:aws:" + service + ":" + self._region + ":*:*/*"
-            resources = skew.scan(service_uri)
-            logger.info(f"Scanning {service_uri}")
-            for resource in resources:
-                if resource.resourcetype in resource_types_to_exclude:
-                    continue
-                all_scanned_resources.append(create_resource(resource))
-        logger.info("Scanning completed for region {}".format(self._region))
-        return sort_resources(all_scanned_resources)
+            yield self.manipulate_arn(create_resource(resource))
 
     @staticmethod
     def manipulate_arn(resource: Resource) -> Resource:
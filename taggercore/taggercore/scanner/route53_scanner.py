@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Any, Dict, Iterator, List
+
+from taggercore.model import Resource, Tag
+from taggercore.scanner.service_scanner import ServiceScanner
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# ListTagsForResources accepts at most 10 resource ids per call
+TAGS_BATCH_SIZE = 10
+
+
+class Route53Scanner(ServiceScanner):
+    """Scans Route53 hosted zones and health checks
+
+    Tags are fetched via ListTagsForResources for up to 10 resources per call instead of one call per resource.
+
+    """
+
+    service = "route53"
+
+    def _iter_resources(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        logger.info(f"Scanning {self.service_uri}")
+        client = self._create_client("route53")
+        if "hostedzone" not in resource_types_to_exclude:
+            hosted_zones = [
+                hosted_zone
+                for page in client.get_paginator("list_hosted_zones").paginate()
+                for hosted_zone in page["HostedZones"]
+            ]
+            yield from self._resources_with_tags(
+                client,
+                "hostedzone",
+                {
+                    hosted_zone["Id"].split("/")[-1]: hosted_zone["Name"]
+                    for hosted_zone in hosted_zones
+                },
+            )
+        if "healthcheck" not in resource_types_to_exclude:
+            health_checks = [
+                health_check
+                for page in client.get_paginator("list_health_checks").paginate()
+                for health_check in page["HealthChecks"]
+            ]
+            yield from self._resources_with_tags(
+                client,
+                "healthcheck",
+                {health_check["Id"]: None for health_check in health_checks},
+            )
+
+    def _resources_with_tags(
+        self, client: Any, resource_type: str, names_by_id: Dict[str, str]
+    ) -> Iterator[Resource]:
+        resource_ids = list(names_by_id)
+        for start in range(0, len(resource_ids), TAGS_BATCH_SIZE):
+            batch = resource_ids[start : start + TAGS_BATCH_SIZE]
+            response = client.list_tags_for_resources(
+                ResourceType=resource_type, ResourceIds=batch
+            )
+            tags_by_id = {
+                tag_set["ResourceId"]: tag_set["Tags"]
+                for tag_set in response["ResourceTagSets"]
+            }
+            for resource_id in batch:
+                yield Resource(
+                    arn=f"arn:aws:route53:::{resource_type}/{resource_id}",
+                    id=resource_id,
+                    resource_type=resource_type,
+                    current_tags=[
+                        Tag(tag["Key"], tag["Value"])
+                        for tag in tags_by_id.get(resource_id, [])
+                    ],
+                    name=names_by_id[resource_id],
+                )
@@ -0,0 +1,160 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+from botocore.exceptions import ClientError
+
+from taggercore.cache import BucketRegionCache
+from taggercore.concurrency import map_concurrently
+from taggercore.model import Resource, Tag
+from taggercore.scanner.scan_metrics import ScanMetrics
+from taggercore.scanner.service_scanner import ServiceScanner
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# GetBucketLocation returns no location constraint for us-east-1 and 'EU' for old buckets in eu-west-1
+_LOCATION_CONSTRAINT_REGIONS = {None: "us-east-1", "": "us-east-1", "EU": "eu-west-1"}
+# Errors of calls to the region of a bucket, which show that the bucket is not located there (anymore)
+_WRONG_REGION_ERROR_CODES = [
+    "PermanentRedirect",
+    "NoSuchBucket",
+    "AuthorizationHeaderMalformed",
+]
+
+
+class S3Scanner(ServiceScanner):
+    """Scans the S3 buckets located in a region
+
+    Bucket regions and tags are fetched for many buckets at the same time through a bounded thread pool.
+    Bucket regions are cached across runs, an entry is looked up again if the bucket is not found in the cached
+    region. Returned resources already carry the global bucket ARN
+    (arn:aws:s3:::<bucket>) and the region of the bucket, no further ARN manipulation is required.
+
+    """
+
+    service = "s3"
+
+    def __init__(
+        self,
+        region: str,
+        metrics: Optional[ScanMetrics] = None,
+        max_workers: int = 16,
+        bucket_region_cache: Optional[BucketRegionCache] = None,
+    ):
+        """
+
+        :param region: AWS region code
+        :param metrics: collects wall time, resources, API calls and retries of the scan
+        :param max_workers: number of buckets whose region or tags are fetched at the same time
+        :param bucket_region_cache: cache for bucket regions, defaults to the cache shared by all S3 scanners
+        """
+        super().__init__(region, metrics)
+        self._max_workers = max_workers
+        self._bucket_region_cache = bucket_region_cache or BucketRegionCache.shared()
+
+    def _iter_resources(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        if "bucket" in resource_types_to_exclude:
+            return
+        logger.info(f"Scanning {self.service_uri}")
+        client = self._create_client("s3")
+        buckets = client.list_buckets()["Buckets"]
+        regions = map_concurrently(
+            lambda bucket: self._bucket_region(client, bucket),
+            buckets,
+            self._max_workers,
+        )
+        bucket_names = [
+            bucket["Name"]
+            for bucket, region in zip(buckets, regions)
+            if region == self._region
+        ]
+        tags = map_concurrently(
+            lambda bucket_name: self._bucket_tags(client, bucket_name),
+            bucket_names,
+            self._max_workers,
+        )
+        # saved after fetching the tags, as stale regions are corrected on the way
+        self._bucket_region_cache.save()
+        for bucket_name, bucket_tags in zip(bucket_names, tags):
+            if bucket_tags is not None:
+                yield self.create_resource(bucket_name, bucket_tags)
+
+    def create_resource(self, bucket_name: str, tags: List[Tag]) -> Resource:
+        resource = Resource(
+            arn="arn:aws:s3:::" + bucket_name,
+            id=bucket_name,
+            resource_type="bucket",
+            current_tags=tags,
+            name=bucket_name,
+        )
+        # bucket ARNs do not contain a region, buckets are tagged in the region they are located in
+        resource.region = self._region
+        return resource
+
+    def _bucket_region(self, client: Any, bucket: Dict[str, Any]) -> Optional[str]:
+        bucket_name = bucket["Name"]
+        region = bucket.get("BucketRegion") or self._bucket_region_cache.get(
+            bucket_name
+        )
+        if region is None:
+            try:
+                location = client.get_bucket_location(Bucket=bucket_name)
+            except ClientError as error:
+                logger.warning(f"Failed to get region of bucket {bucket_name}: {error}")
+                return None
+            location_constraint = location.get("LocationConstraint")
+            region = _LOCATION_CONSTRAINT_REGIONS.get(
+                location_constraint, location_constraint
+            )
+        self._bucket_region_cache.put(bucket_name, region)
+        return region
+
+    def _bucket_tags(
+        self, client: Any, bucket_name: str, region_verified: bool = False
+    ) -> Optional[List[Tag]]:
+        """
+
+        :param region_verified: whether the region of the bucket was just looked up, so it is not looked up again
+        :return: tags of the bucket, None if the bucket is not located in the scanned region
+        """
+        try:
+            tag_set = client.get_bucket_tagging(Bucket=bucket_name)["TagSet"]
+        except ClientError as error:
+            error_code = error.response["Error"]["Code"]
+            if error_code in _WRONG_REGION_ERROR_CODES and not region_verified:
+                logger.info(
+                    f"Bucket {bucket_name} not found in {self._region}, looking up its region again"
+                )
+                self._bucket_region_cache.invalidate(bucket_name)
+                if self._bucket_region(client, {"Name": bucket_name}) != self._region:
+                    return None
+                return self._bucket_tags(client, bucket_name, region_verified=True)
+            if error_code != "NoSuchTagSet":
+                logger.warning(f"Failed to get tags of bucket {bucket_name}: {error}")
+            return []
+        return [Tag(tag["Key"], tag["Value"]) for tag in tag_set]
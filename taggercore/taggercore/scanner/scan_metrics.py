@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+class ServiceScanMetrics:
+    """Measurements of scanning one service URI"""
+
+    def __init__(self, service_uri: str):
+        self.service_uri = service_uri
+        self.wall_time = 0.0
+        self.resources = 0
+        self.api_calls = 0
+        self.retries = 0
+
+    def __repr__(self):
+        return (
+            f"[{self.service_uri}, {self.wall_time:.2f}s, Resources: {self.resources}, "
+            f"API calls: {self.api_calls}, Retries: {self.retries}]"
+        )
+
+
+class ScanMetrics:
+    """Collects per service measurements of one or more scans, can be shared by scanners running in parallel
+
+    Wall time and number of resources are recorded for every service. API calls and retries are counted via botocore
+    event hooks and are therefore only available for clients created by taggercore, not for the ones created by skew.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics_by_uri: Dict[str, ServiceScanMetrics] = {}
+
+    @property
+    def services(self) -> List[ServiceScanMetrics]:
+        """
+
+        :return: measurements sorted by wall time, slowest service first
+        """
+        with self._lock:
+            metrics = list(self._metrics_by_uri.values())
+        return sorted(metrics, key=lambda x: x.wall_time, reverse=True)
+
+    def measure(self, service_uri: str, resources: Iterable[Any]) -> Iterator[Any]:
+        """Passes through :param resources while recording the wall time and number of resources
+
+        The wall time covers the time from requesting the first resource until :param resources is exhausted.
+        :param service_uri: uri the measurements are recorded for
+        :param resources: resources of the service
+        :return: generator of :param resources
+        """
+        start = time.perf_counter()
+        number_of_resources = 0
+        try:
+            for resource in resources:
+                number_of_resources += 1
+                yield resource
+        finally:
+            wall_time = time.perf_counter() - start
+            with self._lock:
+                metrics = self._get_or_create(service_uri)
+                metrics.wall_time += wall_time
+                metrics.resources += number_of_resources
+
+    def instrument(self, client: Any, service_uri: str) -> Any:
+        """Counts API calls and retries of :param client for :param service_uri
+
+        :param client: boto3 client
+        :param service_uri: uri the measurements are recorded for
+        :return: the instrumented client
+        """
+
+        def count_api_call(parsed: Dict[str, Any] = None, **kwargs) -> None:
+            retries = (parsed or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0)
+            self.record_api_call(service_uri, retries)
+
+        client.meta.events.register("after-call.*.*", count_api_call)
+        return client
+
+    def record_api_call(self, service_uri: str, retries: int = 0) -> None:
+        with self._lock:
+            metrics = self._get_or_create(service_uri)
+            metrics.api_calls += 1
+            metrics.retries += retries
+
+    def _get_or_create(self, service_uri: str) -> ServiceScanMetrics:
+        if service_uri not in self._metrics_by_uri:
+            self._metrics_by_uri[service_uri] = ServiceScanMetrics(service_uri)
+        return self._metrics_by_uri[service_uri]
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional
+
+from botocore.client import BaseClient
+
+from taggercore.config import create_client
+from taggercore.model import Resource
+from taggercore.scanner.scan_metrics import ScanMetrics
+
+
+class ServiceScanner(ABC):
+    """Scans a single service via its own API instead of skew
+
+    Service scanners are used for services where skew needs too many API calls, e.g. because it fetches tags
+    resource by resource.
+
+    """
+
+    service: str
+
+    def __init__(self, region: str, metrics: Optional[ScanMetrics] = None):
+        """
+
+        :param region: AWS region code, use 'us-east-1' for global services
+        :param metrics: collects wall time, resources, API calls and retries of the scan
+        """
+        self._region = region
+        self._metrics = metrics
+
+    @property
+    def service_uri(self) -> str:
+        return "arn:aws:" + self.service + ":" + self._region + ":*:*/*"
+
+    def scan(self, resource_types_to_exclude: List[str]) -> List[Resource]:
+        """
+
+        :param resource_types_to_exclude: resource types which should not be included in the returned resources
+        :return: resources found
+        """
+        return list(self.iter_scan(resource_types_to_exclude))
+
+    def iter_scan(self, resource_types_to_exclude: List[str]) -> Iterator[Resource]:
+        """Yields resources as soon as they are returned by AWS, see scan for a description of the parameters"""
+        resources = self._iter_resources(resource_types_to_exclude)
+        if self._metrics:
+            resources = self._metrics.measure(self.service_uri, resources)
+        yield from resources
+
+    @abstractmethod
+    def _iter_resources(
+        self, resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        pass
+
+    def _create_client(self, service_name: str) -> BaseClient:
+        client = create_client(service_name, region_name=self._region)
+        if self._metrics:
+            self._metrics.instrument(client, self.service_uri)
+        return client
@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from typing import Dict, Optional, Type
+
+from .cloudfront_scanner import CloudFrontScanner
+from .ec2_scanner import Ec2Scanner
+from .iam_scanner import IamScanner
+from .route53_scanner import Route53Scanner
+from .s3_scanner import S3Scanner
+from .service_scanner import ServiceScanner
+
+
+class ServiceScannerFactory:
+    """Services which are scanned via a dedicated ServiceScanner instead of skew"""
+
+    _service_scanner_mapping: Dict[str, Type[ServiceScanner]] = {
+        "cloudfront": CloudFrontScanner,
+        "ec2": Ec2Scanner,
+        "iam": IamScanner,
+        "route53": Route53Scanner,
+        "s3": S3Scanner,
+    }
+
+    @staticmethod
+    def supports(service: str) -> bool:
+        return service in ServiceScannerFactory._service_scanner_mapping
+
+    @staticmethod
+    def scanner_for_service(service: str) -> Optional[Type[ServiceScanner]]:
+        """If a dedicated scanner for service exists return it, otherwise None"""
+        return ServiceScannerFactory._service_scanner_mapping.get(service)
@@ -0,0 +1,181 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from taggercore.config import create_client
+from taggercore.model import Resource, Tag
+from taggercore.scanner.scan_metrics import ScanMetrics
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Services (named as in skew) whose resources are returned by GetResources
+TAGGING_API_SERVICES = [
+    "acm",
+    "apigateway",
+    "cloudfront",
+    "cloudtrail",
+    "cloudwatch",
+    "dynamodb",
+    "ec2",
+    "elasticache",
+    "elasticbeanstalk",
+    "elb",
+    "elbv2",
+    "es",
+    "firehose",
+    "kinesis",
+    "lambda",
+    "logs",
+    "rds",
+    "route53",
+    "s3",
+    "sns",
+    "sqs",
+]
+# Resource type filters of the Tagging API use the service prefix of the ARN
+_RESOURCE_TYPE_FILTERS = {
+    "elb": "elasticloadbalancing",
+    "elbv2": "elasticloadbalancing",
+}
+# ARNs of these services do not contain the resource type
+_RESOURCE_TYPES_WITHOUT_TYPE_IN_ARN = {"s3": "bucket", "sns": "topic", "sqs": "queue"}
+# Maps resource types as they appear in the ARN to the resource types of skew, if they differ
+_SKEW_RESOURCE_TYPES = {("apigateway", "restapis"): "restapi"}
+
+
+class TaggingApiScanner:
+    """Finds resources and their tags via GetResources of the Resource Groups Tagging API
+
+    A single paginated call stream returns the resources of all requested services including their tags.
+    Please note that GetResources only returns resources which are or have been tagged.
+    Resource types are derived from the ARN and follow the naming in skew wherever possible.
+
+    """
+
+    def __init__(self, region: str, metrics: Optional[ScanMetrics] = None):
+        """
+
+        :param region: AWS region code, use 'us-east-1' for global resources (e.g. cloudfront)
+        :param metrics: collects wall time, resources, API calls and retries of the scan
+        """
+        self._region = region
+        self._metrics = metrics
+
+    @staticmethod
+    def supports(service: str) -> bool:
+        return service in TAGGING_API_SERVICES
+
+    def scan(
+        self, services: List[str], resource_types_to_exclude: List[str]
+    ) -> List[Resource]:
+        """
+
+        :param services: services (as named in skew) to scan, services not covered by the Tagging API are ignored
+        :param resource_types_to_exclude: resource types which should not be included in the returned resources
+        :return: resources found
+        """
+        return list(self.iter_scan(services, resource_types_to_exclude))
+
+    def iter_scan(
+        self, services: List[str], resource_types_to_exclude: List[str]
+    ) -> Iterator[Resource]:
+        """Yields resources page by page, see scan for a description of the parameters"""
+        resource_type_filters = sorted(
+            {
+                _RESOURCE_TYPE_FILTERS.get(service, service)
+                for service in services
+                if self.supports(service)
+            }
+        )
+        if not resource_type_filters:
+            return
+        logger.info(
+            f"Scanning {', '.join(resource_type_filters)} in {self._region} via Tagging API"
+        )
+        client = create_client("resourcegroupstaggingapi", region_name=self._region)
+        resources = self._get_resources(
+            client, resource_type_filters, resource_types_to_exclude
+        )
+        if self._metrics:
+            service_uri = "tagging-api:" + self._region
+            self._metrics.instrument(client, service_uri)
+            resources = self._metrics.measure(service_uri, resources)
+        yield from resources
+
+    def _get_resources(
+        self,
+        client: Any,
+        resource_type_filters: List[str],
+        resource_types_to_exclude: List[str],
+    ) -> Iterator[Resource]:
+        paginator = client.get_paginator("get_resources")
+        for page in paginator.paginate(ResourceTypeFilters=resource_type_filters):
+            for mapping in page["ResourceTagMappingList"]:
+                resource = self.create_resource(mapping)
+                if resource.resource_type in resource_types_to_exclude:
+                    continue
+                yield resource
+
+    def create_resource(self, resource_tag_mapping: Dict[str, Any]) -> Resource:
+        """Map an entry of the ResourceTagMappingList to a taggercore resource"""
+        arn = resource_tag_mapping["ResourceARN"]
+        resource_type, resource_id = self.split_arn(arn)
+        resource = Resource(
+            arn=arn,
+            id=resource_id,
+            resource_type=resource_type,
+            current_tags=[
+                Tag(tag["Key"], tag["Value"])
+                for tag in resource_tag_mapping.get("Tags", [])
+            ],
+        )
+        if not resource.region and resource.service == "s3":
+            # bucket ARNs do not contain a region, buckets are tagged in the region they were found
+            resource.region = self._region
+        return resource
+
+    @staticmethod
+    def split_arn(arn: str) -> Tuple[str, str]:
+        """Extracts resource type and resource id from :param arn
+
+        :return: tuple of resource type and resource id
+        """
+        splitted_arn = arn.split(":", 5)
+        service, resource = splitted_arn[2], splitted_arn[5].lstrip("/")
+        # the resource id may contain the other separator, e.g. log-group:/aws/lambda/some-function
+        separator_positions = [
+            resource.find(separator)
+            for separator in ("/", ":")
+            if separator in resource
+        ]
+        if not separator_positions:
+            return _RESOURCE_TYPES_WITHOUT_TYPE_IN_ARN.get(service, service), resource
+        position = min(separator_positions)
+        resource_type, resource_id = resource[:position], resource[position + 1 :]
+        return (
+            _SKEW_RESOURCE_TYPES.get((service, resource_type), resource_type),
+            resource_id,
+        )
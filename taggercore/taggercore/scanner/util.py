@@ -21,21 +21,80 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional
 
+import botocore.session
+
+from taggercore.config import create_client
 from taggercore.model import Resource, Tag
 
 
-def create_resource(resource: Any) -> Resource:
-    """Map a skew resource to a taggercore resource"""
+def create_resource(resource: Any, tags: Optional[List[Tag]] = None) -> Resource:
+    """Map a skew resource to a taggercore resource
+
+    :param resource: skew resource
+    :param tags: tags of the resource if they are already known, otherwise the tags are fetched via skew
+    :return: taggercore resource
+    """
     return Resource(
         arn=resource.arn,
         id=resource.id,
         resource_type=resource.resourcetype,
-        current_tags=[Tag(key, value) for key, value in resource.tags.items()],
+        current_tags=(
+            tags
+            if tags is not None
+            else [Tag(key, value) for key, value in resource.tags.items()]
+        ),
         name=resource.name,
     )
 
 
 def sort_resources(resources: List[Resource]) -> List[Resource]:
     return sorted(resources, key=lambda x: (x.service, x.resource_type))
+
+
+def enabled_regions() -> List[str]:
+    """Fetches all regions which are enabled for the configured account
+
+    Opt-in regions are only returned if the account opted in.
+    :return: AWS region codes
+    """
+    client = create_client("ec2", region_name="us-east-1")
+    response = client.describe_regions(AllRegions=False)
+    return sorted(region["RegionName"] for region in response["Regions"])
+
+
+def is_service_available(service: str, region: str) -> bool:
+    """Checks whether :param service has an endpoint in :param region
+
+    The check uses the endpoint data bundled with botocore and does not perform any network calls. Services and
+    regions unknown to botocore (e.g. regions launched after the installed botocore version) are treated as available.
+    :param service: service name as used by skew e.g. 'apigateway'
+    :param region: AWS region code
+    :return: False if the service is known to be unavailable in the region
+    """
+    available_regions = _available_regions(service)
+    if not available_regions or region not in _known_regions():
+        return True
+    return region in available_regions
+
+
+@lru_cache(maxsize=None)
+def _known_regions() -> FrozenSet[str]:
+    endpoints = botocore.session.get_session().get_data("endpoints")
+    return frozenset(
+        region
+        for partition in endpoints["partitions"]
+        for region in partition["regions"]
+    )
+
+
+@lru_cache(maxsize=None)
+def _available_regions(service: str) -> FrozenSet[str]:
+    session = botocore.session.get_session()
+    return frozenset(
+        region
+        for partition in session.get_available_partitions()
+        for region in session.get_available_regions(service, partition)
+    )
@@ -21,10 +21,15 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+from .failure_isolation import isolate_invalid_arns
+from .tagging_planner import group_by_missing_tags, plan_tags
 from .abstract_resource_group_api_tagger import AbstractResourceGroupApiTagger
 from .service_tagger import ServiceTagger
 from .global_tagger import GlobalTagger
 from .iam_tagger import IamTagger
+from .batch_service_tagger import BatchServiceTagger
+from .ec2_tagger import Ec2Tagger
+from .autoscaling_tagger import AutoScalingTagger
 from .region_tagger import RegionTagger
 from .super_tagger import GLOBAL_RES_TYPE_NOT_TAGGABLE
 from .super_tagger import REG_RES_TYPE_NOT_TAGGABLE
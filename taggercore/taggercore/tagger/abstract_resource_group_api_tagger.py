@@ -21,33 +21,50 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-import logging, time
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
-import boto3
 from botocore.client import BaseClient
-from botocore.exceptions import ClientError
 
-from taggercore.config import get_config, TaggercoreConfigError
+from taggercore.config import create_session, get_config
 from taggercore.model import Tag, Resource, TaggingResult
+from taggercore.tagger.batch_tagging import Batch, BatchTaggingMixin
+from taggercore.tagger.tagging_planner import plan_tags
 
 MAX_ALLOWED_LENGTH_OF_ARN_LIST = 20
 
 logger = logging.getLogger(__name__)
 
 
-class AbstractResourceGroupApiTagger(ABC):
+class AbstractResourceGroupApiTagger(BatchTaggingMixin, ABC):
     """Groups shared functionality for tagging classes using the Resource Groups Tagging API
 
-    Subclasses need to implement their own init_client method
+    Subclasses need to implement their own init_client method.
+    Batches of up to 20 ARNs are sent, sending, retries and skipped resources are handled as described in
+    BatchTaggingMixin. All calls are rate limited by the configured quota governor.
 
     """
 
-    def __init__(self, tags: List[Tag], resources_to_tag: List[Resource]):
+    def __init__(
+        self,
+        tags: List[Tag],
+        resources_to_tag: List[Resource],
+        max_workers: int = 1,
+        only_missing_tags: bool = False,
+    ):
+        """
+
+        :param tags: tags to apply
+        :param resources_to_tag: resources to tag
+        :param max_workers: number of batches sent at the same time, 1 sends them one after another
+        :param only_missing_tags: resources are grouped by the tags they are missing and only these are sent,
+        resources missing no tag are reported as skipped
+        """
+        super().__init__()
         self._tags = tags
         self._resources_to_tag = resources_to_tag
-        self._failed_arns = {}
+        self._init_batch_tagging(max_workers, only_missing_tags)
         self._session = self.init_session()
 
     @property
@@ -73,20 +90,24 @@ class AbstractResourceGroupApiTagger(ABC):
         return self._session
 
     def tag_all(self) -> List[TaggingResult]:
-        self._reset_previous_result()
-        client = self.init_client()
-        arns_in_sublists = self.split_into_sublist()
-        tagging_results = []
-        for sublist in arns_in_sublists:
-            tagging_results.append(self._tag_arn_list(client, sublist))
+        return self._tag(keep_results=True)
+
+    def tag_streaming(self) -> None:
+        """Tags all resources like tag_all, the results are only passed to the result listeners instead of being kept"""
+        self._tag(keep_results=False)
 
-        return tagging_results
+    def plan(self) -> Tuple[List[Tuple[Dict[str, str], List[str]]], List[str]]:
+        """Determines which tags are sent for which ARNs
 
-    def _reset_previous_result(self):
-        self._failed_arns = {}
+        :return: list of (tags, ARNs) groups and ARNs of resources which need no tagging
+        """
+        return plan_tags(self.resources_to_tag, self.tags, self._only_missing_tags)
 
     def split_into_sublist(self) -> List[List[str]]:
-        arns = self.arns
+        return self._split_into_batches(self.arns)
+
+    @staticmethod
+    def _split_into_batches(arns: List[str]) -> List[List[str]]:
         if len(arns) < MAX_ALLOWED_LENGTH_OF_ARN_LIST:
             return [arns]
         else:
@@ -95,55 +116,36 @@ class AbstractResourceGroupApiTagger(ABC):
                 for x in range(0, len(arns), MAX_ALLOWED_LENGTH_OF_ARN_LIST)
             ]
 
-    def _tag_arn_list(self, client: BaseClient, arn_list: List[str]):
-        tags = {tag.key: tag.value for tag in self.tags}
-        try:
-            response = client.tag_resources(ResourceARNList=arn_list, Tags=tags)
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "InvalidParameterException":
-                self._handle_parameter_exception(e, client, arn_list)
-            else:
-                raise e
-            response = {}
-        except Exception as e:
-            raise e
-        return self._transform_response_to_tagging_result(arn_list, response)
-
-    def _handle_parameter_exception(
-        self, error: ClientError, client: BaseClient, arn_list: List[str]
-    ):
-        error_msg = error.response["Error"]["Message"]
-        failed_arn = self._extract_arn_from_error(error_msg)
-        logger.error(
-            "Resource {} is not taggable via ResourceTaggingAPI, filtering and retrying without it".format(
-                failed_arn
+    def _plan_batches(self) -> Tuple[List[Batch], List[str]]:
+        client = get_config().quota_governor.govern(self.init_client())
+        tag_groups, complete_arns = self.plan()
+        batches = [
+            (client, sublist, tags)
+            for tags, arns in tag_groups
+            for sublist in self._split_into_batches(arns)
+        ]
+        return batches, complete_arns
+
+    def _send_tags(
+        self, client: BaseClient, arn_list: List[str], tags: Dict[str, str]
+    ) -> Dict[Any, Any]:
+        return client.tag_resources(ResourceARNList=arn_list, Tags=tags)
+
+    def _failed_arns_of_responses(
+        self, responses: List[Dict[Any, Any]]
+    ) -> Dict[str, str]:
+        failed_arns = {}
+        for response in responses:
+            failed_arns.update(
+                self._extract_failed_resource_arns(
+                    response.get("FailedResourcesMap", {})
+                )
             )
-        )
-        arn_list.remove(failed_arn)
-        self._failed_arns[failed_arn] = error_msg
-        self._tag_arn_list(client, arn_list)
-
-    def _extract_arn_from_error(self, error_msg) -> str:
-        return error_msg.split(" is")[0]
-
-    def _transform_response_to_tagging_result(
-        self, list_of_arns: List[str], response: Dict[Any, Any]
-    ) -> TaggingResult:
-        self._failed_arns = {
-            **self._failed_arns,
-            **self._extract_failed_resource_arns(
-                response.get("FailedResourcesMap", {})
-            ),
-        }
-        successful_arns = list(
-            filter(lambda arn: arn not in self._failed_arns, list_of_arns)
-        )
-        return TaggingResult(successful_arns, self._failed_arns)
+        return failed_arns
 
     @staticmethod
     def _extract_failed_resource_arns(
-        failed_resources: Dict[str, Dict[str, Any]]
+        failed_resources: Dict[str, Dict[str, Any]],
     ) -> Dict[str, str]:
         if failed_resources.keys():
             logger.error("Failed: {}".format(failed_resources))
@@ -153,13 +155,4 @@ class AbstractResourceGroupApiTagger(ABC):
         }
 
     def init_session(self):
-        credentials = get_config().credentials
-        if credentials:
-            return boto3.Session(**credentials)
-        else:
-            profile = get_config().profile
-            if not profile:
-                raise TaggercoreConfigError(
-                    "No profile and no credentials found. Please set the configuration before using tagging classes"
-                )
-            return boto3.Session(profile_name=profile)
+        return create_session()
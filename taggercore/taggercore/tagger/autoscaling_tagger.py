@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from typing import Any, Dict, List
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+from taggercore.model import Resource, Tag
+from taggercore.tagger.batch_service_tagger import BatchServiceTagger
+
+# Tags of all groups are sent in one list, the number of groups per call depends on the number of tags
+MAX_TAGS_PER_CALL = 500
+
+
+class AutoScalingTagger(BatchServiceTagger):
+    """Tags auto scaling groups via CreateOrUpdateTags
+
+    Auto scaling groups cannot be tagged via Resource Groups Tagging API, but CreateOrUpdateTags accepts the tags of
+    many groups in one call.
+
+    """
+
+    service_name = "autoscaling"
+
+    def __init__(
+        self,
+        resources: List[Resource],
+        tags: List[Tag],
+        max_workers: int = 1,
+        only_missing_tags: bool = False,
+        propagate_at_launch: bool = True,
+    ):
+        """
+
+        :param resources: auto scaling groups of any region
+        :param tags: tags to apply
+        :param max_workers: number of batches sent at the same time
+        :param only_missing_tags: only send the tags each group is missing
+        :param propagate_at_launch: whether the tags are applied to instances launched by the groups
+        """
+        super().__init__(resources, tags, max_workers, only_missing_tags)
+        self._propagate_at_launch = propagate_at_launch
+
+    @classmethod
+    def supports(cls, resource: Resource) -> bool:
+        return resource.resource_type == "autoScalingGroup"
+
+    def _batch_size(self, tags: Dict[str, str]) -> int:
+        return max(1, MAX_TAGS_PER_CALL // max(1, len(tags)))
+
+    def _extract_id(self, arn: str) -> str:
+        # arn:aws:autoscaling:region:account:autoScalingGroup:uuid:autoScalingGroupName/name
+        return arn.split("autoScalingGroupName/")[-1]
+
+    def _tag_ids(
+        self, client: BaseClient, ids: List[str], tags: Dict[str, str]
+    ) -> Dict[Any, Any]:
+        return client.create_or_update_tags(
+            Tags=[
+                {
+                    "ResourceId": group_name,
+                    "ResourceType": "auto-scaling-group",
+                    "Key": key,
+                    "Value": value,
+                    "PropagateAtLaunch": self._propagate_at_launch,
+                }
+                for group_name in ids
+                for key, value in tags.items()
+            ]
+        )
+
+    def _is_invalid_error(self, error: ClientError) -> bool:
+        # unknown groups are rejected with a ValidationError naming the group
+        return error.response["Error"]["Code"] == "ValidationError"
@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+import re
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+from taggercore.config import get_config
+from taggercore.model import Resource, Tag, TaggingResult
+from taggercore.tagger import ServiceTagger
+from taggercore.tagger.batch_tagging import Batch, BatchTaggingMixin
+from taggercore.tagger.tagging_planner import plan_tags
+
+logger = logging.getLogger(__name__)
+
+# e.g. "The instance ID 'i-0bf2a2a9f1ff1fa1c' does not exist"
+ID_IN_ERROR_PATTERN = re.compile(r"'([^',\s]+)")
+
+
+class BatchServiceTagger(BatchTaggingMixin, ServiceTagger):
+    """Groups shared functionality for service taggers which tag many resources of a region with one call
+
+    Subclasses define the client, the batch size and how a batch of resource IDs is tagged.
+    A call fails as a whole if one ID is invalid, such IDs are isolated and reported as failed by their ARN.
+    Sending, retries and skipped resources are handled as described in BatchTaggingMixin.
+
+    """
+
+    service_name: str
+
+    def __init__(
+        self,
+        resources: List[Resource],
+        tags: List[Tag],
+        max_workers: int = 1,
+        only_missing_tags: bool = False,
+    ):
+        """
+
+        :param resources: resources of any region
+        :param tags: tags to apply
+        :param max_workers: number of batches sent at the same time
+        :param only_missing_tags: resources are grouped by the tags they are missing and only these are sent,
+        resources missing no tag are reported as skipped
+        """
+        super().__init__(resources, tags)
+        self._init_batch_tagging(max_workers, only_missing_tags)
+
+    def tag_resources(self) -> List[TaggingResult]:
+        """
+
+        :return: one tagging result per batch, followed by one for the skipped resources if there are any
+        """
+        return self._tag(keep_results=True)
+
+    def tag_streaming(self) -> None:
+        self._tag(keep_results=False)
+
+    def plan(
+        self, resources: List[Resource]
+    ) -> Tuple[List[Tuple[Dict[str, str], List[str]]], List[str]]:
+        """Determines which tags are sent for which ARNs
+
+        :param resources: resources of one region
+        :return: list of (tags, ARNs) groups and ARNs of resources which need no tagging
+        """
+        return plan_tags(resources, self._tags, self._only_missing_tags)
+
+    @property
+    def _resource_label(self) -> str:
+        return "{} resources".format(self.service_name)
+
+    @abstractmethod
+    def _batch_size(self, tags: Dict[str, str]) -> int:
+        pass
+
+    @abstractmethod
+    def _extract_id(self, arn: str) -> str:
+        pass
+
+    @abstractmethod
+    def _tag_ids(
+        self, client: BaseClient, ids: List[str], tags: Dict[str, str]
+    ) -> Dict[Any, Any]:
+        pass
+
+    @abstractmethod
+    def _is_invalid_error(self, error: ClientError) -> bool:
+        pass
+
+    def _plan_batches(self) -> Tuple[List[Batch], List[str]]:
+        resources_by_region = {}
+        for resource in self.resources:
+            resources_by_region.setdefault(resource.region, []).append(resource)
+        batches = []
+        complete_arns = []
+        for region, resources in resources_by_region.items():
+            tag_groups, region_complete_arns = self.plan(resources)
+            complete_arns.extend(region_complete_arns)
+            if not tag_groups:
+                continue
+            client = self._init_client(region)
+            for tags, arns in tag_groups:
+                batch_size = self._batch_size(tags)
+                batches.extend(
+                    (client, arns[x : x + batch_size], tags)
+                    for x in range(0, len(arns), batch_size)
+                )
+        return batches, complete_arns
+
+    def _send_tags(
+        self, client: BaseClient, arn_list: List[str], tags: Dict[str, str]
+    ) -> Dict[Any, Any]:
+        return self._tag_ids(client, [self._extract_id(arn) for arn in arn_list], tags)
+
+    def _arn_extractor(self, arn_list: List[str]) -> Callable[[str], Optional[str]]:
+        arns_by_id = {self._extract_id(arn): arn for arn in arn_list}
+
+        def extract_arn(error_msg: str) -> Optional[str]:
+            match = ID_IN_ERROR_PATTERN.search(error_msg)
+            return arns_by_id.get(match.group(1)) if match else None
+
+        return extract_arn
+
+    def _init_client(self, region: str) -> BaseClient:
+        config = get_config()
+        return config.quota_governor.govern(
+            self.session.client(
+                self.service_name,
+                region_name=region,
+                config=config.retry_policy.caller_retry_client_config(),
+            )
+        )
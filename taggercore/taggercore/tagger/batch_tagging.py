@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+from taggercore.concurrency import map_concurrently
+from taggercore.config import get_config
+from taggercore.model import TaggingResult
+from taggercore.tagger.failure_isolation import (
+    extract_arn_from_error,
+    is_invalid_parameter_error,
+    isolate_invalid_arns,
+)
+from taggercore.tagger.result_notifier import ResultNotifier
+from taggercore.tagger.retrying_sender import RetryingSender, error_message
+
+logger = logging.getLogger(__name__)
+
+# a batch is sent with one call: client, ARNs and the tags applied to all of them
+Batch = Tuple[BaseClient, List[str], Dict[str, str]]
+
+
+class BatchTaggingMixin(ResultNotifier):
+    """Groups shared functionality for taggers which tag many resources with one call
+
+    Batches can be sent concurrently, if one batch is throttled all batches pause before they are sent.
+    Failed batches are retried according to the configured retry policy, once it gives up the ARNs of the batch
+    are reported as failed. A batch rejected because of an invalid resource is resent without it.
+    Resources missing no tag are reported as skipped.
+    Taggers call _init_batch_tagging in their constructor, plan their batches and send a single batch.
+
+    """
+
+    def _init_batch_tagging(self, max_workers: int, only_missing_tags: bool) -> None:
+        """
+
+        :param max_workers: number of batches sent at the same time, 1 sends them one after another
+        :param only_missing_tags: resources are grouped by the tags they are missing and only these are sent,
+        resources missing no tag are reported as skipped
+        """
+        self._max_workers = max_workers
+        self._only_missing_tags = only_missing_tags
+        self._sender = RetryingSender(get_config().retry_policy)
+
+    @property
+    def _resource_label(self) -> str:
+        """Describes the tagged resources in log messages"""
+        return "resources"
+
+    @abstractmethod
+    def _plan_batches(self) -> Tuple[List[Batch], List[str]]:
+        """
+
+        :return: batches to send and ARNs of resources which need no tagging
+        """
+        pass
+
+    @abstractmethod
+    def _send_tags(
+        self, client: BaseClient, arn_list: List[str], tags: Dict[str, str]
+    ) -> Dict[Any, Any]:
+        """Sends one call tagging :param arn_list, raises ClientError on failure
+
+        :return: response of the call
+        """
+        pass
+
+    def _is_invalid_error(self, error: ClientError) -> bool:
+        """
+
+        :return: True if :param error rejects the batch because of an invalid resource
+        """
+        return is_invalid_parameter_error(error)
+
+    def _arn_extractor(self, arn_list: List[str]) -> Callable[[str], Optional[str]]:
+        """
+
+        :return: extracts the ARN of :param arn_list named in the message of an invalid error
+        """
+        return extract_arn_from_error
+
+    def _failed_arns_of_responses(
+        self, responses: List[Dict[Any, Any]]
+    ) -> Dict[str, str]:
+        """
+
+        :return: ARNs reported as failed in the responses of accepted calls with their error message
+        """
+        return {}
+
+    def _tag(self, keep_results: bool) -> List[TaggingResult]:
+        self._sender.reset()
+        batches, complete_arns = self._plan_batches()
+
+        def tag_batch(batch: Batch) -> Optional[TaggingResult]:
+            tagging_result = self._tag_arn_list(*batch)
+            # without keep_results the result is dropped as soon as the listeners received it
+            return tagging_result if keep_results else None
+
+        results = map_concurrently(tag_batch, batches, self._max_workers)
+        if not keep_results:
+            results = []
+        skipped_result = self._notify_skipped(complete_arns, self._resource_label)
+        if keep_results and skipped_result:
+            results.append(skipped_result)
+        return results
+
+    def _tag_arn_list(
+        self, client: BaseClient, arn_list: List[str], tags: Dict[str, str]
+    ) -> TaggingResult:
+        # failed ARNs are collected per batch, as batches might be sent concurrently
+        failed_arns = {}
+        responses = isolate_invalid_arns(
+            lambda batch: self._send_arn_list(client, batch, tags, failed_arns),
+            arn_list,
+            failed_arns,
+            is_invalid=self._is_invalid_error,
+            extract_arn=self._arn_extractor(arn_list),
+        )
+        failed_arns.update(self._failed_arns_of_responses(responses))
+        logger.info(
+            "Tagged {} {}, failed to tag {}".format(
+                len(arn_list) - len(failed_arns), self._resource_label, len(failed_arns)
+            )
+        )
+        tagging_result = TaggingResult(
+            [arn for arn in arn_list if arn not in failed_arns], failed_arns
+        )
+        self._notify_result_listeners(tagging_result)
+        return tagging_result
+
+    def _send_arn_list(
+        self,
+        client: BaseClient,
+        arn_list: List[str],
+        tags: Dict[str, str],
+        failed_arns: Dict[str, str],
+    ) -> Dict[Any, Any]:
+        return self._sender.send(
+            lambda: self._send_tags(client, arn_list, tags),
+            lambda error, attempt: self._fail_arn_list(
+                error, attempt, arn_list, failed_arns
+            ),
+            is_invalid=self._is_invalid_error,
+        )
+
+    def _fail_arn_list(
+        self,
+        error: Exception,
+        attempt: int,
+        arn_list: List[str],
+        failed_arns: Dict[str, str],
+    ) -> Dict[Any, Any]:
+        error_msg = error_message(error)
+        logger.error(
+            "Giving up on {} {} after {} attempts: {}".format(
+                len(arn_list), self._resource_label, attempt, error_msg
+            )
+        )
+        failed_arns.update({arn: error_msg for arn in arn_list})
+        return {}
@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from typing import Any, Dict, List
+
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+
+from taggercore.model import Resource
+from taggercore.tagger.batch_service_tagger import BatchServiceTagger
+
+MAX_RESOURCE_IDS_PER_CALL = 1000
+# Resource types (named as in skew) whose ARN ends with the ID expected by CreateTags
+EC2_RES_TYPE_TAGGABLE_BY_ID = [
+    "customer-gateway",
+    "dhcp-options",
+    "image",
+    "instance",
+    "internet-gateway",
+    "launch-template",
+    "nat-gateway",
+    "network-acl",
+    "network-interface",
+    "route-table",
+    "security-group",
+    "snapshot",
+    "subnet",
+    "volume",
+    "vpc",
+    "vpc-peering-connection",
+    "vpn-connection",
+    "vpn-gateway",
+]
+
+
+class Ec2Tagger(BatchServiceTagger):
+    """Tags EC2 resources via CreateTags
+
+    CreateTags accepts up to 1000 resource IDs per call, instead of 20 ARNs per call of the Resource Groups Tagging
+    API.
+
+    """
+
+    service_name = "ec2"
+
+    @classmethod
+    def supports(cls, resource: Resource) -> bool:
+        return resource.resource_type in EC2_RES_TYPE_TAGGABLE_BY_ID
+
+    def _batch_size(self, tags: Dict[str, str]) -> int:
+        return MAX_RESOURCE_IDS_PER_CALL
+
+    def _extract_id(self, arn: str) -> str:
+        return arn.split(":")[5].split("/")[-1]
+
+    def _tag_ids(
+        self, client: BaseClient, ids: List[str], tags: Dict[str, str]
+    ) -> Dict[Any, Any]:
+        return client.create_tags(
+            Resources=ids,
+            Tags=[{"Key": key, "Value": value} for key, value in tags.items()],
+        )
+
+    def _is_invalid_error(self, error: ClientError) -> bool:
+        # e.g. InvalidID, InvalidInstanceID.NotFound or InvalidGroupId.Malformed
+        error_code = error.response["Error"]["Code"]
+        return error_code == "InvalidID" or error_code.endswith(
+            (".NotFound", ".Malformed")
+        )
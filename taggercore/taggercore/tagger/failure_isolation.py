@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+INVALID_PARAMETER_ERROR_CODE = "InvalidParameterException"
+
+logger = logging.getLogger(__name__)
+
+
+def isolate_invalid_arns(
+    send: Callable[[List[str]], Dict[Any, Any]],
+    arn_list: List[str],
+    failed_arns: Dict[str, str],
+    is_invalid: Optional[Callable[[ClientError], bool]] = None,
+    extract_arn: Optional[Callable[[str], Optional[str]]] = None,
+) -> List[Dict[Any, Any]]:
+    """Sends :param arn_list and isolates the ARNs which are rejected with an InvalidParameterException
+
+    The API rejects the whole batch and only names one invalid ARN in the error message.
+    The named ARN is removed and the rest is resent once, should this fail again the remaining ARNs are
+    bisected until every invalid ARN is found. A batch with k invalid ARNs needs about k * log(n) extra calls
+    instead of k sequential resends.
+
+    :param send: sends a batch of ARNs and returns the response, raises ClientError on failure
+    :param arn_list: ARNs to send
+    :param failed_arns: ARNs rejected by the API are added with the error message
+    :param is_invalid: decides if an error rejects the batch because of an invalid ARN, other errors are raised,
+    defaults to InvalidParameterException
+    :param extract_arn: extracts the invalid ARN from the error message, defaults to the Tagging API format
+    :return: responses of all batches which were accepted
+    """
+    is_invalid = is_invalid if is_invalid else is_invalid_parameter_error
+    extract_arn = extract_arn if extract_arn else extract_arn_from_error
+    responses = []
+    # stack of (batch, whether the rest is resent as a whole once the named ARN is removed)
+    pending = [(list(arn_list), True)]
+    while pending:
+        batch, resend_whole = pending.pop()
+        if not batch:
+            continue
+        try:
+            responses.append(send(batch))
+        except ClientError as e:
+            if not is_invalid(e):
+                raise e
+            error_msg = e.response["Error"]["Message"]
+            invalid_arn = extract_arn(error_msg)
+            if len(batch) == 1:
+                invalid_arn = batch[0]
+            elif invalid_arn not in batch:
+                pending.extend(_bisect(batch))
+                continue
+            logger.error(
+                "Resource {} cannot be tagged, filtering and retrying without it".format(
+                    invalid_arn
+                )
+            )
+            failed_arns[invalid_arn] = error_msg
+            remaining_arns = [arn for arn in batch if arn != invalid_arn]
+            if resend_whole:
+                pending.append((remaining_arns, False))
+            else:
+                pending.extend(_bisect(remaining_arns))
+    return responses
+
+
+def is_invalid_parameter_error(error: ClientError) -> bool:
+    return error.response["Error"]["Code"] == INVALID_PARAMETER_ERROR_CODE
+
+
+def extract_arn_from_error(error_msg: str) -> str:
+    return error_msg.split(" is")[0]
+
+
+def _bisect(arn_list: List[str]) -> List[Tuple[List[str], bool]]:
+    middle = len(arn_list) // 2
+    # second half first, so the first half is sent first
+    return [(arn_list[middle:], False), (arn_list[:middle], False)]
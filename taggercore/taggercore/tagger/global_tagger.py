@@ -26,6 +26,7 @@ from typing import List
 
 from botocore.client import BaseClient
 
+from taggercore.config import get_config
 from taggercore.model import Tag, Resource
 from taggercore.tagger import AbstractResourceGroupApiTagger
 
@@ -37,8 +38,21 @@ logger = logging.getLogger(__name__)
 class GlobalTagger(AbstractResourceGroupApiTagger):
     """Tags resources which use the global endpoint in 'us-east-1'"""
 
-    def __init__(self, tags: List[Tag], resources_to_tag: List[Resource]):
-        super().__init__(tags, resources_to_tag)
+    def __init__(
+        self,
+        tags: List[Tag],
+        resources_to_tag: List[Resource],
+        max_workers: int = 1,
+        only_missing_tags: bool = False,
+    ):
+        """
+
+        :param tags: tags to apply
+        :param resources_to_tag: global resources
+        :param max_workers: number of batches sent at the same time
+        :param only_missing_tags: only send the tags each resource is missing
+        """
+        super().__init__(tags, resources_to_tag, max_workers, only_missing_tags)
 
     @property
     def tags(self):
@@ -49,4 +63,8 @@ class GlobalTagger(AbstractResourceGroupApiTagger):
         return self._resources_to_tag
 
     def init_client(self) -> BaseClient:
-        return self.session.client("resourcegroupstaggingapi", region_name="us-east-1")
+        return self.session.client(
+            "resourcegroupstaggingapi",
+            region_name="us-east-1",
+            config=get_config().retry_policy.caller_retry_client_config(),
+        )
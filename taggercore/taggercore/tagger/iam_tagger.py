@@ -22,89 +22,199 @@
 # under the License.
 #
 import logging
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from botocore.client import BaseClient
-from botocore.exceptions import ClientError
 
+from taggercore.concurrency import map_concurrently
+from taggercore.config import get_config
 from taggercore.model import TaggingResult, Tag, Resource
 from taggercore.tagger import ServiceTagger
+from taggercore.tagger.retrying_sender import RetryingSender, error_message
+from taggercore.tagger.tagging_planner import plan_tags
 
 logger = logging.getLogger(__name__)
 
+# Maps taggable IAM resource types to the tagging operation and the parameter identifying the resource
+IAM_TAGGING_OPERATIONS = {
+    "user": ("tag_user", "UserName"),
+    "role": ("tag_role", "RoleName"),
+    "policy": ("tag_policy", "PolicyArn"),
+    "instance-profile": ("tag_instance_profile", "InstanceProfileName"),
+}
+# IAM write operations have low rate limits, more workers would only wait for the quota governor
+MAX_WORKERS = 4
+
 
 class IamTagger(ServiceTagger):
-    """Tags IAM roles and users.
+    """Tags IAM users, roles, customer managed policies and instance profiles.
 
-    Roles and users cannot be tagged via Resource Groups Tagging API.
-    They need to be tagged directly via the IAM client.
+    These resources cannot be tagged via Resource Groups Tagging API.
+    They need to be tagged directly via the IAM client, one call per resource.
+    Calls are sent by a bounded pool of workers and rate limited by the configured quota governor.
+    Failed calls are retried according to the configured retry policy.
+    With only_missing_tags each call only carries the tags its resource is missing.
 
     """
 
     def tag_resources(self):
         return self._tag_all()
 
-    def __init__(self, resources: List[Resource], tags: List[Tag]):
+    def __init__(
+        self,
+        resources: List[Resource],
+        tags: List[Tag],
+        max_workers: int = MAX_WORKERS,
+        only_missing_tags: bool = False,
+    ):
+        """
+
+        :param resources: IAM resources to tag, resources of other types are ignored
+        :param tags: tags to apply
+        :param max_workers: number of tagging calls sent at the same time
+        :param only_missing_tags: only the tags each resource is missing are sent, resources missing no tag are
+        reported as skipped
+        """
         super().__init__(resources, tags)
-        self._users = [
-            resource for resource in resources if resource.resource_type == "user"
+        self._max_workers = max_workers
+        self._only_missing_tags = only_missing_tags
+        self._sender = RetryingSender(get_config().retry_policy)
+        self._resources_by_type = {
+            resource_type: [
+                resource
+                for resource in resources
+                if resource.resource_type == resource_type
+            ]
+            for resource_type in IAM_TAGGING_OPERATIONS
+        }
+        self._iam_client = self._init_client()
+
+    def tag_streaming(self) -> None:
+        calls, complete_arns = self._plan_calls()
+        # only keeps whether each call succeeded, the results are passed to the listeners
+        succeeded = map_concurrently(
+            lambda call: self._tag_resource(*call) is None,
+            calls,
+            self._max_workers,
+        )
+        logger.info(
+            "Tagged {} IAM resources successfully, failed to tag {}".format(
+                succeeded.count(True), succeeded.count(False)
+            )
+        )
+        self._notify_skipped(complete_arns, "IAM resources")
+
+    def _plan_calls(
+        self,
+    ) -> Tuple[List[Tuple[str, Resource, List[Dict[str, str]]]], List[str]]:
+        """
+
+        :return: (resource type, resource, tags to send) per call and ARNs of resources which need no tagging
+        """
+        resources = [
+            resource
+            for resources in self._resources_by_type.values()
+            for resource in resources
         ]
-        self._roles = [
-            resource for resource in resources if resource.resource_type == "role"
+        tag_groups, complete_arns = plan_tags(
+            resources, self._tags, self._only_missing_tags
+        )
+        # resources of one group share the payload
+        iam_tags_by_arn = {}
+        for tags, arns in tag_groups:
+            iam_tags = [{"Key": key, "Value": value} for key, value in tags.items()]
+            iam_tags_by_arn.update(dict.fromkeys(arns, iam_tags))
+        calls = [
+            (resource_type, resource, iam_tags_by_arn[resource.arn])
+            for resource_type, resources in self._resources_by_type.items()
+            for resource in resources
+            if resource.arn in iam_tags_by_arn
         ]
-        self._iam_client = self._init_client()
+        return calls, complete_arns
 
     def _tag_all(self) -> List[TaggingResult]:
-        users_result = self._tag_users()
-        roles_result = self._tag_roles()
-        self._log_tagging_result(users_result, roles_result)
-        return [users_result, roles_result]
+        """
 
-    @staticmethod
-    def _log_tagging_result(
-        user_result: TaggingResult, roles_result: TaggingResult
+        :return: one tagging result for users, roles, policies and instance profiles each, followed by one for the
+        skipped resources if there are any
+        """
+        calls, complete_arns = self._plan_calls()
+        # all types share one pool, errors are returned in the order of the calls
+        errors = map_concurrently(
+            lambda call: self._tag_resource(*call), calls, self._max_workers
+        )
+        results = {
+            resource_type: TaggingResult([], {})
+            for resource_type in IAM_TAGGING_OPERATIONS
+        }
+        for (resource_type, resource, _), error in zip(calls, errors):
+            if error is None:
+                results[resource_type].successful_arns.append(resource.arn)
+            else:
+                results[resource_type].failed_arns[resource.arn] = error
+        self._log_tagging_results(results)
+        skipped_result = self._notify_skipped(complete_arns, "IAM resources")
+        return list(results.values()) + ([skipped_result] if skipped_result else [])
+
+    def _tag_resource(
+        self, resource_type: str, resource: Resource, iam_tags: List[Dict[str, str]]
+    ) -> Optional[str]:
+        """
+
+        :return: None if the resource was tagged, the error message otherwise
+        """
+        error_msg = self._sender.send(
+            lambda: self._send_tags(resource_type, resource, iam_tags),
+            lambda error, attempt: self._give_up(error, attempt, resource),
+        )
+        if error_msg is None:
+            self._notify_result_listeners(TaggingResult([resource.arn], {}))
+        else:
+            self._notify_result_listeners(TaggingResult([], {resource.arn: error_msg}))
+        return error_msg
+
+    def _send_tags(
+        self, resource_type: str, resource: Resource, iam_tags: List[Dict[str, str]]
     ) -> None:
+        operation, identifier = IAM_TAGGING_OPERATIONS[resource_type]
+        tag_function: Callable[..., Any] = getattr(self._iam_client, operation)
+        tag_function(
+            **{identifier: self._identify(resource, identifier)}, Tags=iam_tags
+        )
+
+    @staticmethod
+    def _give_up(error: Exception, attempt: int, resource: Resource) -> str:
+        error_msg = error_message(error)
+        logger.error(
+            "Giving up on {} after {} attempts: {}".format(
+                resource.arn, attempt, error_msg
+            )
+        )
+        return error_msg
+
+    @staticmethod
+    def _identify(resource: Resource, identifier: str) -> str:
+        if identifier == "PolicyArn":
+            return resource.arn
+        return resource.kwargs.get("name")
+
+    @staticmethod
+    def _log_tagging_results(results: Dict[str, TaggingResult]) -> None:
         logger.info(
-            "Tagged {} users and {} roles successfully".format(
-                len(user_result.successful_arns), len(roles_result.successful_arns)
+            "Tagged {} users, {} roles, {} policies and {} instance profiles successfully".format(
+                *[len(result.successful_arns) for result in results.values()]
             )
         )
         logger.info(
-            "Failed to tag {} users and {} roles".format(
-                len(user_result.failed_arns), len(roles_result.failed_arns)
+            "Failed to tag {} users, {} roles, {} policies and {} instance profiles".format(
+                *[len(result.failed_arns) for result in results.values()]
             )
         )
 
-    def _tag_users(self) -> TaggingResult:
-        tagging_result = TaggingResult([], {})
-        for resource in self._users:
-            try:
-                self._iam_client.tag_user(
-                    UserName=resource.kwargs.get("name"), Tags=self._extract_tags()
-                )
-                tagging_result.successful_arns.append(resource.arn)
-            except ClientError as error:
-                tagging_result.failed_arns[resource.arn] = error.response["Error"][
-                    "Message"
-                ]
-        return tagging_result
-
-    def _tag_roles(self) -> TaggingResult:
-        tagging_result = TaggingResult([], {})
-        for resource in self._roles:
-            try:
-                self._iam_client.tag_role(
-                    RoleName=resource.kwargs.get("name"), Tags=self._extract_tags()
-                )
-                tagging_result.successful_arns.append(resource.arn)
-            except ClientError as error:
-                tagging_result.failed_arns[resource.arn] = error.response["Error"][
-                    "Message"
-                ]
-        return tagging_result
-
-    def _extract_tags(self):
-        return [{"Key": tag.key, "Value": tag.value} for tag in self._tags]
-
     def _init_client(self) -> BaseClient:
-        return self.session.client("iam")
+        config = get_config()
+        return config.quota_governor.govern(
+            self.session.client(
+                "iam", config=config.retry_policy.caller_retry_client_config()
+            )
+        )
@@ -26,6 +26,7 @@ from typing import List
 
 from botocore.client import BaseClient
 
+from taggercore.config import get_config
 from taggercore.model import Tag, Resource
 from taggercore.tagger import AbstractResourceGroupApiTagger
 
@@ -35,15 +36,24 @@ logger = logging.getLogger(__name__)
 class RegionTagger(AbstractResourceGroupApiTagger):
     """Tags supported resources via Resource Groups Tagging API"""
 
-    def __init__(self, tags: List[Tag], resources_to_tag: List[Resource], region: str):
+    def __init__(
+        self,
+        tags: List[Tag],
+        resources_to_tag: List[Resource],
+        region: str,
+        max_workers: int = 1,
+        only_missing_tags: bool = False,
+    ):
         """
 
         :param tags: tags to apply
         :param resources_to_tag: resources in specified :param region
         :param region: AWS region code (https://docs.aws.amazon.com/general/latest/gr/rande.html for a full list)
+        :param max_workers: number of batches sent at the same time
+        :param only_missing_tags: only send the tags each resource is missing
         """
         self._region = region
-        super().__init__(tags, resources_to_tag)
+        super().__init__(tags, resources_to_tag, max_workers, only_missing_tags)
 
     @property
     def tags(self):
@@ -59,4 +69,8 @@ class RegionTagger(AbstractResourceGroupApiTagger):
 
     def init_client(self) -> BaseClient:
         logger.info("Setting up region tagger in region {}".format(self._region))
-        return self.session.client("resourcegroupstaggingapi", region_name=self._region)
+        return self.session.client(
+            "resourcegroupstaggingapi",
+            region_name=self._region,
+            config=get_config().retry_policy.caller_retry_client_config(),
+        )
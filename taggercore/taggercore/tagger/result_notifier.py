@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+from typing import Callable, List, Optional
+
+from taggercore.model import TaggingResult
+
+logger = logging.getLogger(__name__)
+
+
+class ResultNotifier:
+    """Passes the tagging results of a tagger to its listeners as soon as they are completed"""
+
+    def __init__(self):
+        self._result_listeners: List[Callable[[TaggingResult], None]] = []
+
+    def add_result_listener(self, listener: Callable[[TaggingResult], None]) -> None:
+        """
+
+        :param listener: called with every tagging result as soon as it is completed, possibly from several threads
+        """
+        self._result_listeners.append(listener)
+
+    def remove_result_listener(self, listener: Callable[[TaggingResult], None]) -> None:
+        self._result_listeners.remove(listener)
+
+    def _notify_result_listeners(self, tagging_result: TaggingResult) -> None:
+        for listener in self._result_listeners:
+            listener(tagging_result)
+
+    def _notify_skipped(
+        self, complete_arns: List[str], resource_label: str
+    ) -> Optional[TaggingResult]:
+        """Reports resources which are missing no tag as skipped
+
+        :param complete_arns: ARNs of resources which need no tagging
+        :param resource_label: describes the resources in the log message, e.g. 'IAM resources'
+        :return: the skipped result passed to the listeners, None if there are no :param complete_arns
+        """
+        if not complete_arns:
+            return None
+        logger.info(
+            "Skipping {} {} which are missing no tag".format(
+                len(complete_arns), resource_label
+            )
+        )
+        skipped_result = TaggingResult([], {}, complete_arns)
+        self._notify_result_listeners(skipped_result)
+        return skipped_result
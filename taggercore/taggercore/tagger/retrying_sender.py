@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from taggercore.config import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class RetryingSender:
+    """Sends tagging calls and retries them according to a retry policy
+
+    Failed calls are retried with the backoff of the policy. If one call backs off, all calls sent through the same
+    sender pause until the backoff is over, so concurrent batches do not keep running into the throttling.
+
+    """
+
+    def __init__(self, retry_policy: RetryPolicy):
+        """
+
+        :param retry_policy: decides whether and when a failed call is retried
+        """
+        self._retry_policy = retry_policy
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def send(
+        self,
+        call: Callable[[], Any],
+        give_up: Callable[[Exception, int], Any],
+        is_invalid: Optional[Callable[[ClientError], bool]] = None,
+    ) -> Any:
+        """Calls :param call until it succeeds or the retry policy gives up
+
+        :param call: sends the request and returns the response
+        :param give_up: called with the last error and the number of attempts once the policy gives up, its return
+        value is returned instead of a response
+        :param is_invalid: decides if a ClientError is caused by invalid input, such errors are raised right away
+        :return: response of :param call or the return value of :param give_up
+        """
+        attempt = 1
+        while True:
+            self._wait_while_throttled()
+            try:
+                return call()
+            except (ClientError, BotoCoreError) as e:
+                if is_invalid and isinstance(e, ClientError) and is_invalid(e):
+                    raise e
+                if not self._retry_policy.should_retry(e, attempt):
+                    return give_up(e, attempt)
+                self._pause(attempt)
+                attempt += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._resume_at = 0.0
+
+    def _pause(self, attempt: int) -> None:
+        pause = self._retry_policy.backoff(attempt)
+        logger.warning(
+            "Attempt {} failed, pausing for {:.1f} seconds".format(attempt, pause)
+        )
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+
+    def _wait_while_throttled(self) -> None:
+        with self._lock:
+            pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+
+
+def error_message(error: Exception) -> str:
+    if isinstance(error, ClientError):
+        return error.response["Error"]["Message"]
+    return str(error)
@@ -24,14 +24,14 @@
 from abc import ABC, abstractmethod
 from typing import List
 
-import boto3
-
-from taggercore.config import get_config, TaggercoreConfigError
+from taggercore.config import create_session
 from taggercore.model import Resource, Tag
+from taggercore.tagger.result_notifier import ResultNotifier
 
 
-class ServiceTagger(ABC):
+class ServiceTagger(ResultNotifier, ABC):
     def __init__(self, resources: List[Resource], tags: List[Tag]):
+        super().__init__()
         self._session = self.init_session()
         self._resources = resources
         self._tags = tags
@@ -48,19 +48,28 @@ class ServiceTagger(ABC):
     def tag_resources(self):
         pass
 
+    def tag_streaming(self) -> None:
+        """Tags all resources like tag_resources, the results are only passed to the result listeners
+
+        Subclasses override this to drop every result as soon as the listeners received it.
+        """
+        for tagging_result in self.tag_resources():
+            self._notify_result_listeners(tagging_result)
+
+    @classmethod
+    def supports(cls, resource: Resource) -> bool:
+        """Checks whether the tagger can tag :param resource of its service
+
+        Resources which are not supported are tagged via the Resource Groups Tagging API instead.
+        :param resource: resource of the service of the tagger
+        :return: True if the tagger tags the resource
+        """
+        return True
+
     @staticmethod
     def init_session():
         """Creates a boto3 Session which can then used by a subclass to create a boto3 Client
         :raises TaggercoreConfigError
         :return: a boto3 Session
         """
-        credentials = get_config().credentials
-        if credentials:
-            return boto3.Session(**credentials)
-        else:
-            profile = get_config().profile
-            if not profile:
-                raise TaggercoreConfigError(
-                    "No profile and no credentials found. Please set the configuration before using tagging classes"
-                )
-            return boto3.Session(profile_name=profile)
+        return create_session()
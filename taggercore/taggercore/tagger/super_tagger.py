@@ -22,19 +22,38 @@
 # under the License.
 #
 import logging
-from functools import reduce
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
-from taggercore.model import Resource, Tag, TaggingResult
-from taggercore.tagger import GlobalTagger, IamTagger, RegionTagger, ServiceTagger
+from taggercore.cache import TaggingJournal
+from taggercore.concurrency import map_concurrently
+from taggercore.model import (
+    Resource,
+    ResourceWithTagDiffs,
+    Tag,
+    TaggingResult,
+    TaggingResultAccumulator,
+)
+from taggercore.tagger import (
+    AbstractResourceGroupApiTagger,
+    AutoScalingTagger,
+    Ec2Tagger,
+    GlobalTagger,
+    IamTagger,
+    RegionTagger,
+    ServiceTagger,
+)
 
 logger = logging.getLogger(__name__)
 # Provides mapping between resource service and tagger class
-SERVICE_TAGGER = {"iam": IamTagger}
+SERVICE_TAGGER = {
+    "autoscaling": AutoScalingTagger,
+    "ec2": Ec2Tagger,
+    "iam": IamTagger,
+}
 
-GLOBAL_RES_TYPE_NOT_TAGGABLE = ["policy", "instance-profile"]
+# IAM groups cannot be tagged
+GLOBAL_RES_TYPE_NOT_TAGGABLE = ["group"]
 REG_RES_TYPE_NOT_TAGGABLE = [
-    "autoScalingGroup",
     "launchConfiguration",
     "subscription",
     "subnet-group",
@@ -50,9 +69,52 @@ class SuperTagger:
 
     """
 
-    def __init__(self, resources: List[Resource], tags: List[Tag]):
+    def __init__(
+        self,
+        resources: List[Resource],
+        tags: List[Tag],
+        max_workers: int = 1,
+        max_workers_per_tagger: int = 1,
+        skip_compliant: bool = False,
+        only_missing_tags: bool = False,
+        propagate_at_launch: bool = True,
+        journal: Optional[TaggingJournal] = None,
+    ):
+        """
+
+        :param resources: resources to tag
+        :param tags: tags to apply
+        :param max_workers: number of taggers running at the same time, 1 runs them one after another
+        :param max_workers_per_tagger: number of batches a region, global, EC2 or auto scaling tagger sends at the same
+        time
+        :param skip_compliant: resources which already have all :param tags are not passed on to the taggers
+        :param only_missing_tags: taggers only send the tags each resource is missing
+        :param propagate_at_launch: whether tags of auto scaling groups are applied to the instances they launch
+        :param journal: records the result of every completed batch, so an interrupted run can be resumed
+        """
         self._resources = resources
         self._tags = tags
+        self._max_workers = max_workers
+        self._max_workers_per_tagger = max_workers_per_tagger
+        self._only_missing_tags = only_missing_tags
+        # options passed on to the service tagger of a service
+        batch_tagger_options = {
+            "max_workers": max_workers_per_tagger,
+            "only_missing_tags": only_missing_tags,
+        }
+        self._service_tagger_options = {
+            "autoscaling": {
+                **batch_tagger_options,
+                "propagate_at_launch": propagate_at_launch,
+            },
+            "ec2": batch_tagger_options,
+            "iam": {"only_missing_tags": only_missing_tags},
+        }
+        self._skipped_resources = []
+        if skip_compliant:
+            resources, self._skipped_resources = self._split_compliant_resources(
+                resources, tags
+            )
         (
             service_tagger_res,
             regional_res,
@@ -61,6 +123,32 @@ class SuperTagger:
         self._service_taggers = self._init_service_taggers(service_tagger_res)
         self._region_taggers = self._init_region_taggers(regional_res)
         self._global_tagger = self._init_global_tagger(global_res)
+        self._journal = journal
+        if journal:
+            for tagger in (
+                self._service_taggers + self._region_taggers + [self._global_tagger]
+            ):
+                tagger.add_result_listener(journal.record)
+
+    @staticmethod
+    def _split_compliant_resources(
+        resources: List[Resource], tags: List[Tag]
+    ) -> Tuple[List[Resource], List[Resource]]:
+        resources_to_tag = []
+        compliant_resources = []
+        for resource in resources:
+            if ResourceWithTagDiffs(
+                resource, resource.compare_tags(tags)
+            ).properly_tagged:
+                compliant_resources.append(resource)
+            else:
+                resources_to_tag.append(resource)
+        logger.info(
+            "Skipping {} resources which already have all tags".format(
+                len(compliant_resources)
+            )
+        )
+        return resources_to_tag, compliant_resources
 
     @staticmethod
     def _split_resources_for_taggers(
@@ -70,7 +158,8 @@ class SuperTagger:
         regional_res = []
         global_res = []
         for resource in resources:
-            if resource.service in SERVICE_TAGGER.keys():
+            service_tagger = SERVICE_TAGGER.get(resource.service)
+            if service_tagger and service_tagger.supports(resource):
                 service_tagger_res.append(resource)
             elif resource.region:
                 regional_res.append(resource)
@@ -86,7 +175,11 @@ class SuperTagger:
         service_taggers = []
         for service, resources in service_tagger_dict.items():
             service_taggers.append(
-                SERVICE_TAGGER.get(service)(tags=self._tags, resources=resources)
+                SERVICE_TAGGER.get(service)(
+                    tags=self._tags,
+                    resources=resources,
+                    **self._service_tagger_options.get(service, {})
+                )
             )
         return service_taggers
 
@@ -96,11 +189,24 @@ class SuperTagger:
             grouped_by_region.setdefault(resource.region, []).append(resource)
         region_taggers = []
         for region, resources in grouped_by_region.items():
-            region_taggers.append(RegionTagger(self._tags, resources, region))
+            region_taggers.append(
+                RegionTagger(
+                    self._tags,
+                    resources,
+                    region,
+                    self._max_workers_per_tagger,
+                    self._only_missing_tags,
+                )
+            )
         return region_taggers
 
     def _init_global_tagger(self, global_resources: List[Resource]) -> GlobalTagger:
-        return GlobalTagger(self._tags, global_resources)
+        return GlobalTagger(
+            self._tags,
+            global_resources,
+            self._max_workers_per_tagger,
+            self._only_missing_tags,
+        )
 
     @property
     def region_taggers(self):
@@ -114,44 +220,61 @@ class SuperTagger:
     def global_tagger(self):
         return self._global_tagger
 
+    @property
+    def skipped_resources(self):
+        return self._skipped_resources
+
     def tag_regions(self):
-        region_results = []
-        for tagger in self._region_taggers:
-            region_results.append(tagger.tag_all())
-        return self.__reduce_to_single_result(region_results)
+        return self._tag_into(
+            self._region_taggers, TaggingResultAccumulator()
+        ).tagging_result()
 
     def tag_non_regional_resources(self):
-        non_regional_result = []
-        for tagger in self._service_taggers:
-            non_regional_result.append(tagger.tag_resources())
-        global_result = self._global_tagger.tag_all()
-        non_regional_result.append(global_result)
-        return self.__reduce_to_single_result(non_regional_result)
+        return self._tag_into(
+            self._non_regional_taggers(), TaggingResultAccumulator()
+        ).tagging_result()
 
     def tag_all(self):
-        regional_results = self.tag_regions()
-        non_regional_results = self.tag_non_regional_resources()
-        return TaggingResult(
-            non_regional_results.successful_arns + regional_results.successful_arns,
-            {**non_regional_results.failed_arns, **regional_results.failed_arns},
+        return self.tag_all_into(TaggingResultAccumulator()).tagging_result()
+
+    def tag_all_into(
+        self, accumulator: TaggingResultAccumulator
+    ) -> TaggingResultAccumulator:
+        """Tags all resources and adds the results to :param accumulator
+
+        Every tagger adds the result of a batch as soon as it is completed and drops it right away, use an accumulator
+        with a spill path to keep memory flat on large runs.
+
+        :param accumulator: receives the results of all taggers in the order they complete, then the skipped ARNs
+        :return: :param accumulator
+        """
+        skipped_result = TaggingResult(
+            [], {}, [resource.arn for resource in self._skipped_resources]
         )
+        if self._journal and self._skipped_resources:
+            self._journal.record(skipped_result)
+        # all taggers share one pool, so the slowest tagger determines the duration instead of the sum of all
+        self._tag_into(self._non_regional_taggers() + self._region_taggers, accumulator)
+        accumulator.add(skipped_result)
+        return accumulator
 
-    @staticmethod
-    def __reduce_to_single_result(
-        tagging_results: List[List[TaggingResult]],
-    ) -> TaggingResult:
-        if not tagging_results:
-            return TaggingResult([], {})
-        else:
-            flatted_results = [
-                tagging_result
-                for sublist in tagging_results
-                for tagging_result in sublist
-            ]
-            return reduce(
-                lambda t1, t2: TaggingResult(
-                    t1.successful_arns + t2.successful_arns,
-                    {**t1.failed_arns, **t2.failed_arns},
-                ),
-                flatted_results,
+    def _non_regional_taggers(
+        self,
+    ) -> List[Union[ServiceTagger, AbstractResourceGroupApiTagger]]:
+        return self._service_taggers + [self._global_tagger]
+
+    def _tag_into(
+        self,
+        taggers: List[Union[ServiceTagger, AbstractResourceGroupApiTagger]],
+        accumulator: TaggingResultAccumulator,
+    ) -> TaggingResultAccumulator:
+        for tagger in taggers:
+            tagger.add_result_listener(accumulator.add)
+        try:
+            map_concurrently(
+                lambda tagger: tagger.tag_streaming(), taggers, self._max_workers
             )
+        finally:
+            for tagger in taggers:
+                tagger.remove_result_listener(accumulator.add)
+        return accumulator
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from typing import Dict, List, Tuple
+
+from taggercore.model import Resource, Tag, TagDiffType
+
+MISSING_TAG_DIFF_TYPES = [TagDiffType.NEW, TagDiffType.NEW_VALUE]
+
+
+def group_by_missing_tags(
+    resources: List[Resource], tags: List[Tag]
+) -> Tuple[List[Tuple[Dict[str, str], List[str]]], List[str]]:
+    """Groups ARNs of :param resources by the exact set of :param tags they are missing
+
+    Tags which a resource already carries with the desired value are left out, so every group
+    only needs a minimal tag payload.
+
+    :param resources: resources to tag
+    :param tags: tags to apply
+    :return: list of (tags to apply, ARNs) groups in order of first appearance and ARNs of resources missing no tag
+    """
+    groups = {}
+    complete_arns = []
+    for resource in resources:
+        missing_tags = frozenset(
+            (diff.new_tag.key, diff.new_tag.value)
+            for diff in resource.compare_tags(tags)
+            if diff.diff_type in MISSING_TAG_DIFF_TYPES
+        )
+        if missing_tags:
+            groups.setdefault(missing_tags, []).append(resource.arn)
+        else:
+            complete_arns.append(resource.arn)
+    return [(dict(missing_tags), arns) for missing_tags, arns in groups.items()], (
+        complete_arns
+    )
+
+
+def plan_tags(
+    resources: List[Resource], tags: List[Tag], only_missing_tags: bool
+) -> Tuple[List[Tuple[Dict[str, str], List[str]]], List[str]]:
+    """Determines which tags are sent for which ARNs
+
+    :param resources: resources to tag
+    :param tags: tags to apply
+    :param only_missing_tags: whether resources are grouped by the tags they are missing, otherwise all ARNs get all
+    :param tags
+    :return: list of (tags, ARNs) groups and ARNs of resources which need no tagging
+    """
+    if only_missing_tags:
+        return group_by_missing_tags(resources, tags)
+    return [
+        (
+            {tag.key: tag.value for tag in tags},
+            [resource.arn for resource in resources],
+        )
+    ], []
@@ -23,6 +23,9 @@
 #
 from .scan_and_compare import scan_and_compare_resources
 from .scan import scan_region, scan_global, scan_region_and_global
-from .perform_tagging import perform_tagging
+from .scan import scan_regions, scan_all_regions
+from .scan import iter_scan_region, iter_scan_global
+from .scan import invalidate_snapshots
+from .perform_tagging import perform_tagging, resume_tagging
 from .configure_account_and_profile import configure_account_and_profile
 from .fetch_config import fetch_config
@@ -21,17 +21,132 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import List
+import logging
+from typing import List, Optional
 
+from taggercore.cache import TaggingJournal
 from taggercore.model import Resource, Tag, TaggingResult
 from taggercore.tagger import SuperTagger
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
-def perform_tagging(resources: List[Resource], tags: List[Tag]) -> TaggingResult:
+
+def perform_tagging(
+    resources: List[Resource],
+    tags: List[Tag],
+    max_workers: int = 1,
+    max_workers_per_tagger: int = 1,
+    skip_compliant: bool = False,
+    only_missing_tags: bool = False,
+    propagate_at_launch: bool = True,
+    journal: Optional[TaggingJournal] = None,
+) -> TaggingResult:
     """Applies :param tags on :param resources
 
     :param resources: resources to tag
     :param tags: tags to apply on :param resources
+    :param max_workers: number of taggers (per region, per service and global) running at the same time
+    :param max_workers_per_tagger: number of batches of ARNs each tagger sends at the same time
+    :param skip_compliant: do not tag resources which already have all :param tags, they are reported as skipped
+    :param only_missing_tags: only send the tags each resource is missing, resources missing none are reported as skipped
+    :param propagate_at_launch: whether tags of auto scaling groups are applied to the instances they launch
+    :param journal: records the result of every completed batch, see resume_tagging, it is started for this run and
+    cleared once the run is completed
     :return: a single tagging result
     """
-    return SuperTagger(resources, tags).tag_all()
+    if journal:
+        journal.start(tags)
+    tagging_result = _tag(
+        resources,
+        tags,
+        max_workers,
+        max_workers_per_tagger,
+        skip_compliant,
+        only_missing_tags,
+        propagate_at_launch,
+        journal,
+    )
+    if journal:
+        journal.clear()
+    return tagging_result
+
+
+def resume_tagging(
+    resources: List[Resource],
+    tags: List[Tag],
+    journal: TaggingJournal,
+    max_workers: int = 1,
+    max_workers_per_tagger: int = 1,
+    skip_compliant: bool = False,
+    only_missing_tags: bool = False,
+    propagate_at_launch: bool = True,
+) -> TaggingResult:
+    """Continues an interrupted tagging run which applied the same :param tags
+
+    Resources which were tagged or skipped according to :param journal are not tagged again, resources which failed
+    are retried. Without an existing journal all resources are tagged. See perform_tagging for a description of the
+    other parameters.
+
+    :param journal: journal of the interrupted run, results of this run are appended, it is cleared once the run is
+    completed
+    :raises TaggingJournalMismatchError: if :param journal was started with other tags
+    :return: a single tagging result for :param resources, merged from the journal
+    """
+    if journal.exists():
+        journal.verify(tags)
+    else:
+        journal.start(tags)
+    completed_arns = journal.completed_arns()
+    remaining_resources = [
+        resource for resource in resources if resource.arn not in completed_arns
+    ]
+    logger.info(
+        "Resuming tagging, {} of {} resources are already completed".format(
+            len(resources) - len(remaining_resources), len(resources)
+        )
+    )
+    _tag(
+        remaining_resources,
+        tags,
+        max_workers,
+        max_workers_per_tagger,
+        skip_compliant,
+        only_missing_tags,
+        propagate_at_launch,
+        journal,
+    )
+    journaled_result = journal.load()
+    journal.clear()
+    arns = {resource.arn for resource in resources}
+    return TaggingResult(
+        [arn for arn in journaled_result.successful_arns if arn in arns],
+        {
+            arn: error_msg
+            for arn, error_msg in journaled_result.failed_arns.items()
+            if arn in arns
+        },
+        [arn for arn in journaled_result.skipped_arns if arn in arns],
+    )
+
+
+def _tag(
+    resources: List[Resource],
+    tags: List[Tag],
+    max_workers: int,
+    max_workers_per_tagger: int,
+    skip_compliant: bool,
+    only_missing_tags: bool,
+    propagate_at_launch: bool,
+    journal: Optional[TaggingJournal],
+) -> TaggingResult:
+    return SuperTagger(
+        resources,
+        tags,
+        max_workers,
+        max_workers_per_tagger,
+        skip_compliant,
+        only_missing_tags,
+        propagate_at_launch,
+        journal,
+    ).tag_all()
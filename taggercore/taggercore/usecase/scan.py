@@ -21,10 +21,20 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import List, Dict
+from typing import Callable, Dict, Iterator, List, Optional
 
+from taggercore.cache import ScanHistory, SnapshotStore
+from taggercore.cache.snapshot_store import GLOBAL_SCOPE
+from taggercore.concurrency import map_concurrently
+from taggercore.config import get_config
 from taggercore.model import Resource
-from taggercore.scanner import RegionScanner, GlobalScanner
+from taggercore.scanner import (
+    RegionScanner,
+    GlobalScanner,
+    ScanBackend,
+    ScanMetrics,
+    enabled_regions,
+)
 from taggercore.tagger import (
     GLOBAL_RES_TYPE_NOT_TAGGABLE,
     REG_RES_TYPE_NOT_TAGGABLE,
@@ -32,20 +42,211 @@ from taggercore.tagger import (
 )
 
 
-def scan_region(region: str) -> List[Resource]:
+def scan_with_snapshot(
+    region: str,
+    resource_types_to_exclude: List[str],
+    scan: Callable[[], List[Resource]],
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    backend: ScanBackend = ScanBackend.SKEW,
+) -> List[Resource]:
+    """Reuses a snapshot of a previous scan if :param snapshot_store contains a valid one, otherwise calls :param scan
+
+    :param region: AWS region code or 'global'
+    :param resource_types_to_exclude: resource types excluded by :param scan
+    :param scan: function performing the scan
+    :param snapshot_store: store for scan results, None disables snapshots
+    :param force_refresh: scan even if a valid snapshot exists
+    :param backend: backend used by :param scan, only snapshots of the same backend are reused
+    :return: resources found
+    """
+    if snapshot_store is None:
+        return scan()
+    return snapshot_store.load_or_scan(
+        get_config().account_id,
+        region,
+        resource_types_to_exclude,
+        scan,
+        force_refresh,
+        ScanBackend(backend).value,
+    )
+
+
+def invalidate_snapshots(
+    regions: List[str], snapshot_store: Optional[SnapshotStore] = None
+) -> None:
+    """Removes the snapshots of :param regions, e.g. after their resources were tagged
+
+    :param regions: AWS region codes or 'global'
+    :param snapshot_store: store for scan results, None disables snapshots
+    """
+    if snapshot_store is None:
+        return
+    for region in regions:
+        snapshot_store.invalidate(get_config().account_id, region)
+
+
+def scan_region(
+    region: str,
+    max_workers: int = 1,
+    backend: ScanBackend = ScanBackend.SKEW,
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    scan_history: Optional[ScanHistory] = None,
+    metrics: Optional[ScanMetrics] = None,
+) -> List[Resource]:
     """Scans resources in given :param region
 
     :param region: AWS region code (https://docs.aws.amazon.com/general/latest/gr/rande.html for a full list)
+    :param max_workers: number of services which are scanned at the same time
+    :param backend: backend used for finding resources
+    :param snapshot_store: store for scan results, a valid snapshot is returned instead of scanning again
+    :param force_refresh: scan even if :param snapshot_store contains a valid snapshot
+    :param scan_history: history used to skip services which were empty in previous scans
+    :param metrics: collects wall time, resources, API calls and retries per scanned service
     :return: resources found in given :param region
     """
-    return RegionScanner(region).scan(
+    resource_types_to_exclude = REG_RES_TYPE_NOT_TAGGABLE + REG_RES_TYPE_NOT_SUPPORTED
+    return scan_with_snapshot(
+        region,
+        resource_types_to_exclude,
+        lambda: RegionScanner(region, max_workers, backend, scan_history, metrics).scan(
+            resource_types_to_exclude
+        ),
+        snapshot_store,
+        force_refresh,
+        backend,
+    )
+
+
+def iter_scan_region(
+    region: str, max_workers: int = 1, backend: ScanBackend = ScanBackend.SKEW
+) -> Iterator[Resource]:
+    """Yields resources in given :param region as soon as they are found
+
+    See scan_region for a description of the parameters. In contrast to scan_region the resources are not sorted.
+    :return: generator of resources found in given :param region
+    """
+    return RegionScanner(region, max_workers, backend).iter_scan(
         REG_RES_TYPE_NOT_TAGGABLE + REG_RES_TYPE_NOT_SUPPORTED
     )
 
 
-def scan_global() -> List[Resource]:
-    return GlobalScanner().scan(GLOBAL_RES_TYPE_NOT_TAGGABLE)
+def scan_global(
+    backend: ScanBackend = ScanBackend.SKEW,
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    metrics: Optional[ScanMetrics] = None,
+) -> List[Resource]:
+    return scan_with_snapshot(
+        GLOBAL_SCOPE,
+        GLOBAL_RES_TYPE_NOT_TAGGABLE,
+        lambda: GlobalScanner(backend, metrics=metrics).scan(
+            GLOBAL_RES_TYPE_NOT_TAGGABLE
+        ),
+        snapshot_store,
+        force_refresh,
+        backend,
+    )
+
+
+def iter_scan_global(backend: ScanBackend = ScanBackend.SKEW) -> Iterator[Resource]:
+    return GlobalScanner(backend).iter_scan(GLOBAL_RES_TYPE_NOT_TAGGABLE)
+
+
+def scan_region_and_global(
+    region: str,
+    max_workers: int = 1,
+    backend: ScanBackend = ScanBackend.SKEW,
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    scan_history: Optional[ScanHistory] = None,
+    metrics: Optional[ScanMetrics] = None,
+) -> Dict[str, List[Resource]]:
+    return {
+        region: scan_region(
+            region,
+            max_workers,
+            backend,
+            snapshot_store,
+            force_refresh,
+            scan_history,
+            metrics,
+        ),
+        "global": scan_global(backend, snapshot_store, force_refresh, metrics),
+    }
+
 
+def scan_regions(
+    regions: List[str],
+    max_workers: int = 4,
+    max_workers_per_region: int = 1,
+    backend: ScanBackend = ScanBackend.SKEW,
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    scan_history: Optional[ScanHistory] = None,
+    metrics: Optional[ScanMetrics] = None,
+) -> Dict[str, List[Resource]]:
+    """Scans resources in all given :param regions at the same time
 
-def scan_region_and_global(region: str) -> Dict[str, List[Resource]]:
-    return {region: scan_region(region), "global": scan_global()}
+    Resources which are returned by the scans of multiple regions (e.g. S3 buckets) are only kept in the result of
+    the first region in :param regions.
+    :param regions: AWS region codes (https://docs.aws.amazon.com/general/latest/gr/rande.html for a full list)
+    :param max_workers: number of regions which are scanned at the same time
+    :param max_workers_per_region: number of services which are scanned at the same time within one region
+    :param backend: backend used for finding resources
+    :param snapshot_store: store for scan results, valid snapshots are used instead of scanning again
+    :param force_refresh: scan even if :param snapshot_store contains valid snapshots
+    :param scan_history: history used to skip services which were empty in previous scans
+    :param metrics: collects wall time, resources, API calls and retries per scanned service
+    :return: resources found keyed by region
+    """
+    unique_regions = list(dict.fromkeys(regions))
+    resources_by_region = map_concurrently(
+        lambda region: scan_region(
+            region,
+            max_workers_per_region,
+            backend,
+            snapshot_store,
+            force_refresh,
+            scan_history,
+            metrics,
+        ),
+        unique_regions,
+        max_workers,
+    )
+    seen_arns = set()
+    merged_result = {}
+    for region, resources in zip(unique_regions, resources_by_region):
+        merged_result[region] = []
+        for resource in resources:
+            if resource.arn not in seen_arns:
+                seen_arns.add(resource.arn)
+                merged_result[region].append(resource)
+    return merged_result
+
+
+def scan_all_regions(
+    max_workers: int = 4,
+    max_workers_per_region: int = 1,
+    backend: ScanBackend = ScanBackend.SKEW,
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    scan_history: Optional[ScanHistory] = None,
+    metrics: Optional[ScanMetrics] = None,
+) -> Dict[str, List[Resource]]:
+    """Scans resources in all regions enabled for the configured account
+
+    See scan_regions for a description of the parameters
+    :return: resources found keyed by region
+    """
+    return scan_regions(
+        enabled_regions(),
+        max_workers,
+        max_workers_per_region,
+        backend,
+        snapshot_store,
+        force_refresh,
+        scan_history,
+        metrics,
+    )
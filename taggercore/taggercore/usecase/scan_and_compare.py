@@ -21,16 +21,24 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import List
+from typing import List, Optional
 
+from taggercore.cache import SnapshotStore
+from taggercore.cache.snapshot_store import GLOBAL_SCOPE
 from taggercore.tagger import REG_RES_TYPE_NOT_TAGGABLE, REG_RES_TYPE_NOT_SUPPORTED
 from taggercore.tagger import GLOBAL_RES_TYPE_NOT_TAGGABLE
 from taggercore.model import Tag, ResourceWithTagDiffs
-from taggercore.scanner import RegionScanner, GlobalScanner
+from taggercore.scanner import RegionScanner, GlobalScanner, ScanBackend, ScanMetrics
+from taggercore.usecase.scan import scan_with_snapshot
 
 
 def scan_and_compare_resources(
-    region: str, tags: List[Tag]
+    region: str,
+    tags: List[Tag],
+    backend: ScanBackend = ScanBackend.SKEW,
+    snapshot_store: Optional[SnapshotStore] = None,
+    force_refresh: bool = False,
+    metrics: Optional[ScanMetrics] = None,
 ) -> List[ResourceWithTagDiffs]:
     """Compares resources tags to given :param tags and creates a list of diffs
 
@@ -38,12 +46,33 @@ def scan_and_compare_resources(
     Resources which are not taggable or currently not supported in the tagger classes are NOT returned.
     :param region: AWS region code (https://docs.aws.amazon.com/general/latest/gr/rande.html for a full list)
     :param tags: tags to compare the resource tags with
+    :param backend: backend used for finding resources
+    :param snapshot_store: store for scan results, valid snapshots are used instead of scanning again
+    :param force_refresh: scan even if :param snapshot_store contains valid snapshots
+    :param metrics: collects wall time, resources, API calls and retries per scanned service
 
     :return resources with tag comparison result
     """
-    resources = RegionScanner(region).scan(
-        REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
-    ) + GlobalScanner().scan(GLOBAL_RES_TYPE_NOT_TAGGABLE)
+    regional_types_to_exclude = REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+    resources = scan_with_snapshot(
+        region,
+        regional_types_to_exclude,
+        lambda: RegionScanner(region, backend=backend, metrics=metrics).scan(
+            regional_types_to_exclude
+        ),
+        snapshot_store,
+        force_refresh,
+        backend,
+    ) + scan_with_snapshot(
+        GLOBAL_SCOPE,
+        GLOBAL_RES_TYPE_NOT_TAGGABLE,
+        lambda: GlobalScanner(backend, metrics=metrics).scan(
+            GLOBAL_RES_TYPE_NOT_TAGGABLE
+        ),
+        snapshot_store,
+        force_refresh,
+        backend,
+    )
     resources_with_diffs = []
     for resource in resources:
         resources_with_diffs.append(
@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from concurrent.futures import ThreadPoolExecutor
+
+from taggercore.cache import BucketRegionCache
+
+
+class TestBucketRegionCache:
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "bucket_regions.json"
+        cache = BucketRegionCache(path)
+        cache.put("bucket", "eu-central-1")
+        cache.save()
+
+        assert BucketRegionCache(path).get("bucket") == "eu-central-1"
+
+    def test_concurrent_saves_of_separate_caches(self, tmp_path):
+        path = tmp_path / "bucket_regions.json"
+        caches = [BucketRegionCache(path) for _ in range(8)]
+        for index, cache in enumerate(caches):
+            cache.put(f"bucket-{index}", "eu-central-1")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda cache: [cache.save() for _ in range(20)], caches))
+
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_keeps_regions_in_memory_if_path_is_not_writable(self, tmp_path):
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_text("")
+        cache = BucketRegionCache(not_a_directory / "bucket_regions.json")
+        cache.put("bucket", "eu-central-1")
+
+        cache.save()
+
+        assert cache.get("bucket") == "eu-central-1"
+
+    def test_shared_cache_is_one_instance(self):
+        assert BucketRegionCache.shared() is BucketRegionCache.shared()
+
+    def test_invalidate(self, tmp_path):
+        cache = BucketRegionCache(tmp_path / "bucket_regions.json")
+        cache.put("bucket", "eu-central-1")
+
+        cache.invalidate("bucket")
+        cache.invalidate("unknown-bucket")
+
+        assert cache.get("bucket") is None
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore.cache import ScanHistory
+
+ACCOUNT_ID = "111111111111"
+REGION = "eu-central-1"
+
+
+class TestScanHistory:
+    def test_should_scan_unknown_service(self, tmp_path):
+        history = ScanHistory(path=tmp_path / "history.json")
+
+        assert history.should_scan(ACCOUNT_ID, REGION, "sqs")
+
+    def test_should_scan_service_with_resources(self, tmp_path):
+        history = ScanHistory(probe_interval=3, path=tmp_path / "history.json")
+        history.record_scan(ACCOUNT_ID, REGION, "sqs", 2)
+
+        assert history.should_scan(ACCOUNT_ID, REGION, "sqs")
+
+    def test_empty_service_is_probed_every_interval(self, tmp_path):
+        history = ScanHistory(probe_interval=3, path=tmp_path / "history.json")
+        history.record_scan(ACCOUNT_ID, REGION, "sqs", 0)
+
+        decisions = []
+        for _ in range(3):
+            should_scan = history.should_scan(ACCOUNT_ID, REGION, "sqs")
+            decisions.append(should_scan)
+            if should_scan:
+                history.record_scan(ACCOUNT_ID, REGION, "sqs", 0)
+            else:
+                history.record_skip(ACCOUNT_ID, REGION, "sqs")
+
+        assert decisions == [False, False, True]
+        assert history.should_scan(ACCOUNT_ID, "us-east-1", "sqs")
+
+    def test_full_sweep(self, tmp_path):
+        history = ScanHistory(full_sweep=True, path=tmp_path / "history.json")
+        history.record_scan(ACCOUNT_ID, REGION, "sqs", 0)
+
+        assert history.should_scan(ACCOUNT_ID, REGION, "sqs")
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "history.json"
+        history = ScanHistory(path=path)
+        history.record_scan(ACCOUNT_ID, REGION, "sqs", 0)
+        history.save()
+
+        assert not ScanHistory(path=path).should_scan(ACCOUNT_ID, REGION, "sqs")
+
+    def test_load_corrupt_history(self, tmp_path):
+        path = tmp_path / "history.json"
+        path.write_text("{")
+
+        assert ScanHistory(path=path).should_scan(ACCOUNT_ID, REGION, "sqs")
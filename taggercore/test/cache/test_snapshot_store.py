@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+from datetime import timedelta
+
+from taggercore.cache import SnapshotStore
+from taggercore.model import Resource, Tag
+
+EXCLUDED_TYPES = ["stack", "environment"]
+
+
+class TestSnapshotStore:
+    def test_save_and_load(self, tmp_path, regional_resources):
+        bucket = Resource(
+            "arn:aws:s3:eu-central-1:111111111111:bucket/some-bucket",
+            "some-bucket",
+            "bucket",
+            [Tag("Owner", "Fritz")],
+            name="some-bucket",
+        )
+        bucket.arn = "arn:aws:s3:::some-bucket"
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+
+        store.save(
+            "111111111111",
+            "eu-central-1",
+            EXCLUDED_TYPES,
+            regional_resources + [bucket],
+        )
+        actual = store.load(
+            "111111111111", "eu-central-1", list(reversed(EXCLUDED_TYPES))
+        )
+
+        assert actual == regional_resources + [bucket]
+        assert actual[0].current_tags == regional_resources[0].current_tags
+        assert actual[-1].arn == "arn:aws:s3:::some-bucket"
+        assert actual[-1].region == "eu-central-1"
+        assert actual[-1].kwargs == {"name": "some-bucket"}
+
+    def test_load_without_snapshot(self, tmp_path):
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+
+        assert store.load("111111111111", "eu-central-1", EXCLUDED_TYPES) is None
+
+    def test_load_expired_snapshot(self, tmp_path, regional_resources):
+        store = SnapshotStore(timedelta(seconds=-1), tmp_path)
+        store.save("111111111111", "eu-central-1", EXCLUDED_TYPES, regional_resources)
+
+        assert store.load("111111111111", "eu-central-1", EXCLUDED_TYPES) is None
+
+    def test_load_snapshot_with_other_excluded_types(
+        self, tmp_path, regional_resources
+    ):
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+        store.save("111111111111", "eu-central-1", EXCLUDED_TYPES, regional_resources)
+
+        assert store.load("111111111111", "eu-central-1", ["stack"]) is None
+
+    def test_load_corrupt_snapshot(self, tmp_path):
+        tmp_path.joinpath("111111111111_global_skew.json").write_text("{not json")
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+
+        assert store.load("111111111111", "global", []) is None
+
+    def test_load_or_scan(self, mocker, tmp_path, regional_resources):
+        scan = mocker.Mock(return_value=regional_resources)
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+
+        first = store.load_or_scan("111111111111", "eu-central-1", [], scan)
+        second = store.load_or_scan("111111111111", "eu-central-1", [], scan)
+        refreshed = store.load_or_scan(
+            "111111111111", "eu-central-1", [], scan, force_refresh=True
+        )
+
+        assert first == second == refreshed == regional_resources
+        assert scan.call_count == 2
+        snapshot = json.loads(
+            tmp_path.joinpath("111111111111_eu-central-1_skew.json").read_text()
+        )
+        assert snapshot["account_id"] == "111111111111"
+        assert snapshot["region"] == "eu-central-1"
+        assert snapshot["backend"] == "skew"
+        assert "created_at" in snapshot
+
+    def test_load_snapshot_of_other_backend(self, tmp_path, regional_resources):
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+        store.save(
+            "111111111111",
+            "eu-central-1",
+            EXCLUDED_TYPES,
+            regional_resources,
+            backend="tagging_api",
+        )
+
+        assert store.load("111111111111", "eu-central-1", EXCLUDED_TYPES) is None
+        assert (
+            store.load(
+                "111111111111", "eu-central-1", EXCLUDED_TYPES, backend="tagging_api"
+            )
+            == regional_resources
+        )
+
+    def test_invalidate(self, tmp_path, regional_resources):
+        store = SnapshotStore(timedelta(minutes=5), tmp_path)
+        for backend in ["skew", "tagging_api"]:
+            store.save("111111111111", "eu-central-1", [], regional_resources, backend)
+        store.save("111111111111", "global", [], regional_resources)
+
+        store.invalidate("111111111111", "eu-central-1")
+
+        assert store.load("111111111111", "eu-central-1", []) is None
+        assert store.load("111111111111", "eu-central-1", [], "tagging_api") is None
+        assert store.load("111111111111", "global", []) == regional_resources
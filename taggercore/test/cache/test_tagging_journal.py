@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import pytest
+
+from taggercore.cache import TaggingJournal, TaggingJournalMismatchError
+from taggercore.model import Tag, TaggingResult
+
+ARN_1 = "arn:aws:sqs:eu-central-1:111111111111:q1"
+ARN_2 = "arn:aws:sqs:eu-central-1:111111111111:q2"
+ARN_3 = "arn:aws:sqs:eu-central-1:111111111111:q3"
+
+
+class TestTaggingJournal:
+    def test_should_load_recorded_batches(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.record(TaggingResult([ARN_1], {ARN_2: "Error"}))
+        journal.record(TaggingResult([], {}, [ARN_3]))
+
+        actual = TaggingJournal(tmp_path / "journal.ndjson").load()
+
+        assert actual == TaggingResult([ARN_1], {ARN_2: "Error"}, [ARN_3])
+
+    def test_latest_result_of_an_arn_counts(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.record(TaggingResult([], {ARN_1: "Error"}))
+        journal.record(TaggingResult([ARN_1], {}))
+
+        assert journal.load() == TaggingResult([ARN_1], {})
+
+    def test_failed_arns_are_not_completed(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.record(TaggingResult([ARN_1], {ARN_2: "Error"}, [ARN_3]))
+
+        assert journal.completed_arns() == {ARN_1, ARN_3}
+
+    def test_should_ignore_incomplete_line(self, tmp_path):
+        path = tmp_path / "journal.ndjson"
+        journal = TaggingJournal(path)
+        journal.record(TaggingResult([ARN_1], {}))
+        with open(path, "a") as file:
+            file.write('{"successful_arns": ["arn:aws:sq')
+
+        assert journal.completed_arns() == {ARN_1}
+
+    def test_should_start_empty_and_clear(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "nested" / "journal.ndjson")
+
+        assert journal.load() == TaggingResult([], {})
+
+        journal.record(TaggingResult([ARN_1], {}))
+        journal.clear()
+
+        assert journal.completed_arns() == set()
+
+    def test_should_verify_tags_of_the_run(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.start([Tag("Owner", "Fritz"), Tag("Project", "CRM")])
+        journal.record(TaggingResult([ARN_1], {}))
+
+        journal.verify([Tag("Project", "CRM"), Tag("Owner", "Fritz")])
+        with pytest.raises(TaggingJournalMismatchError):
+            journal.verify([Tag("Owner", "Hans"), Tag("Project", "CRM")])
+        assert journal.load() == TaggingResult([ARN_1], {})
+
+    def test_should_reject_journal_without_tags(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.record(TaggingResult([ARN_1], {}))
+
+        with pytest.raises(TaggingJournalMismatchError):
+            journal.verify([Tag("Owner", "Fritz")])
+
+    def test_start_replaces_previous_run(self, tmp_path):
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.start([Tag("Owner", "Fritz")])
+        journal.record(TaggingResult([ARN_1], {}))
+
+        journal.start([Tag("Owner", "Fritz")])
+
+        assert journal.completed_arns() == set()
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import threading
+
+import pytest
+
+from taggercore.concurrency import map_concurrently, stream_concurrently
+
+
+class TestExecutor:
+    def test_map_concurrently_keeps_order(self):
+        actual = map_concurrently(lambda x: x * 2, range(10), max_workers=4)
+
+        assert actual == [x * 2 for x in range(10)]
+
+    def test_map_concurrently_uses_multiple_threads(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_thread(item):
+            barrier.wait()
+            return item
+
+        actual = map_concurrently(wait_for_other_thread, [1, 2], max_workers=2)
+
+        assert actual == [1, 2]
+
+    def test_map_concurrently_without_workers_runs_in_current_thread(self):
+        thread_names = map_concurrently(
+            lambda _: threading.current_thread().name, [1, 2, 3], max_workers=1
+        )
+
+        assert set(thread_names) == {threading.current_thread().name}
+
+    def test_stream_concurrently_yields_all_items(self):
+        functions = [lambda: iter([1, 2, 3]), lambda: iter([4, 5]), lambda: iter([])]
+
+        actual = list(stream_concurrently(functions, max_workers=3))
+
+        assert sorted(actual) == [1, 2, 3, 4, 5]
+        assert [item for item in actual if item < 4] == [1, 2, 3]
+
+    def test_stream_concurrently_yields_before_all_functions_finished(self):
+        release = threading.Event()
+
+        def blocked():
+            release.wait(timeout=5)
+            yield "blocked"
+
+        stream = stream_concurrently([blocked, lambda: iter(["free"])], max_workers=2)
+
+        assert next(stream) == "free"
+        release.set()
+        assert list(stream) == ["blocked"]
+
+    def test_stream_concurrently_reraises_exception(self):
+        def failing():
+            yield 1
+            raise ValueError("scan failed")
+
+        with pytest.raises(ValueError):
+            list(stream_concurrently([failing, lambda: iter([2])], max_workers=2))
+
+    def test_stream_concurrently_without_workers_keeps_order(self):
+        functions = [lambda: iter([1, 2]), lambda: iter([3])]
+
+        assert list(stream_concurrently(functions, max_workers=1)) == [1, 2, 3]
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import boto3
+from botocore.stub import Stubber
+
+from taggercore.config import QuotaGovernor, TokenBucket, quota_governor
+
+
+class TestQuotaGovernor:
+    def test_token_bucket_should_wait_when_tokens_are_used_up(self, mocker):
+        mocker.patch.object(quota_governor.time, "monotonic", return_value=100.0)
+        mocked_sleep = mocker.patch.object(quota_governor.time, "sleep")
+        bucket = TokenBucket(rate=2.0)
+
+        wait_times = [bucket.acquire() for _ in range(4)]
+
+        assert wait_times == [0.0, 0.0, 0.5, 1.0]
+        assert mocked_sleep.call_count == 2
+
+    def test_should_look_up_rates_with_wildcards(self):
+        governor = QuotaGovernor(
+            {
+                ("iam", "*", "*"): 10.0,
+                ("resourcegroupstaggingapi", "*", "TagResources"): 5.0,
+                ("resourcegroupstaggingapi", "eu-central-1", "TagResources"): 2.0,
+            }
+        )
+
+        assert governor.rate("iam", "", "TagRole") == 10.0
+        assert (
+            governor.rate("resourcegroupstaggingapi", "us-east-1", "TagResources")
+            == 5.0
+        )
+        assert (
+            governor.rate("resourcegroupstaggingapi", "eu-central-1", "TagResources")
+            == 2.0
+        )
+        assert governor.rate("ec2", "eu-central-1", "DescribeTags") is None
+
+    def test_should_record_wait_times_per_operation(self, mocker):
+        mocker.patch.object(quota_governor.time, "monotonic", return_value=100.0)
+        mocker.patch.object(quota_governor.time, "sleep")
+        governor = QuotaGovernor({("iam", "*", "*"): 1.0})
+
+        governor.acquire("iam", "", "TagRole")
+        governor.acquire("iam", "", "TagRole")
+        governor.acquire("iam", "", "TagUser")
+        governor.acquire("ec2", "eu-central-1", "DescribeTags")
+
+        assert governor.wait_times == {("iam", "", "TagRole"): 1.0}
+
+    def test_should_govern_client_calls(self, mocker):
+        governor = QuotaGovernor()
+        mocked_acquire = mocker.patch.object(governor, "acquire", return_value=0.0)
+        client = boto3.client(
+            "sqs",
+            region_name="eu-central-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        governor.govern(client)
+
+        with Stubber(client) as stubber:
+            stubber.add_response("list_queues", {"QueueUrls": []})
+            client.list_queues()
+
+        mocked_acquire.assert_called_once_with("sqs", "eu-central-1", "ListQueues")
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from taggercore.config import RetryPolicy
+
+
+def client_error(code: str) -> ClientError:
+    return ClientError(
+        operation_name="tag_resources",
+        error_response={"Error": {"Code": code, "Message": "Error"}},
+    )
+
+
+class TestRetryPolicy:
+    def test_should_classify_errors(self):
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(client_error("ThrottlingException"))
+        assert policy.is_retryable(client_error("InternalError"))
+        assert policy.is_retryable(
+            EndpointConnectionError(endpoint_url="https://tagging.amazonaws.com")
+        )
+        assert not policy.is_retryable(client_error("AccessDeniedException"))
+        assert not policy.is_retryable(ValueError())
+
+    def test_should_retry_until_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        error = client_error("Throttling")
+
+        assert policy.should_retry(error, 1)
+        assert policy.should_retry(error, 2)
+        assert not policy.should_retry(error, 3)
+
+    def test_should_stop_retrying_when_budget_is_used_up(self):
+        policy = RetryPolicy(retry_budget=2)
+        error = client_error("Throttling")
+
+        assert policy.should_retry(error, 1)
+        assert policy.should_retry(error, 1)
+        assert not policy.should_retry(error, 1)
+        assert policy.remaining_budget == 0
+
+    def test_should_not_use_budget_for_errors_which_are_not_retried(self):
+        policy = RetryPolicy(retry_budget=1)
+
+        assert not policy.should_retry(client_error("AccessDeniedException"), 1)
+        assert policy.remaining_budget == 1
+
+    def test_should_back_off_exponentially_with_jitter(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        assert 0.5 <= policy.backoff(1) <= 1.0
+        assert 2.0 <= policy.backoff(3) <= 4.0
+        assert 2.5 <= policy.backoff(10) <= 5.0
+
+    def test_should_configure_client_retries(self):
+        config = RetryPolicy(max_attempts=7).client_config()
+
+        assert config.retries == {"mode": "standard", "total_max_attempts": 7}
+
+    def test_should_disable_client_retries_when_caller_retries(self):
+        config = RetryPolicy(max_attempts=7).caller_retry_client_config()
+
+        assert config.retries == {"mode": "standard", "total_max_attempts": 1}
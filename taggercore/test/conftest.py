@@ -114,6 +114,61 @@ def mock_global_scan(service: str):
         return []
 
 
+@pytest.fixture(scope="module")
+def global_scan_with_region():
+    yield mock_global_scan_with_region
+
+
+def mock_global_scan_with_region(service: str):
+    if "route53" in service:
+        return [
+            ResourceStub(
+                "arn:aws:route53:us-east-1:111111111111:hostedzone/Z1D633PJN98FT9",
+                "Z1D633PJN98FT9",
+                "hostedzone",
+                {"Owner": "Fritz"},
+                "example.com",
+            )
+        ]
+    else:
+        return []
+
+
+@pytest.fixture(scope="module")
+def ec2_scan():
+    yield mock_ec2_scan
+
+
+def mock_ec2_scan(service: str):
+    # tags of EC2 resources are fetched via DescribeTags, accessing them via skew is an error
+    return [
+        ResourceStub(
+            "arn:aws:ec2:eu-central-1:111111111111:instance/i-0bf2a2a9f1ff1fa1c",
+            "i-0bf2a2a9f1ff1fa1c",
+            "instance",
+            None,
+        ),
+        ResourceStub(
+            "arn:aws:ec2:eu-central-1:111111111111:volume/vol-07a8bd2b1b4f0bf3f",
+            "vol-07a8bd2b1b4f0bf3f",
+            "volume",
+            None,
+        ),
+        ResourceStub(
+            "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0",
+            "sg-b501f6d0",
+            "security-group",
+            None,
+        ),
+        ResourceStub(
+            "arn:aws:ec2:eu-central-1:111111111111:key-pair/some-key",
+            "some-key",
+            "key-pair",
+            None,
+        ),
+    ]
+
+
 @pytest.fixture(scope="module")
 def tags() -> List[Tag]:
     yield [
@@ -327,35 +382,16 @@ def too_many_resources_for_single_boto_call(tags) -> List[Resource]:
 def resources_from_two_regions() -> List[Resource]:
     yield [
         Resource(
-            "arn:aws:ec2:eu-central-1:111111111111:subnet/subnet-57ce0008",
-            "subnet-57ce0008",
-            "subnet",
-            [],
-        ),
-        Resource(
-            "arn:aws:ec2:eu-central-1:111111111111:subnet/subnet-57ce0009",
-            "subnet-57ce0009",
-            "subnet",
-            [],
-        ),
-        Resource(
-            "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0",
-            "sg-b501f6d0",
-            "security-group",
-            [],
+            "arn:aws:sqs:eu-central-1:111111111111:queue-a", "queue-a", "queue", []
         ),
         Resource(
-            "arn:aws:ec2:eu-west-1:111111111111:network-acl/acl-abc",
-            "acl-abc",
-            "network-acl",
-            [],
+            "arn:aws:sqs:eu-central-1:111111111111:queue-b", "queue-b", "queue", []
         ),
         Resource(
-            "arn:aws:ec2:eu-west-1:111111111111:security-group/sg-b501f6d1",
-            "sg-b501f6d1",
-            "security-group",
-            [],
+            "arn:aws:sns:eu-central-1:111111111111:topic-a", "topic-a", "topic", []
         ),
+        Resource("arn:aws:sqs:eu-west-1:111111111111:queue-c", "queue-c", "queue", []),
+        Resource("arn:aws:sns:eu-west-1:111111111111:topic-b", "topic-b", "topic", []),
     ]
 
 
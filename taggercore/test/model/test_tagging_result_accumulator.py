@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import json
+
+from taggercore.model import TaggingResult, TaggingResultAccumulator
+
+BATCHES = [
+    TaggingResult(["arn:1", "arn:2"], {"arn:3": "Access denied"}),
+    TaggingResult(["arn:4"], {}, ["arn:5"]),
+    TaggingResult([], {"arn:6": "Throttled"}, ["arn:7"]),
+]
+
+
+class TestTaggingResultAccumulator:
+    def test_should_merge_results_in_order(self):
+        accumulator = TaggingResultAccumulator()
+
+        for batch in BATCHES:
+            accumulator.add(batch)
+
+        assert accumulator.tagging_result() == TaggingResult(
+            ["arn:1", "arn:2", "arn:4"],
+            {"arn:3": "Access denied", "arn:6": "Throttled"},
+            ["arn:5", "arn:7"],
+        )
+
+    def test_should_count_arns(self):
+        accumulator = TaggingResultAccumulator()
+
+        for batch in BATCHES:
+            accumulator.add(batch)
+
+        assert accumulator.successful_count == 3
+        assert accumulator.failed_count == 2
+        assert accumulator.skipped_count == 2
+        assert accumulator.summary() == {"successful": 3, "failed": 2, "skipped": 2}
+
+    def test_should_count_failed_arns_once(self, tmp_path):
+        in_memory = TaggingResultAccumulator()
+        spilled = TaggingResultAccumulator(tmp_path / "tagging_result.ndjson")
+
+        for accumulator in (in_memory, spilled):
+            accumulator.add(TaggingResult([], {"arn:1": "Throttled"}))
+            accumulator.add(TaggingResult([], {"arn:1": "Throttled", "arn:2": "Error"}))
+
+        assert in_memory.failed_count == 2
+        assert spilled.failed_count == 2
+        spilled.close()
+
+    def test_should_be_empty_without_results(self):
+        accumulator = TaggingResultAccumulator()
+
+        assert accumulator.tagging_result() == TaggingResult([], {}, [])
+        assert list(accumulator.records()) == []
+
+    def test_should_spill_arns_to_file(self, tmp_path):
+        spill_path = tmp_path / "results" / "tagging_result.ndjson"
+
+        with TaggingResultAccumulator(spill_path) as accumulator:
+            for batch in BATCHES:
+                accumulator.add(batch)
+
+        lines = [json.loads(line) for line in spill_path.read_text().splitlines()]
+        assert len(lines) == 7
+        assert {"arn": "arn:3", "outcome": "failed", "error": "Access denied"} in lines
+        assert accumulator.summary() == {"successful": 3, "failed": 2, "skipped": 2}
+
+    def test_should_not_keep_spilled_arns_in_memory(self, tmp_path):
+        accumulator = TaggingResultAccumulator(tmp_path / "tagging_result.ndjson")
+
+        for batch in BATCHES:
+            accumulator.add(batch)
+
+        assert accumulator._successful_arns == []
+        assert accumulator._failed_arns == {}
+        assert accumulator._skipped_arns == []
+        accumulator.close()
+
+    def test_should_read_spilled_arns_back(self, tmp_path):
+        in_memory = TaggingResultAccumulator()
+        spilled = TaggingResultAccumulator(tmp_path / "tagging_result.ndjson")
+
+        for batch in BATCHES:
+            in_memory.add(batch)
+            spilled.add(batch)
+
+        assert spilled.tagging_result() == in_memory.tagging_result()
+        assert sorted(spilled.records()) == sorted(in_memory.records())
+        spilled.close()
+        assert spilled.tagging_result() == in_memory.tagging_result()
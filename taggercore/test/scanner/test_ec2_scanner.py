@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import skew
+
+from taggercore import scanner
+from taggercore.model import Resource, Tag
+from taggercore.scanner import Ec2Scanner
+
+
+class TestEc2Scanner:
+    def test_scan(self, mocker, account_and_profile_configured, ec2_scan):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_paginator = mocked_create_client.return_value.get_paginator.return_value
+        mocked_paginator.paginate.return_value = [
+            {
+                "Tags": [
+                    {
+                        "ResourceId": "i-0bf2a2a9f1ff1fa1c",
+                        "ResourceType": "instance",
+                        "Key": "Owner",
+                        "Value": "Fritz",
+                    },
+                    {
+                        "ResourceId": "i-0bf2a2a9f1ff1fa1c",
+                        "ResourceType": "instance",
+                        "Key": "Project",
+                        "Value": "CRM",
+                    },
+                ]
+            },
+            {
+                "Tags": [
+                    {
+                        "ResourceId": "vol-07a8bd2b1b4f0bf3f",
+                        "ResourceType": "volume",
+                        "Key": "Owner",
+                        "Value": "Alice",
+                    }
+                ]
+            },
+        ]
+        skew_scan = mocker.patch.object(scanner.ec2_scanner.skew, "scan")
+        skew.scan.side_effect = ec2_scan
+
+        actual = Ec2Scanner("eu-central-1").scan(["key-pair"])
+
+        skew_scan.assert_called_once_with("arn:aws:ec2:eu-central-1:*:*/*")
+        mocked_create_client.assert_called_once_with("ec2", region_name="eu-central-1")
+        assert actual == [
+            Resource(
+                "arn:aws:ec2:eu-central-1:111111111111:instance/i-0bf2a2a9f1ff1fa1c",
+                "i-0bf2a2a9f1ff1fa1c",
+                "instance",
+                [],
+            ),
+            Resource(
+                "arn:aws:ec2:eu-central-1:111111111111:volume/vol-07a8bd2b1b4f0bf3f",
+                "vol-07a8bd2b1b4f0bf3f",
+                "volume",
+                [],
+            ),
+            Resource(
+                "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0",
+                "sg-b501f6d0",
+                "security-group",
+                [],
+            ),
+        ]
+        assert actual[0].current_tags == [Tag("Owner", "Fritz"), Tag("Project", "CRM")]
+        assert actual[1].current_tags == [Tag("Owner", "Alice")]
+        assert actual[2].current_tags == []
@@ -26,40 +26,80 @@ import skew
 
 from taggercore import scanner
 from taggercore.config import TaggercoreConfigError, set_config, Config
-from taggercore.model import Resource
-from taggercore.scanner import GlobalScanner, GLOBAL_SERVICES
+from taggercore.model import Resource, Tag
+from taggercore.scanner import (
+    CloudFrontScanner,
+    GlobalScanner,
+    GLOBAL_SERVICES,
+    IamScanner,
+    Route53Scanner,
+    ScanBackend,
+    TaggingApiScanner,
+    create_resource,
+)
 from taggercore.tagger import GLOBAL_RES_TYPE_NOT_TAGGABLE
 
 
 class TestGlobalScanner:
     def test_global_scanner_with_config_set(
+        self, mocker, account_and_profile_configured, global_resources
+    ):
+        skew_scan = mocker.patch.object(scanner.global_scanner.skew, "scan")
+        service_scans = {}
+        for service_scanner in (Route53Scanner, CloudFrontScanner, IamScanner):
+            service_scans[service_scanner.service] = mocker.patch.object(
+                service_scanner,
+                "iter_scan",
+                return_value=[
+                    resource
+                    for resource in global_resources
+                    if resource.service == service_scanner.service
+                ],
+            )
+
+        actual = GlobalScanner().scan(GLOBAL_RES_TYPE_NOT_TAGGABLE)
+
+        assert len(actual) == 2
+        assert all(resource in actual for resource in global_resources)
+        skew_scan.assert_not_called()
+        for service in GLOBAL_SERVICES:
+            service_scans[service].assert_called_once_with(GLOBAL_RES_TYPE_NOT_TAGGABLE)
+
+    def test_global_scanner_without_service_scanners(
         self, mocker, account_and_profile_configured, global_scan
     ):
         skew_scan = mocker.patch.object(scanner.global_scanner.skew, "scan")
         skew.scan.side_effect = global_scan
+        mocker.patch.object(
+            scanner.global_scanner.ServiceScannerFactory,
+            "scanner_for_service",
+            return_value=None,
+        )
 
-        actual = GlobalScanner().scan(GLOBAL_RES_TYPE_NOT_TAGGABLE)
+        actual = GlobalScanner(max_workers=1).scan(GLOBAL_RES_TYPE_NOT_TAGGABLE)
 
         assert len(actual) == 3
-        assert (
-            Resource(
-                "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
-                "EMS6KR7IENMDE",
-                "distribution",
-                [],
-            )
-            in actual
-        )
-        assert (
-            Resource(
-                "arn:aws:route53::111111111111:healthcheck/f665452c-bf56-4a43-8b5d-319c3b8d0a70",
-                "f665452c-bf56-4a43-8b5d-319c3b8d0a70",
-                "healthcheck",
-                [],
-            )
-            in actual
-        )
-        assert (
+        assert skew_scan.call_count == len(GLOBAL_SERVICES)
+        for service in GLOBAL_SERVICES:
+            skew_scan.assert_any_call(f"arn:aws:{service}:us-east-1:*:*/*")
+
+    def test_remove_region(self, global_scan_with_region):
+        resource = create_resource(global_scan_with_region("route53")[0])
+
+        actual = GlobalScanner.remove_region(resource)
+
+        assert actual.arn == "arn:aws:route53::111111111111:hostedzone/Z1D633PJN98FT9"
+        assert actual.region == ""
+        assert actual.current_tags == [Tag("Owner", "Fritz")]
+        assert actual.kwargs == {"name": "example.com"}
+
+    def test_global_scanner_with_tagging_api_backend(
+        self, mocker, account_and_profile_configured, global_scan
+    ):
+        skew_scan = mocker.patch.object(scanner.global_scanner.skew, "scan")
+        skew.scan.side_effect = global_scan
+        iam_scan = mocker.patch.object(IamScanner, "iter_scan")
+        iam_scan.return_value = [
             Resource(
                 "arn:aws:iam::111111111111:role/some-role",
                 "some-role",
@@ -67,9 +107,25 @@ class TestGlobalScanner:
                 [],
                 name="some-role",
             )
-            in actual
+        ]
+        tagging_api_scan = mocker.patch.object(TaggingApiScanner, "iter_scan")
+        tagging_api_scan.return_value = [
+            Resource(
+                "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
+                "EMS6KR7IENMDE",
+                "distribution",
+                [],
+            )
+        ]
+
+        actual = GlobalScanner(ScanBackend.TAGGING_API).scan(
+            GLOBAL_RES_TYPE_NOT_TAGGABLE
         )
-        assert skew_scan.call_count == len(GLOBAL_SERVICES)
+
+        # route53 and cloudfront are covered by the Tagging API
+        assert len(actual) == 2
+        skew_scan.assert_not_called()
+        iam_scan.assert_called_once_with(GLOBAL_RES_TYPE_NOT_TAGGABLE)
 
     def test_global_scanner_without_config_set(self):
         set_config(Config())
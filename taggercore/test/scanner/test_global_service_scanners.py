@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore import scanner
+from taggercore.model import Resource, Tag
+from taggercore.scanner import CloudFrontScanner, Route53Scanner
+
+
+class TestRoute53Scanner:
+    def test_scan(self, mocker, account_and_profile_configured):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_client = mocked_create_client.return_value
+        hosted_zones = [
+            {"Id": f"/hostedzone/Z{index}", "Name": f"zone{index}.example.com."}
+            for index in range(12)
+        ]
+        mocked_client.get_paginator.return_value.paginate.side_effect = [
+            [{"HostedZones": hosted_zones[:6]}, {"HostedZones": hosted_zones[6:]}],
+            [{"HealthChecks": [{"Id": "f665452c"}]}],
+        ]
+        mocked_client.list_tags_for_resources.side_effect = (
+            lambda ResourceType, ResourceIds: {
+                "ResourceTagSets": [
+                    {
+                        "ResourceType": ResourceType,
+                        "ResourceId": resource_id,
+                        "Tags": [{"Key": "Owner", "Value": "Fritz"}],
+                    }
+                    for resource_id in ResourceIds
+                ]
+            }
+        )
+
+        actual = Route53Scanner("us-east-1").scan([])
+
+        assert len(actual) == 13
+        assert actual[0] == Resource(
+            "arn:aws:route53:::hostedzone/Z0", "Z0", "hostedzone", []
+        )
+        assert actual[0].current_tags == [Tag("Owner", "Fritz")]
+        assert actual[0].kwargs == {"name": "zone0.example.com."}
+        assert actual[-1] == Resource(
+            "arn:aws:route53:::healthcheck/f665452c", "f665452c", "healthcheck", []
+        )
+        assert mocked_client.list_tags_for_resources.call_count == 3
+        mocked_client.list_tags_for_resources.assert_any_call(
+            ResourceType="hostedzone", ResourceIds=["Z10", "Z11"]
+        )
+
+
+class TestCloudFrontScanner:
+    def test_scan(self, mocker, account_and_profile_configured):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_client = mocked_create_client.return_value
+        mocked_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "DistributionList": {
+                    "Items": [
+                        {
+                            "ARN": "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
+                            "Id": "EMS6KR7IENMDE",
+                            "DomainName": "d111111abcdef8.cloudfront.net",
+                        },
+                        {
+                            "ARN": "arn:aws:cloudfront::111111111111:distribution/E2QWRUHAPOMQZL",
+                            "Id": "E2QWRUHAPOMQZL",
+                            "DomainName": "d222222abcdef8.cloudfront.net",
+                        },
+                    ]
+                }
+            }
+        ]
+        mocked_client.list_tags_for_resource.side_effect = lambda Resource: {
+            "Tags": (
+                {"Items": [{"Key": "Owner", "Value": "Fritz"}]}
+                if Resource.endswith("EMS6KR7IENMDE")
+                else {}
+            )
+        }
+
+        actual = CloudFrontScanner("us-east-1", max_workers=2).scan([])
+
+        assert actual == [
+            Resource(
+                "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
+                "EMS6KR7IENMDE",
+                "distribution",
+                [],
+            ),
+            Resource(
+                "arn:aws:cloudfront::111111111111:distribution/E2QWRUHAPOMQZL",
+                "E2QWRUHAPOMQZL",
+                "distribution",
+                [],
+            ),
+        ]
+        assert actual[0].current_tags == [Tag("Owner", "Fritz")]
+        assert actual[1].current_tags == []
+        assert actual[0].kwargs == {"name": "d111111abcdef8.cloudfront.net"}
+
+    def test_scan_without_distributions(self, mocker, account_and_profile_configured):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_client = mocked_create_client.return_value
+        mocked_client.get_paginator.return_value.paginate.return_value = [
+            {"DistributionList": {"Quantity": 0}}
+        ]
+
+        assert CloudFrontScanner("us-east-1").scan([]) == []
+        mocked_client.list_tags_for_resource.assert_not_called()
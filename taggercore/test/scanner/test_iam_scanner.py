@@ -0,0 +1,160 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore import scanner
+from taggercore.model import Resource, Tag
+from taggercore.scanner import IamScanner, ScanMetrics, ServiceScannerFactory
+
+AUTHORIZATION_DETAILS = {
+    "UserDetailList": [
+        {
+            "UserName": "some-user",
+            "Arn": "arn:aws:iam::111111111111:user/some-user",
+            "Tags": [{"Key": "Owner", "Value": "Fritz"}],
+        }
+    ],
+    "RoleDetailList": [
+        {
+            "RoleName": "some-role",
+            "Arn": "arn:aws:iam::111111111111:role/service-role/some-role",
+            "InstanceProfileList": [
+                {
+                    "InstanceProfileName": "some-profile",
+                    "Arn": "arn:aws:iam::111111111111:instance-profile/some-profile",
+                }
+            ],
+        }
+    ],
+    "Policies": [
+        {
+            "PolicyName": "some-policy",
+            "Arn": "arn:aws:iam::111111111111:policy/some-policy",
+        }
+    ],
+}
+INSTANCE_PROFILES = {
+    "InstanceProfiles": [
+        {
+            "InstanceProfileName": "some-profile",
+            "Arn": "arn:aws:iam::111111111111:instance-profile/some-profile",
+        },
+        {
+            "InstanceProfileName": "unattached-profile",
+            "Arn": "arn:aws:iam::111111111111:instance-profile/unattached-profile",
+        },
+    ]
+}
+
+
+def mock_iam_client(mocker):
+    mocked_create_client = mocker.patch.object(scanner.service_scanner, "create_client")
+    mocked_client = mocked_create_client.return_value
+    paginators = {
+        "get_account_authorization_details": mocker.MagicMock(),
+        "list_instance_profiles": mocker.MagicMock(),
+    }
+    paginators["get_account_authorization_details"].paginate.return_value = [
+        AUTHORIZATION_DETAILS
+    ]
+    paginators["list_instance_profiles"].paginate.return_value = [INSTANCE_PROFILES]
+    mocked_client.get_paginator.side_effect = paginators.get
+    mocked_client.list_policy_tags.return_value = {
+        "Tags": [{"Key": "Project", "Value": "CRM"}]
+    }
+    mocked_client.list_instance_profile_tags.return_value = {"Tags": []}
+    return mocked_client, paginators["get_account_authorization_details"]
+
+
+class TestIamScanner:
+    def test_scan(self, mocker, account_and_profile_configured):
+        mocked_client, mocked_paginator = mock_iam_client(mocker)
+
+        actual = IamScanner("us-east-1").scan([])
+
+        mocked_paginator.paginate.assert_called_once_with(
+            Filter=["User", "Role", "LocalManagedPolicy"]
+        )
+        assert actual == [
+            Resource(
+                "arn:aws:iam::111111111111:user/some-user",
+                "some-user",
+                "user",
+                [],
+            ),
+            Resource(
+                "arn:aws:iam::111111111111:role/service-role/some-role",
+                "some-role",
+                "role",
+                [],
+            ),
+            Resource(
+                "arn:aws:iam::111111111111:instance-profile/some-profile",
+                "some-profile",
+                "instance-profile",
+                [],
+            ),
+            Resource(
+                "arn:aws:iam::111111111111:policy/some-policy",
+                "some-policy",
+                "policy",
+                [],
+            ),
+            Resource(
+                "arn:aws:iam::111111111111:instance-profile/unattached-profile",
+                "unattached-profile",
+                "instance-profile",
+                [],
+            ),
+        ]
+        assert actual[0].current_tags == [Tag("Owner", "Fritz")]
+        assert actual[3].current_tags == [Tag("Project", "CRM")]
+        mocked_client.list_policy_tags.assert_called_once_with(
+            PolicyArn="arn:aws:iam::111111111111:policy/some-policy"
+        )
+        mocked_client.list_instance_profile_tags.assert_called_once_with(
+            InstanceProfileName="unattached-profile"
+        )
+        assert actual[0].kwargs == {"name": "some-user"}
+        assert actual[1].kwargs == {"name": "some-role"}
+
+    def test_scan_with_excluded_types(self, mocker, account_and_profile_configured):
+        mocked_client, mocked_paginator = mock_iam_client(mocker)
+
+        actual = IamScanner("us-east-1").scan(["policy", "instance-profile"])
+
+        mocked_paginator.paginate.assert_called_once_with(Filter=["User", "Role"])
+        assert [resource.resource_type for resource in actual] == ["user", "role"]
+        mocked_client.list_instance_profile_tags.assert_not_called()
+
+    def test_scan_with_metrics(self, mocker, account_and_profile_configured):
+        mock_iam_client(mocker)
+        metrics = ScanMetrics()
+
+        IamScanner("us-east-1", metrics).scan(["policy", "instance-profile"])
+
+        assert metrics.services[0].service_uri == "arn:aws:iam:us-east-1:*:*/*"
+        assert metrics.services[0].resources == 2
+
+    def test_factory(self):
+        assert ServiceScannerFactory.scanner_for_service("iam") == IamScanner
+        assert ServiceScannerFactory.scanner_for_service("sqs") is None
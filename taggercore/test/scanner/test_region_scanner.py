@@ -25,12 +25,29 @@ import pytest
 import skew
 
 from taggercore import scanner
+from taggercore.cache import ScanHistory
 from taggercore.config import TaggercoreConfigError, set_config, Config
 from taggercore.model import Resource
-from taggercore.scanner import RegionScanner, GLOBAL_SERVICES
+from taggercore.scanner import (
+    RegionScanner,
+    GLOBAL_SERVICES,
+    Ec2Scanner,
+    S3Scanner,
+    ScanBackend,
+    ScanMetrics,
+    TaggingApiScanner,
+)
 from taggercore.tagger import REG_RES_TYPE_NOT_TAGGABLE, REG_RES_TYPE_NOT_SUPPORTED
 
 
+@pytest.fixture(autouse=True)
+def service_scanners_mocked(mocker):
+    mocker.patch.object(Ec2Scanner, "_tags_by_resource_id", return_value={})
+    mocker.patch.object(
+        S3Scanner, "_iter_resources", side_effect=lambda excluded_types: iter([])
+    )
+
+
 class TestRegionScanner:
     def test_scan(self, mocker, account_and_profile_configured, region_scan):
         skew.set_config({"accounts": {"111111111111": {"profile": "profile-1"}}})
@@ -49,7 +66,155 @@ class TestRegionScanner:
         assert actual[0] == Resource(
             "arn:aws:sqs:eu-central-1:111111111111:someq", "someq", "queue", []
         )
-        assert skew_scan.call_count == number_of_supported_services
+        # s3 is scanned via S3Scanner instead of skew
+        assert skew_scan.call_count == number_of_supported_services - 1
+
+    def test_scan_with_multiple_workers(
+        self, mocker, account_and_profile_configured, region_scan
+    ):
+        number_of_supported_services = len(skew.ARN().service.choices()) - len(
+            GLOBAL_SERVICES
+        )
+        skew_scan = mocker.patch.object(scanner.region_scanner.skew, "scan")
+        skew.scan.side_effect = region_scan
+
+        actual = RegionScanner("eu-central-1", max_workers=4).scan(
+            REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+        )
+
+        assert actual == [
+            Resource(
+                "arn:aws:sqs:eu-central-1:111111111111:someq", "someq", "queue", []
+            )
+        ]
+        # s3 is scanned via S3Scanner instead of skew
+        assert skew_scan.call_count == number_of_supported_services - 1
+
+    def test_scan_with_tagging_api_backend(
+        self, mocker, account_and_profile_configured, region_scan
+    ):
+        services_not_covered = [
+            service
+            for service in skew.ARN().service.choices()
+            if service not in GLOBAL_SERVICES
+            and not TaggingApiScanner.supports(service)
+        ]
+        skew_scan = mocker.patch.object(scanner.region_scanner.skew, "scan")
+        skew.scan.side_effect = region_scan
+        tagging_api_scan = mocker.patch.object(TaggingApiScanner, "iter_scan")
+        tagging_api_scan.return_value = [
+            Resource(
+                "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0",
+                "sg-b501f6d0",
+                "security-group",
+                [],
+            )
+        ]
+
+        actual = RegionScanner("eu-central-1", backend=ScanBackend.TAGGING_API).scan(
+            REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+        )
+
+        assert len(actual) == 1
+        assert actual[0].service == "ec2"
+        assert skew_scan.call_count == len(services_not_covered)
+
+    def test_scan_with_scan_history(
+        self, mocker, tmp_path, account_and_profile_configured, region_scan
+    ):
+        services = [
+            service
+            for service in skew.ARN().service.choices()
+            if service not in GLOBAL_SERVICES
+        ]
+        skew_scan = mocker.patch.object(scanner.region_scanner.skew, "scan")
+        skew.scan.side_effect = region_scan
+        history = ScanHistory(probe_interval=2, path=tmp_path / "history.json")
+
+        first_scanner = RegionScanner("eu-central-1", scan_history=history)
+        first_scanner.scan(REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE)
+        second_scanner = RegionScanner("eu-central-1", scan_history=history)
+        second = second_scanner.scan(
+            REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+        )
+        third_scanner = RegionScanner("eu-central-1", scan_history=history)
+        third_scanner.scan(REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE)
+
+        assert first_scanner.skipped_services == []
+        assert second == [
+            Resource(
+                "arn:aws:sqs:eu-central-1:111111111111:someq", "someq", "queue", []
+            )
+        ]
+        assert second_scanner.skipped_services == [
+            service for service in services if service != "apigateway"
+        ]
+        assert third_scanner.skipped_services == []
+        assert skew_scan.call_count == 2 * (len(services) - 1) + 1
+        assert (tmp_path / "history.json").is_file()
+
+    def test_scan_skips_unavailable_services(
+        self, mocker, account_and_profile_configured, region_scan
+    ):
+        number_of_supported_services = len(skew.ARN().service.choices()) - len(
+            GLOBAL_SERVICES
+        )
+        skew_scan = mocker.patch.object(scanner.region_scanner.skew, "scan")
+        skew.scan.side_effect = region_scan
+        mocker.patch.object(
+            scanner.region_scanner,
+            "is_service_available",
+            side_effect=lambda service, region: service != "apigateway",
+        )
+        region_scanner = RegionScanner("eu-central-1")
+
+        actual = region_scanner.scan(
+            REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+        )
+
+        assert actual == []
+        assert region_scanner.skipped_services == ["apigateway"]
+        assert skew_scan.call_count == number_of_supported_services - 2
+
+    def test_scan_with_metrics(
+        self, mocker, account_and_profile_configured, region_scan
+    ):
+        number_of_supported_services = len(skew.ARN().service.choices()) - len(
+            GLOBAL_SERVICES
+        )
+        mocker.patch.object(scanner.region_scanner.skew, "scan")
+        skew.scan.side_effect = region_scan
+        metrics = ScanMetrics()
+
+        RegionScanner("eu-central-1", max_workers=2, metrics=metrics).scan(
+            REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+        )
+
+        assert len(metrics.services) == number_of_supported_services
+        apigateway_metrics = next(
+            service
+            for service in metrics.services
+            if service.service_uri == "arn:aws:apigateway:eu-central-1:*:*/*"
+        )
+        assert apigateway_metrics.resources == 1
+
+    def test_iter_scan(self, mocker, account_and_profile_configured, region_scan):
+        mocker.patch.object(scanner.region_scanner.skew, "scan")
+        skew.scan.side_effect = region_scan
+
+        actual = RegionScanner("eu-central-1", max_workers=2).iter_scan(
+            REG_RES_TYPE_NOT_SUPPORTED + REG_RES_TYPE_NOT_TAGGABLE
+        )
+
+        assert next(actual) == Resource(
+            "arn:aws:sqs:eu-central-1:111111111111:someq", "someq", "queue", []
+        )
+        assert list(actual) == []
+
+    def test_iter_scan_without_config_set(self):
+        set_config(Config())
+        with pytest.raises(TaggercoreConfigError):
+            RegionScanner("eu-central-1").iter_scan(REG_RES_TYPE_NOT_SUPPORTED)
 
     def test_scan_without_config_set(self):
         skew.set_config({})
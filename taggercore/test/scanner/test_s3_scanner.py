@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from botocore.exceptions import ClientError
+
+from taggercore import scanner
+from taggercore.cache import BucketRegionCache
+from taggercore.model import Resource, Tag
+from taggercore.scanner import S3Scanner
+
+
+def get_bucket_location(Bucket):
+    return {
+        "bucket-in-frankfurt": {"LocationConstraint": "eu-central-1"},
+        "bucket-in-ireland": {"LocationConstraint": "EU"},
+    }[Bucket]
+
+
+def get_bucket_tagging(Bucket):
+    if Bucket == "bucket-without-tags":
+        raise ClientError(
+            {"Error": {"Code": "NoSuchTagSet", "Message": "The TagSet does not exist"}},
+            "GetBucketTagging",
+        )
+    return {"TagSet": [{"Key": "Owner", "Value": "Fritz"}]}
+
+
+class TestS3Scanner:
+    def test_scan(self, mocker, tmp_path, account_and_profile_configured):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_client = mocked_create_client.return_value
+        mocked_client.list_buckets.return_value = {
+            "Buckets": [
+                {"Name": "bucket-in-frankfurt"},
+                {"Name": "bucket-in-ireland"},
+                {"Name": "cached-bucket"},
+                {"Name": "bucket-without-tags", "BucketRegion": "eu-central-1"},
+            ]
+        }
+        mocked_client.get_bucket_location.side_effect = get_bucket_location
+        mocked_client.get_bucket_tagging.side_effect = get_bucket_tagging
+        bucket_region_cache = BucketRegionCache(tmp_path / "bucket_regions.json")
+        bucket_region_cache.put("cached-bucket", "eu-central-1")
+
+        actual = S3Scanner(
+            "eu-central-1", max_workers=4, bucket_region_cache=bucket_region_cache
+        ).scan([])
+
+        assert actual == [
+            Resource(
+                "arn:aws:s3:::bucket-in-frankfurt", "bucket-in-frankfurt", "bucket", []
+            ),
+            Resource("arn:aws:s3:::cached-bucket", "cached-bucket", "bucket", []),
+            Resource(
+                "arn:aws:s3:::bucket-without-tags", "bucket-without-tags", "bucket", []
+            ),
+        ]
+        assert actual[0].current_tags == [Tag("Owner", "Fritz")]
+        assert actual[0].region == "eu-central-1"
+        assert actual[0].kwargs == {"name": "bucket-in-frankfurt"}
+        assert actual[2].current_tags == []
+        assert mocked_client.get_bucket_location.call_count == 2
+        persisted_cache = BucketRegionCache(tmp_path / "bucket_regions.json")
+        assert persisted_cache.get("bucket-in-ireland") == "eu-west-1"
+        assert persisted_cache.get("bucket-without-tags") == "eu-central-1"
+
+    def test_scan_with_excluded_buckets(self, mocker, tmp_path):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+
+        actual = S3Scanner(
+            "eu-central-1",
+            bucket_region_cache=BucketRegionCache(tmp_path / "bucket_regions.json"),
+        ).scan(["bucket"])
+
+        assert actual == []
+        mocked_create_client.assert_not_called()
+
+    def test_scan_looks_up_stale_bucket_regions_again(self, mocker, tmp_path):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_client = mocked_create_client.return_value
+        mocked_client.list_buckets.return_value = {
+            "Buckets": [{"Name": "recreated-bucket"}, {"Name": "deleted-bucket"}]
+        }
+
+        def get_bucket_location(Bucket):
+            if Bucket == "deleted-bucket":
+                raise ClientError(
+                    {"Error": {"Code": "NoSuchBucket", "Message": "Not found"}},
+                    "GetBucketLocation",
+                )
+            return {"LocationConstraint": "eu-west-2"}
+
+        def get_bucket_tagging(Bucket):
+            error_code = {
+                "recreated-bucket": "PermanentRedirect",
+                "deleted-bucket": "NoSuchBucket",
+            }[Bucket]
+            raise ClientError(
+                {"Error": {"Code": error_code, "Message": "Wrong region"}},
+                "GetBucketTagging",
+            )
+
+        mocked_client.get_bucket_location.side_effect = get_bucket_location
+        mocked_client.get_bucket_tagging.side_effect = get_bucket_tagging
+        bucket_region_cache = BucketRegionCache(tmp_path / "bucket_regions.json")
+        bucket_region_cache.put("recreated-bucket", "eu-central-1")
+        bucket_region_cache.put("deleted-bucket", "eu-central-1")
+
+        actual = S3Scanner(
+            "eu-central-1", bucket_region_cache=bucket_region_cache
+        ).scan([])
+
+        assert actual == []
+        persisted_cache = BucketRegionCache(tmp_path / "bucket_regions.json")
+        assert persisted_cache.get("recreated-bucket") == "eu-west-2"
+        assert persisted_cache.get("deleted-bucket") is None
+
+    def test_scan_fetches_tags_again_if_stale_region_is_confirmed(
+        self, mocker, tmp_path
+    ):
+        mocked_create_client = mocker.patch.object(
+            scanner.service_scanner, "create_client"
+        )
+        mocked_client = mocked_create_client.return_value
+        mocked_client.list_buckets.return_value = {"Buckets": [{"Name": "bucket"}]}
+        mocked_client.get_bucket_location.return_value = {
+            "LocationConstraint": "eu-central-1"
+        }
+        mocked_client.get_bucket_tagging.side_effect = [
+            ClientError(
+                {"Error": {"Code": "AuthorizationHeaderMalformed", "Message": ""}},
+                "GetBucketTagging",
+            ),
+            {"TagSet": [{"Key": "Owner", "Value": "Fritz"}]},
+        ]
+        bucket_region_cache = BucketRegionCache(tmp_path / "bucket_regions.json")
+        bucket_region_cache.put("bucket", "eu-central-1")
+
+        actual = S3Scanner(
+            "eu-central-1", bucket_region_cache=bucket_region_cache
+        ).scan([])
+
+        assert actual == [Resource("arn:aws:s3:::bucket", "bucket", "bucket", [])]
+        assert actual[0].current_tags == [Tag("Owner", "Fritz")]
+        assert mocked_client.get_bucket_tagging.call_count == 2
@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import boto3
+from botocore.stub import Stubber
+
+from taggercore.scanner import ScanMetrics
+
+
+class TestScanMetrics:
+    def test_measure(self):
+        metrics = ScanMetrics()
+
+        actual = list(metrics.measure("arn:aws:sqs:eu-central-1:*:*/*", ["a", "b"]))
+        list(metrics.measure("arn:aws:sns:eu-central-1:*:*/*", []))
+
+        assert actual == ["a", "b"]
+        assert len(metrics.services) == 2
+        sqs_metrics = next(
+            service for service in metrics.services if "sqs" in service.service_uri
+        )
+        assert sqs_metrics.resources == 2
+        assert sqs_metrics.wall_time >= 0
+        assert sqs_metrics.api_calls == 0
+
+    def test_instrument(self):
+        metrics = ScanMetrics()
+        client = boto3.client(
+            "sqs",
+            region_name="eu-central-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        metrics.instrument(client, "arn:aws:sqs:eu-central-1:*:*/*")
+
+        with Stubber(client) as stubber:
+            stubber.add_response("list_queues", {"QueueUrls": []})
+            stubber.add_response(
+                "list_queues",
+                {"QueueUrls": [], "ResponseMetadata": {"RetryAttempts": 2}},
+            )
+            client.list_queues()
+            client.list_queues()
+
+        assert metrics.services[0].api_calls == 2
+        assert metrics.services[0].retries == 2
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore import scanner
+from taggercore.scanner import enabled_regions, is_service_available
+
+
+class TestScannerUtil:
+    def test_enabled_regions(self, mocker, account_and_profile_configured):
+        mocked_create_client = mocker.patch.object(scanner.util, "create_client")
+        mocked_client = mocked_create_client.return_value
+        mocked_client.describe_regions.return_value = {
+            "Regions": [
+                {"RegionName": "eu-west-1", "OptInStatus": "opt-in-not-required"},
+                {"RegionName": "eu-central-1", "OptInStatus": "opt-in-not-required"},
+            ]
+        }
+
+        actual = enabled_regions()
+
+        assert actual == ["eu-central-1", "eu-west-1"]
+        mocked_client.describe_regions.assert_called_once_with(AllRegions=False)
+
+    def test_is_service_available(self):
+        assert is_service_available("sqs", "eu-central-1")
+
+    def test_service_is_unavailable_in_known_region_without_endpoint(self, mocker):
+        mocker.patch.object(
+            scanner.util,
+            "_known_regions",
+            return_value=frozenset(["eu-central-1", "mx-central-1"]),
+        )
+        mocker.patch.object(
+            scanner.util, "_available_regions", return_value=frozenset(["eu-central-1"])
+        )
+
+        assert not is_service_available("elasticbeanstalk", "mx-central-1")
+
+    def test_service_is_available_in_unknown_region(self):
+        assert is_service_available("sqs", "xx-new-1")
+
+    def test_unknown_service_is_available(self):
+        assert is_service_available("unknown-service", "eu-central-1")
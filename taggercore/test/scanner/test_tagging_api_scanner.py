@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore import scanner
+from taggercore.model import Resource, Tag
+from taggercore.scanner import TaggingApiScanner
+
+
+class TestTaggingApiScanner:
+    def test_scan(self, mocker, account_and_profile_configured):
+        mocked_create_client = mocker.patch.object(
+            scanner.tagging_api_scanner, "create_client"
+        )
+        mocked_paginator = mocked_create_client.return_value.get_paginator.return_value
+        mocked_paginator.paginate.return_value = [
+            {
+                "ResourceTagMappingList": [
+                    {
+                        "ResourceARN": "arn:aws:sqs:eu-central-1:111111111111:someq",
+                        "Tags": [{"Key": "Project", "Value": "CRM"}],
+                    },
+                    {
+                        "ResourceARN": "arn:aws:cloudformation:eu-central-1:111111111111:stack/some-stack/b35ac3c0",
+                        "Tags": [],
+                    },
+                ]
+            },
+            {
+                "ResourceTagMappingList": [
+                    {"ResourceARN": "arn:aws:s3:::some-bucket", "Tags": []},
+                ]
+            },
+        ]
+
+        actual = TaggingApiScanner("eu-central-1").scan(
+            ["sqs", "s3", "elb", "autoscaling"], ["stack"]
+        )
+
+        mocked_paginator.paginate.assert_called_once_with(
+            ResourceTypeFilters=["elasticloadbalancing", "s3", "sqs"]
+        )
+        assert actual == [
+            Resource(
+                "arn:aws:sqs:eu-central-1:111111111111:someq",
+                "someq",
+                "queue",
+                [Tag("Project", "CRM")],
+            ),
+            Resource("arn:aws:s3:::some-bucket", "some-bucket", "bucket", []),
+        ]
+        assert actual[0].current_tags == [Tag("Project", "CRM")]
+        assert actual[1].region == "eu-central-1"
+
+    def test_scan_without_supported_services(self, mocker):
+        mocked_create_client = mocker.patch.object(
+            scanner.tagging_api_scanner, "create_client"
+        )
+
+        actual = TaggingApiScanner("eu-central-1").scan(["autoscaling"], [])
+
+        assert actual == []
+        mocked_create_client.assert_not_called()
+
+    def test_split_arn(self):
+        assert TaggingApiScanner.split_arn(
+            "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0"
+        ) == ("security-group", "sg-b501f6d0")
+        assert TaggingApiScanner.split_arn(
+            "arn:aws:lambda:eu-central-1:111111111111:function:some-function"
+        ) == ("function", "some-function")
+        assert TaggingApiScanner.split_arn(
+            "arn:aws:apigateway:eu-central-1::/restapis/e5zcg2s231"
+        ) == ("restapi", "e5zcg2s231")
+        assert TaggingApiScanner.split_arn(
+            "arn:aws:logs:eu-central-1:111111111111:log-group:/aws/lambda/some-function"
+        ) == ("log-group", "/aws/lambda/some-function")
+        assert TaggingApiScanner.split_arn(
+            "arn:aws:elasticloadbalancing:eu-central-1:111111111111:loadbalancer/app/some-lb/50dc6c495c0c9188"
+        ) == ("loadbalancer", "app/some-lb/50dc6c495c0c9188")
+        assert TaggingApiScanner.split_arn(
+            "arn:aws:sns:eu-central-1:111111111111:some-topic"
+        ) == ("topic", "some-topic")
@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from botocore.exceptions import ClientError
+
+from taggercore.model import Resource, Tag, TaggingResult
+from taggercore.tagger import (
+    AbstractResourceGroupApiTagger,
+    AutoScalingTagger,
+    ServiceTagger,
+    SuperTagger,
+)
+
+
+def auto_scaling_groups(count: int):
+    return [
+        Resource(
+            f"arn:aws:autoscaling:eu-central-1:111111111111:autoScalingGroup:"
+            f"8e2a5c1e-0000-4000-8000-00000000000{i}:autoScalingGroupName/asg-{i}",
+            f"asg-{i}",
+            "autoScalingGroup",
+            [],
+        )
+        for i in range(count)
+    ]
+
+
+class TestAutoScalingTagger:
+    def test_should_tag_groups_in_one_call(
+        self, mocker, account_and_profile_configured
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(AutoScalingTagger, "_init_client")
+        groups = auto_scaling_groups(2)
+        tags = [Tag("Project", "CoolProject")]
+
+        actual = AutoScalingTagger(
+            groups, tags, propagate_at_launch=False
+        ).tag_resources()
+
+        mocked_init_client.return_value.create_or_update_tags.assert_called_once_with(
+            Tags=[
+                {
+                    "ResourceId": "asg-0",
+                    "ResourceType": "auto-scaling-group",
+                    "Key": "Project",
+                    "Value": "CoolProject",
+                    "PropagateAtLaunch": False,
+                },
+                {
+                    "ResourceId": "asg-1",
+                    "ResourceType": "auto-scaling-group",
+                    "Key": "Project",
+                    "Value": "CoolProject",
+                    "PropagateAtLaunch": False,
+                },
+            ]
+        )
+        assert actual == [TaggingResult([group.arn for group in groups], {})]
+
+    def test_should_split_groups_by_number_of_tags(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(AutoScalingTagger, "_init_client")
+
+        actual = AutoScalingTagger(auto_scaling_groups(200), tags).tag_resources()
+
+        # 3 tags per group allow 166 groups per call
+        assert [
+            len(call.kwargs["Tags"])
+            for call in mocked_init_client.return_value.create_or_update_tags.call_args_list
+        ] == [498, 102]
+        assert len(actual) == 2
+
+    def test_should_isolate_unknown_group(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(AutoScalingTagger, "_init_client")
+        groups = auto_scaling_groups(3)
+        error_msg = (
+            "AutoScalingGroup name not found - AutoScalingGroup 'asg-1' not found"
+        )
+        mocked_init_client.return_value.create_or_update_tags.side_effect = [
+            ClientError(
+                operation_name="create_or_update_tags",
+                error_response={
+                    "Error": {"Code": "ValidationError", "Message": error_msg}
+                },
+            ),
+            {},
+        ]
+
+        actual = AutoScalingTagger(groups, tags).tag_resources()
+
+        assert actual == [
+            TaggingResult([groups[0].arn, groups[2].arn], {groups[1].arn: error_msg})
+        ]
+
+    def test_super_tagger_should_pass_propagate_at_launch(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+
+        tagger = SuperTagger(auto_scaling_groups(1), tags, propagate_at_launch=False)
+
+        assert isinstance(tagger.service_taggers[0], AutoScalingTagger)
+        assert tagger.service_taggers[0]._propagate_at_launch is False
+        assert tagger.region_taggers == []
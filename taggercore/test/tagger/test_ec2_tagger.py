@@ -0,0 +1,220 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from taggercore import tagger
+from taggercore.model import Resource, Tag, TaggingResult
+from taggercore.tagger import Ec2Tagger, ServiceTagger
+
+
+def security_groups(region: str, count: int):
+    return [
+        Resource(
+            f"arn:aws:ec2:{region}:111111111111:security-group/sg-{i}",
+            f"sg-{i}",
+            "security-group",
+            [],
+        )
+        for i in range(count)
+    ]
+
+
+class TestEc2Tagger:
+    def test_should_support_resources_tagged_by_id(self):
+        assert Ec2Tagger.supports(security_groups("eu-central-1", 1)[0])
+        assert not Ec2Tagger.supports(
+            Resource(
+                "arn:aws:ec2:eu-central-1:111111111111:key-pair/some-key",
+                "some-key",
+                "key-pair",
+                [],
+            )
+        )
+
+    def test_should_tag_in_batches_per_region(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(Ec2Tagger, "_init_client")
+        resources = security_groups("eu-central-1", 2500) + security_groups(
+            "eu-west-1", 3
+        )
+
+        actual = Ec2Tagger(resources, tags).tag_resources()
+
+        mocked_init_client.assert_has_calls(
+            [mocker.call("eu-central-1"), mocker.call("eu-west-1")]
+        )
+        create_tags_calls = mocked_init_client.return_value.create_tags.call_args_list
+        assert [len(call.kwargs["Resources"]) for call in create_tags_calls] == [
+            1000,
+            1000,
+            500,
+            3,
+        ]
+        assert create_tags_calls[0].kwargs["Resources"][0] == "sg-0"
+        assert create_tags_calls[0].kwargs["Tags"] == [
+            {"Key": tag.key, "Value": tag.value} for tag in tags
+        ]
+        assert [len(result.successful_arns) for result in actual] == [
+            1000,
+            1000,
+            500,
+            3,
+        ]
+
+    def test_should_map_invalid_ids_to_arns(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        resources = security_groups("eu-central-1", 4)
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(Ec2Tagger, "_init_client")
+        mocked_init_client.return_value.create_tags.side_effect = [
+            ClientError(
+                operation_name="create_tags",
+                error_response={
+                    "Error": {
+                        "Code": "InvalidGroup.NotFound",
+                        "Message": "The security group 'sg-2' does not exist",
+                    }
+                },
+            ),
+            {},
+        ]
+
+        actual = Ec2Tagger(resources, tags).tag_resources()
+
+        mocked_init_client.return_value.create_tags.assert_called_with(
+            Resources=["sg-0", "sg-1", "sg-3"], Tags=mocker.ANY
+        )
+        assert actual == [
+            TaggingResult(
+                [resources[0].arn, resources[1].arn, resources[3].arn],
+                {resources[2].arn: "The security group 'sg-2' does not exist"},
+            )
+        ]
+
+    def test_should_fail_batch_on_other_errors(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        resources = security_groups("eu-central-1", 2)
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(Ec2Tagger, "_init_client")
+        mocked_init_client.return_value.create_tags.side_effect = ClientError(
+            operation_name="create_tags",
+            error_response={
+                "Error": {"Code": "UnauthorizedOperation", "Message": "Denied"}
+            },
+        )
+
+        actual = Ec2Tagger(resources, tags).tag_resources()
+
+        assert actual == [
+            TaggingResult([], {resource.arn: "Denied" for resource in resources})
+        ]
+
+    def test_should_retry_throttled_batch(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        resources = security_groups("eu-central-1", 2)
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_sleep = mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_init_client = mocker.patch.object(Ec2Tagger, "_init_client")
+        mocked_init_client.return_value.create_tags.side_effect = [
+            ClientError(
+                operation_name="create_tags",
+                error_response={
+                    "Error": {
+                        "Code": "RequestLimitExceeded",
+                        "Message": "Request limit exceeded.",
+                    }
+                },
+            ),
+            {},
+        ]
+
+        actual = Ec2Tagger(resources, tags).tag_resources()
+
+        assert mocked_init_client.return_value.create_tags.call_count == 2
+        assert mocked_sleep.call_count == 1
+        assert actual == [TaggingResult([resource.arn for resource in resources], {})]
+
+    def test_should_fail_batch_on_connection_errors(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        resources = security_groups("eu-central-1", 2)
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_init_client = mocker.patch.object(Ec2Tagger, "_init_client")
+        mocked_init_client.return_value.create_tags.side_effect = (
+            EndpointConnectionError(endpoint_url="https://ec2.eu-central-1")
+        )
+
+        actual = Ec2Tagger(resources, tags).tag_resources()
+
+        assert mocked_init_client.return_value.create_tags.call_count == 5
+        assert list(actual[0].failed_arns) == [resource.arn for resource in resources]
+
+    def test_should_only_send_missing_tags(
+        self, mocker, account_and_profile_configured, tags
+    ):
+        untagged = security_groups("eu-central-1", 1)[0]
+        partially_tagged = Resource(
+            "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-1",
+            "sg-1",
+            "security-group",
+            [Tag("Project", "CoolProject")],
+        )
+        completely_tagged = Resource(
+            "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-2",
+            "sg-2",
+            "security-group",
+            tags,
+        )
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_init_client = mocker.patch.object(Ec2Tagger, "_init_client")
+
+        actual = Ec2Tagger(
+            [untagged, partially_tagged, completely_tagged],
+            tags,
+            only_missing_tags=True,
+        ).tag_resources()
+
+        create_tags_calls = mocked_init_client.return_value.create_tags.call_args_list
+        # the order of the missing tags is not defined
+        assert [
+            (
+                call.kwargs["Resources"],
+                sorted(tag["Key"] for tag in call.kwargs["Tags"]),
+            )
+            for call in create_tags_calls
+        ] == [
+            (["sg-0"], ["Created", "Owner", "Project"]),
+            (["sg-1"], ["Created", "Owner"]),
+        ]
+        assert actual == [
+            TaggingResult([untagged.arn], {}),
+            TaggingResult([partially_tagged.arn], {}),
+            TaggingResult([], {}, [completely_tagged.arn]),
+        ]
@@ -0,0 +1,123 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import pytest
+from botocore.exceptions import ClientError
+
+from taggercore.tagger import isolate_invalid_arns
+
+
+def invalid_parameter_error(message: str) -> ClientError:
+    return ClientError(
+        operation_name="tag_resources",
+        error_response={
+            "Error": {"Code": "InvalidParameterException", "Message": message}
+        },
+    )
+
+
+class FakeTaggingApi:
+    """Rejects every batch containing an invalid ARN and names the first one"""
+
+    def __init__(self, invalid_arns, name_invalid_arn=True):
+        self.invalid_arns = invalid_arns
+        self.name_invalid_arn = name_invalid_arn
+        self.sent_batches = []
+
+    def send(self, batch):
+        self.sent_batches.append(batch)
+        invalid_in_batch = [arn for arn in batch if arn in self.invalid_arns]
+        if invalid_in_batch:
+            if self.name_invalid_arn:
+                raise invalid_parameter_error(
+                    f"{invalid_in_batch[0]} is not a valid AmazonResourceName (ARN)"
+                )
+            raise invalid_parameter_error("Invalid parameter")
+        return {"FailedResourcesMap": {}}
+
+
+class TestFailureIsolation:
+    def test_should_send_batch_once_without_invalid_arns(self):
+        arns = [f"arn:aws:sqs:eu-central-1:111111111111:q{i}" for i in range(20)]
+        api = FakeTaggingApi([])
+        failed_arns = {}
+
+        responses = isolate_invalid_arns(api.send, arns, failed_arns)
+
+        assert responses == [{"FailedResourcesMap": {}}]
+        assert api.sent_batches == [arns]
+        assert failed_arns == {}
+
+    def test_should_remove_named_arn_and_resend_rest(self):
+        arns = [f"arn:aws:sqs:eu-central-1:111111111111:q{i}" for i in range(20)]
+        api = FakeTaggingApi([arns[5]])
+        failed_arns = {}
+
+        responses = isolate_invalid_arns(api.send, arns, failed_arns)
+
+        assert len(responses) == 1
+        assert api.sent_batches[1] == arns[:5] + arns[6:]
+        assert failed_arns == {
+            arns[5]: f"{arns[5]} is not a valid AmazonResourceName (ARN)"
+        }
+
+    def test_should_bisect_batch_with_several_invalid_arns(self):
+        arns = [f"arn:aws:sqs:eu-central-1:111111111111:q{i}" for i in range(20)]
+        invalid_arns = [arns[2], arns[11], arns[17]]
+        api = FakeTaggingApi(invalid_arns)
+        failed_arns = {}
+
+        responses = isolate_invalid_arns(api.send, arns, failed_arns)
+
+        assert sorted(failed_arns.keys()) == sorted(invalid_arns)
+        accepted_arns = [
+            arn
+            for batch in api.sent_batches
+            if not any(arn in invalid_arns for arn in batch)
+            for arn in batch
+        ]
+        assert sorted(accepted_arns) == sorted(set(arns) - set(invalid_arns))
+        assert len(responses) < len(invalid_arns) * 4
+        assert len(api.sent_batches) < 20
+
+    def test_should_bisect_when_error_names_no_arn(self):
+        arns = [f"arn:aws:sqs:eu-central-1:111111111111:q{i}" for i in range(8)]
+        api = FakeTaggingApi([arns[6]], name_invalid_arn=False)
+        failed_arns = {}
+
+        isolate_invalid_arns(api.send, arns, failed_arns)
+
+        assert failed_arns == {arns[6]: "Invalid parameter"}
+        assert len(api.sent_batches) == 7
+
+    def test_should_raise_other_errors(self):
+        def send(batch):
+            raise ClientError(
+                operation_name="tag_resources",
+                error_response={
+                    "Error": {"Code": "AccessDeniedException", "Message": "Denied"}
+                },
+            )
+
+        with pytest.raises(ClientError):
+            isolate_invalid_arns(send, ["arn:aws:sqs:eu-central-1:111111111111:q"], {})
@@ -41,3 +41,19 @@ class TestGlobalTagger:
             ],
             Tags=expected_tags,
         )
+
+    def test_init_client_without_botocore_retries(
+        self, mocker, account_and_profile_configured, tags, global_resources
+    ):
+        mocked_init_session = mocker.patch.object(
+            AbstractResourceGroupApiTagger, "init_session"
+        )
+
+        GlobalTagger(tags, global_resources).init_client()
+
+        _, kwargs = mocked_init_session.return_value.client.call_args
+        assert kwargs["region_name"] == "us-east-1"
+        assert kwargs["config"].retries == {
+            "mode": "standard",
+            "total_max_attempts": 1,
+        }
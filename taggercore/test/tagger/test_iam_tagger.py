@@ -24,18 +24,19 @@
 import botocore
 import pytest
 
+from taggercore import tagger
 from taggercore.config import TaggercoreConfigError
-from taggercore.model import TaggingResult
+from taggercore.model import Resource, Tag, TaggingResult
 from taggercore.tagger import IamTagger, ServiceTagger
 
 
 class TestIamTagger:
-    def test_tag_all_without_users_and_roles(
+    def test_tag_all_without_resources(
         self, mocker, account_and_profile_configured, tags
     ):
         mocker.patch.object(ServiceTagger, "init_session")
         mocker.patch.object(IamTagger, "_init_client")
-        expected = [TaggingResult([], {}), TaggingResult([], {})]
+        expected = [TaggingResult([], {}) for _ in range(4)]
 
         actual = IamTagger([], tags).tag_resources()
 
@@ -63,6 +64,8 @@ class TestIamTagger:
                 ],
                 {},
             ),
+            TaggingResult([], {}),
+            TaggingResult([], {}),
         ]
 
         actual = IamTagger(iam_roles + iam_user, tags).tag_resources()
@@ -98,6 +101,8 @@ class TestIamTagger:
                 },
             ),
             TaggingResult([], {}),
+            TaggingResult([], {}),
+            TaggingResult([], {}),
         ]
 
         actual = IamTagger(iam_user, tags).tag_resources()
@@ -132,8 +137,121 @@ class TestIamTagger:
                     "arn:aws:iam::111111111111:role/another-role": "The iam role doesnt exist",
                 },
             ),
+            TaggingResult([], {}),
+            TaggingResult([], {}),
         ]
 
         actual = IamTagger(iam_roles, tags).tag_resources()
 
         assert actual == expected
+
+    def test_tag_policies_and_instance_profiles(
+        self, mocker, account_and_profile_configured, iam_roles, tags
+    ):
+        policy = Resource(
+            "arn:aws:iam::111111111111:policy/some-policy",
+            "some-policy",
+            "policy",
+            [],
+            name="some-policy",
+        )
+        instance_profile = Resource(
+            "arn:aws:iam::111111111111:instance-profile/some-profile",
+            "some-profile",
+            "instance-profile",
+            [],
+            name="some-profile",
+        )
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_client = mocker.patch.object(IamTagger, "_init_client")
+        expected_tags = [{"Key": tag.key, "Value": tag.value} for tag in tags]
+
+        actual = IamTagger(
+            iam_roles + [policy, instance_profile], tags, max_workers=2
+        ).tag_resources()
+
+        mocked_client.return_value.tag_policy.assert_called_once_with(
+            PolicyArn=policy.arn, Tags=expected_tags
+        )
+        mocked_client.return_value.tag_instance_profile.assert_called_once_with(
+            InstanceProfileName="some-profile", Tags=expected_tags
+        )
+        assert mocked_client.return_value.tag_role.call_count == 2
+        assert actual == [
+            TaggingResult([], {}),
+            TaggingResult([resource.arn for resource in iam_roles], {}),
+            TaggingResult([policy.arn], {}),
+            TaggingResult([instance_profile.arn], {}),
+        ]
+
+    def test_retry_throttled_calls(
+        self, mocker, account_and_profile_configured, iam_user, tags
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_sleep = mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_client = mocker.patch.object(IamTagger, "_init_client")
+        mocked_client.return_value.tag_user.side_effect = [
+            botocore.exceptions.ClientError(
+                operation_name="tag_user",
+                error_response={
+                    "Error": {"Code": "Throttling", "Message": "Rate exceeded"}
+                },
+            ),
+            {},
+            {},
+        ]
+
+        actual = IamTagger(iam_user, tags, max_workers=1).tag_resources()
+
+        assert mocked_client.return_value.tag_user.call_count == 3
+        # the throttled call pauses all following calls
+        assert mocked_sleep.call_count == 2
+        assert actual[0] == TaggingResult([user.arn for user in iam_user], {})
+
+    def test_connection_errors_fail_only_the_resource(
+        self, mocker, account_and_profile_configured, iam_user, tags
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_client = mocker.patch.object(IamTagger, "_init_client")
+        mocked_client.return_value.tag_user.side_effect = [
+            botocore.exceptions.EndpointConnectionError(
+                endpoint_url="https://iam.amazonaws.com"
+            )
+        ] * 5 + [{}]
+
+        actual = IamTagger(iam_user, tags, max_workers=1).tag_resources()
+
+        assert actual[0].successful_arns == [iam_user[1].arn]
+        assert list(actual[0].failed_arns) == [iam_user[0].arn]
+
+    def test_tag_only_missing_tags(self, mocker, account_and_profile_configured, tags):
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_client = mocker.patch.object(IamTagger, "_init_client")
+        complete_role = Resource(
+            "arn:aws:iam::111111111111:role/complete-role",
+            "complete-role",
+            "role",
+            tags,
+        )
+        incomplete_role = Resource(
+            "arn:aws:iam::111111111111:role/incomplete-role",
+            "incomplete-role",
+            "role",
+            [Tag("Project", "CoolProject"), Tag("Owner", "Hans")],
+        )
+        received = []
+        iam_tagger = IamTagger(
+            [complete_role, incomplete_role], tags, only_missing_tags=True
+        )
+        iam_tagger.add_result_listener(received.append)
+
+        iam_tagger.tag_streaming()
+
+        mocked_client.return_value.tag_role.assert_called_once()
+        _, kwargs = mocked_client.return_value.tag_role.call_args
+        assert sorted(tag["Key"] for tag in kwargs["Tags"]) == ["Created", "Owner"]
+        assert received == [
+            TaggingResult([incomplete_role.arn], {}),
+            TaggingResult([], {}, [complete_role.arn]),
+        ]
@@ -25,7 +25,9 @@ from unittest.mock import call
 
 from botocore.exceptions import ClientError
 
-from taggercore.model import TaggingResult
+from taggercore import tagger
+from taggercore.config import set_config, Config, RetryPolicy
+from taggercore.model import Resource, Tag, TaggingResult
 from taggercore.tagger import RegionTagger, AbstractResourceGroupApiTagger
 
 
@@ -83,6 +85,25 @@ class TestRegionTagger:
         assert region_tagger.tags == tags
         assert region_tagger.resources_to_tag == regional_resources
 
+    def test_tag_streaming_only_passes_results_to_listeners(
+        self, mocker, tags, too_many_resources_for_single_boto_call
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.return_value = {
+            "FailedResourcesMap": {}
+        }
+        region_tagger = RegionTagger(
+            tags, too_many_resources_for_single_boto_call, "eu-central-1"
+        )
+        received = []
+        region_tagger.add_result_listener(received.append)
+
+        actual = region_tagger.tag_streaming()
+
+        assert actual is None
+        assert [len(result.successful_arns) for result in received] == [20, 3]
+
     def test_should_split_resources(
         self, mocker, tags, too_many_resources_for_single_boto_call
     ):
@@ -170,3 +191,154 @@ class TestRegionTagger:
         assert actual[0].failed_arns == {
             "arn:aws:ec2:eu-central-1:111111111111:invalid": "arn:aws:ec2:eu-central-1:111111111111:invalid is not a valid AmazonResourceName (ARN)"
         }
+
+    def test_should_send_batches_concurrently(
+        self, mocker, tags, too_many_resources_for_single_boto_call
+    ):
+        failed_arn = "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d22"
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.side_effect = (
+            lambda ResourceARNList, Tags: {
+                "FailedResourcesMap": {
+                    arn: {"ErrorCode": "InvalidParameterValue", "ErrorMessage": "Error"}
+                    for arn in ResourceARNList
+                    if arn == failed_arn
+                }
+            }
+        )
+
+        actual = RegionTagger(
+            tags, too_many_resources_for_single_boto_call, "eu-central-1", 2
+        ).tag_all()
+
+        assert len(actual) == 2
+        assert len(actual[0].successful_arns) == 20
+        assert actual[0].failed_arns == {}
+        assert len(actual[1].successful_arns) == 2
+        assert actual[1].failed_arns == {failed_arn: "Error"}
+
+    def test_should_pause_and_resend_when_throttled(
+        self, mocker, tags, regional_resources
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_sleep = mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        throttling_error = ClientError(
+            operation_name="tag_resources",
+            error_response={
+                "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}
+            },
+        )
+        mocked_init_client.return_value.tag_resources.side_effect = [
+            throttling_error,
+            {"FailedResourcesMap": {}},
+        ]
+
+        actual = RegionTagger(tags, regional_resources, "eu-central-1").tag_all()
+
+        assert mocked_init_client.return_value.tag_resources.call_count == 2
+        assert mocked_sleep.call_count == 1
+        assert len(actual[0].successful_arns) == 3
+        assert actual[0].failed_arns == {}
+
+    def test_should_fail_batch_when_throttled_too_often(
+        self, mocker, tags, regional_resources
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.side_effect = ClientError(
+            operation_name="tag_resources",
+            error_response={
+                "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}
+            },
+        )
+
+        actual = RegionTagger(tags, regional_resources, "eu-central-1").tag_all()
+
+        assert actual[0].successful_arns == []
+        assert actual[0].failed_arns == {
+            resource.arn: "Rate exceeded" for resource in regional_resources
+        }
+
+    def test_should_only_send_missing_tags(self, mocker, tags, regional_resources):
+        untagged_queue = Resource(
+            "arn:aws:sqs:eu-central-1:111111111111:untagged", "untagged", "queue", []
+        )
+        partially_tagged_queue = Resource(
+            "arn:aws:sqs:eu-central-1:111111111111:partially",
+            "partially",
+            "queue",
+            [Tag("Project", "CoolProject"), Tag("Owner", "Hans")],
+        )
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.return_value = {
+            "FailedResourcesMap": {}
+        }
+
+        actual = RegionTagger(
+            tags,
+            [untagged_queue, partially_tagged_queue] + regional_resources,
+            "eu-central-1",
+            only_missing_tags=True,
+        ).tag_all()
+
+        assert mocked_init_client.return_value.tag_resources.call_args_list == [
+            call(
+                ResourceARNList=[untagged_queue.arn],
+                Tags={tag.key: tag.value for tag in tags},
+            ),
+            call(
+                ResourceARNList=[partially_tagged_queue.arn],
+                Tags={"Owner": "Fritz", "Created": "2020-08-01"},
+            ),
+        ]
+        assert actual == [
+            TaggingResult([untagged_queue.arn], {}),
+            TaggingResult([partially_tagged_queue.arn], {}),
+            TaggingResult([], {}, [resource.arn for resource in regional_resources]),
+        ]
+
+    def test_should_fail_batch_on_error_which_is_not_retried(
+        self, mocker, tags, regional_resources
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.side_effect = ClientError(
+            operation_name="tag_resources",
+            error_response={
+                "Error": {"Code": "AccessDeniedException", "Message": "Denied"}
+            },
+        )
+
+        actual = RegionTagger(tags, regional_resources, "eu-central-1").tag_all()
+
+        assert mocked_init_client.return_value.tag_resources.call_count == 1
+        assert actual[0].failed_arns == {
+            resource.arn: "Denied" for resource in regional_resources
+        }
+
+    def test_should_stop_retrying_when_retry_budget_is_used_up(
+        self, mocker, tags, too_many_resources_for_single_boto_call
+    ):
+        set_config(Config(retry_policy=RetryPolicy(retry_budget=1)))
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(tagger.retrying_sender.time, "sleep")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.side_effect = ClientError(
+            operation_name="tag_resources",
+            error_response={
+                "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}
+            },
+        )
+
+        actual = RegionTagger(
+            tags, too_many_resources_for_single_boto_call, "eu-central-1"
+        ).tag_all()
+        set_config(Config())
+
+        assert mocked_init_client.return_value.tag_resources.call_count == 3
+        assert len(actual[0].failed_arns) == 20
+        assert len(actual[1].failed_arns) == 3
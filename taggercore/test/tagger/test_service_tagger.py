@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore.model import TaggingResult
+from taggercore.tagger import ServiceTagger
+
+
+class ListReturningTagger(ServiceTagger):
+    def tag_resources(self):
+        return [
+            TaggingResult(["arn:aws:sqs:eu-central-1:111111111111:someq"], {}),
+            TaggingResult(
+                [], {"arn:aws:sqs:eu-central-1:111111111111:otherq": "Error"}
+            ),
+        ]
+
+
+class TestServiceTagger:
+    def test_tag_streaming_passes_results_of_tag_resources_to_listeners(
+        self, mocker, tags, regional_resources
+    ):
+        mocker.patch.object(ServiceTagger, "init_session")
+        received = []
+        tagger = ListReturningTagger(regional_resources, tags)
+        tagger.add_result_listener(received.append)
+
+        tagger.tag_streaming()
+
+        assert received == [
+            TaggingResult(["arn:aws:sqs:eu-central-1:111111111111:someq"], {}),
+            TaggingResult(
+                [], {"arn:aws:sqs:eu-central-1:111111111111:otherq": "Error"}
+            ),
+        ]
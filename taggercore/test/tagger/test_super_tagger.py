@@ -21,16 +21,38 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from taggercore.model import TaggingResult
+from taggercore.model import Resource, TaggingResult, TaggingResultAccumulator
 from taggercore.tagger import (
     SuperTagger,
     AbstractResourceGroupApiTagger,
     ServiceTagger,
     RegionTagger,
     GlobalTagger,
+    Ec2Tagger,
+    IamTagger,
 )
 
 
+def streaming(*results_per_call):
+    """Side effect of a mocked tag_streaming, each call passes the next list of results to the listeners
+
+    A single list is passed on by every call, a function gets the tagger and returns its results.
+    """
+    pending = iter(results_per_call)
+
+    def tag_streaming(tagger):
+        if len(results_per_call) == 1:
+            results = results_per_call[0]
+        else:
+            results = next(pending)
+        if callable(results):
+            results = results(tagger)
+        for tagging_result in results:
+            tagger._notify_result_listeners(tagging_result)
+
+    return tag_streaming
+
+
 class TestSuperTagger:
     def test_should_create_region_taggers(
         self, mocker, account_and_profile_configured, resources_from_two_regions, tags
@@ -98,30 +120,32 @@ class TestSuperTagger:
         self, mocker, account_and_profile_configured, resources_from_two_regions, tags
     ):
         mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
-        mocked_region_tagger = mocker.patch.object(RegionTagger, "tag_all")
-        mocked_region_tagger.side_effect = [
+        mocked_region_tagger = mocker.patch.object(
+            RegionTagger, "tag_streaming", autospec=True
+        )
+        mocked_region_tagger.side_effect = streaming(
             [
                 TaggingResult(
                     [
-                        "arn:aws:ec2:eu-west-1:111111111111:network-acl/acl-abc",
+                        "arn:aws:sqs:eu-west-1:111111111111:queue-c",
                     ],
                     {
-                        "arn:aws:ec2:eu-west-1:111111111111:security-group/sg-b501f6d1": "Failed to tag security group"
+                        "arn:aws:sns:eu-west-1:111111111111:topic-b": "Failed to tag topic"
                     },
                 )
             ],
             [
                 TaggingResult(
                     [
-                        "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0",
-                        "arn:aws:ec2:eu-central-1:111111111111:subnet/subnet-57ce0009",
+                        "arn:aws:sns:eu-central-1:111111111111:topic-a",
+                        "arn:aws:sqs:eu-central-1:111111111111:queue-b",
                     ],
                     {
-                        "arn:aws:ec2:eu-central-1:111111111111:subnet/subnet-57ce0008": "Failed to tag subnet"
+                        "arn:aws:sqs:eu-central-1:111111111111:queue-a": "Failed to tag queue"
                     },
                 )
             ],
-        ]
+        )
 
         actual = SuperTagger(resources_from_two_regions, tags).tag_regions()
 
@@ -133,28 +157,36 @@ class TestSuperTagger:
     ):
         mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
         mocker.patch.object(ServiceTagger, "init_session")
-        mocked_global_tagger = mocker.patch.object(GlobalTagger, "tag_all")
-        mocked_service_tagger = mocker.patch.object(ServiceTagger, "tag_resources")
-        mocked_global_tagger.return_value = [
-            TaggingResult(
-                [
-                    "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
-                ],
-                {
-                    "arn:aws:route53::111111111111:healthcheck/f665452c-bf56-4a43-8b5d-319c3b8d0a70": "Failed to tag healthcheck"
-                },
-            )
-        ]
+        mocked_global_tagger = mocker.patch.object(
+            GlobalTagger, "tag_streaming", autospec=True
+        )
+        mocked_service_tagger = mocker.patch.object(
+            IamTagger, "tag_streaming", autospec=True
+        )
+        mocked_global_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [
+                        "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
+                    ],
+                    {
+                        "arn:aws:route53::111111111111:healthcheck/f665452c-bf56-4a43-8b5d-319c3b8d0a70": "Failed to tag healthcheck"
+                    },
+                )
+            ]
+        )
 
-        mocked_service_tagger.return_value = [
-            TaggingResult(
-                [
-                    "arn:aws:iam::111111111111:role/some-role",
-                    "arn:aws:iam::111111111111:role/another-role",
-                ],
-                {},
-            )
-        ]
+        mocked_service_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [
+                        "arn:aws:iam::111111111111:role/some-role",
+                        "arn:aws:iam::111111111111:role/another-role",
+                    ],
+                    {},
+                )
+            ]
+        )
 
         actual = SuperTagger(
             global_resources + iam_roles, tags
@@ -175,54 +207,64 @@ class TestSuperTagger:
         mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
         mocker.patch.object(ServiceTagger, "init_session")
         mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
-        mocked_region_tagger = mocker.patch.object(RegionTagger, "tag_all")
-        mocked_global_tagger = mocker.patch.object(GlobalTagger, "tag_all")
-        mocked_service_tagger = mocker.patch.object(ServiceTagger, "tag_resources")
+        mocked_region_tagger = mocker.patch.object(
+            RegionTagger, "tag_streaming", autospec=True
+        )
+        mocked_global_tagger = mocker.patch.object(
+            GlobalTagger, "tag_streaming", autospec=True
+        )
+        mocked_service_tagger = mocker.patch.object(
+            IamTagger, "tag_streaming", autospec=True
+        )
 
-        mocked_global_tagger.return_value = [
-            TaggingResult(
-                [
-                    "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
-                ],
-                {
-                    "arn:aws:route53::111111111111:healthcheck/f665452c-bf56-4a43-8b5d-319c3b8d0a70": "Failed to tag healthcheck"
-                },
-            )
-        ]
+        mocked_global_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [
+                        "arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE",
+                    ],
+                    {
+                        "arn:aws:route53::111111111111:healthcheck/f665452c-bf56-4a43-8b5d-319c3b8d0a70": "Failed to tag healthcheck"
+                    },
+                )
+            ]
+        )
 
-        mocked_service_tagger.return_value = [
-            TaggingResult(
-                [
-                    "arn:aws:iam::111111111111:role/some-role",
-                    "arn:aws:iam::111111111111:role/another-role",
-                ],
-                {},
-            )
-        ]
+        mocked_service_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [
+                        "arn:aws:iam::111111111111:role/some-role",
+                        "arn:aws:iam::111111111111:role/another-role",
+                    ],
+                    {},
+                )
+            ]
+        )
 
-        mocked_region_tagger.side_effect = [
+        mocked_region_tagger.side_effect = streaming(
             [
                 TaggingResult(
                     [
-                        "arn:aws:ec2:eu-west-1:111111111111:network-acl/acl-abc",
+                        "arn:aws:sqs:eu-west-1:111111111111:queue-c",
                     ],
                     {
-                        "arn:aws:ec2:eu-west-1:111111111111:security-group/sg-b501f6d1": "Failed to tag security group"
+                        "arn:aws:sns:eu-west-1:111111111111:topic-b": "Failed to tag topic"
                     },
                 )
             ],
             [
                 TaggingResult(
                     [
-                        "arn:aws:ec2:eu-central-1:111111111111:security-group/sg-b501f6d0",
-                        "arn:aws:ec2:eu-central-1:111111111111:subnet/subnet-57ce0009",
+                        "arn:aws:sns:eu-central-1:111111111111:topic-a",
+                        "arn:aws:sqs:eu-central-1:111111111111:queue-b",
                     ],
                     {
-                        "arn:aws:ec2:eu-central-1:111111111111:subnet/subnet-57ce0008": "Failed to tag subnet"
+                        "arn:aws:sqs:eu-central-1:111111111111:queue-a": "Failed to tag queue"
                     },
                 )
             ],
-        ]
+        )
 
         actual = SuperTagger(
             global_resources + iam_roles + resources_from_two_regions, tags
@@ -235,36 +277,260 @@ class TestSuperTagger:
         mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
         mocker.patch.object(ServiceTagger, "init_session")
         mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
-        mocked_region_tagger = mocker.patch.object(RegionTagger, "tag_all")
-        mocked_global_tagger = mocker.patch.object(GlobalTagger, "tag_all")
-        mocked_service_tagger = mocker.patch.object(ServiceTagger, "tag_resources")
-
-        mocked_global_tagger.return_value = [
-            TaggingResult(
-                [],
-                {},
-            )
-        ]
+        mocked_region_tagger = mocker.patch.object(
+            RegionTagger, "tag_streaming", autospec=True
+        )
+        mocked_global_tagger = mocker.patch.object(
+            GlobalTagger, "tag_streaming", autospec=True
+        )
+        mocked_service_tagger = mocker.patch.object(
+            IamTagger, "tag_streaming", autospec=True
+        )
 
-        mocked_service_tagger.return_value = [
-            TaggingResult(
-                [],
-                {},
-            )
-        ]
+        mocked_global_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [],
+                    {},
+                )
+            ]
+        )
 
-        mocked_region_tagger.return_value = [
-            TaggingResult(
-                [
-                    "arn:aws:ec2:eu-west-1:111111111111:network-acl/acl-abc",
-                ],
-                {
-                    "arn:aws:ec2:eu-west-1:111111111111:security-group/sg-b501f6d1": "Failed to tag security group"
-                },
-            )
-        ]
+        mocked_service_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [],
+                    {},
+                )
+            ]
+        )
+
+        mocked_region_tagger.side_effect = streaming(
+            [
+                TaggingResult(
+                    [
+                        "arn:aws:sqs:eu-west-1:111111111111:queue-c",
+                    ],
+                    {
+                        "arn:aws:sns:eu-west-1:111111111111:topic-b": "Failed to tag topic"
+                    },
+                )
+            ]
+        )
 
         actual = SuperTagger([], tags).tag_all()
 
         assert len(actual.successful_arns) == 0
         assert len(actual.failed_arns) == 0
+
+    def test_should_combine_results_of_concurrent_taggers(
+        self,
+        mocker,
+        account_and_profile_configured,
+        global_resources,
+        iam_roles,
+        tags,
+        resources_from_two_regions,
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocker.patch.object(
+            RegionTagger,
+            "tag_streaming",
+            autospec=True,
+            side_effect=streaming(
+                lambda region_tagger: [
+                    TaggingResult(
+                        [resource.arn for resource in region_tagger.resources_to_tag],
+                        {},
+                    )
+                ]
+            ),
+        )
+        mocker.patch.object(
+            GlobalTagger,
+            "tag_streaming",
+            autospec=True,
+            side_effect=streaming(
+                [
+                    TaggingResult(
+                        ["arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE"],
+                        {
+                            "arn:aws:route53::111111111111:healthcheck/f665452c-bf56-4a43-8b5d-319c3b8d0a70": "Failed to tag healthcheck"
+                        },
+                    )
+                ]
+            ),
+        )
+        mocker.patch.object(
+            IamTagger,
+            "tag_streaming",
+            autospec=True,
+            side_effect=streaming(
+                [TaggingResult([resource.arn for resource in iam_roles], {})]
+            ),
+        )
+        resources = global_resources + iam_roles + resources_from_two_regions
+
+        sequential = SuperTagger(resources, tags).tag_all()
+        concurrent = SuperTagger(resources, tags, max_workers=4).tag_all()
+
+        # concurrent taggers add their results in the order they complete
+        assert sorted(concurrent.successful_arns) == sorted(sequential.successful_arns)
+        assert concurrent.failed_arns == sequential.failed_arns
+        assert sequential.successful_arns == [
+            resource.arn for resource in iam_roles
+        ] + ["arn:aws:cloudfront::111111111111:distribution/EMS6KR7IENMDE"] + [
+            resource.arn for resource in resources_from_two_regions
+        ]
+
+    def test_should_skip_compliant_resources(
+        self,
+        mocker,
+        account_and_profile_configured,
+        iam_roles,
+        tags,
+        regional_resources,
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocked_region_tagger = mocker.patch.object(
+            RegionTagger, "tag_streaming", autospec=True
+        )
+        mocker.patch.object(GlobalTagger, "tag_streaming", autospec=True)
+        mocker.patch.object(
+            IamTagger,
+            "tag_streaming",
+            autospec=True,
+            side_effect=streaming(
+                [TaggingResult([resource.arn for resource in iam_roles], {})]
+            ),
+        )
+
+        tagger = SuperTagger(iam_roles + regional_resources, tags, skip_compliant=True)
+        actual = tagger.tag_all()
+
+        assert tagger.region_taggers == []
+        assert tagger.service_taggers[0].resources == iam_roles
+        mocked_region_tagger.assert_not_called()
+        assert actual == TaggingResult(
+            [resource.arn for resource in iam_roles],
+            {},
+            [resource.arn for resource in regional_resources],
+        )
+
+    def test_should_tag_all_into_spilling_accumulator(
+        self,
+        mocker,
+        account_and_profile_configured,
+        iam_roles,
+        tags,
+        regional_resources,
+        tmp_path,
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocker.patch.object(GlobalTagger, "tag_streaming", autospec=True)
+        mocker.patch.object(
+            IamTagger,
+            "tag_streaming",
+            autospec=True,
+            side_effect=streaming(
+                [TaggingResult([resource.arn for resource in iam_roles], {})]
+            ),
+        )
+        tagger = SuperTagger(iam_roles + regional_resources, tags, skip_compliant=True)
+
+        with TaggingResultAccumulator(tmp_path / "result.ndjson") as accumulator:
+            tagger.tag_all_into(accumulator)
+
+        assert accumulator.summary() == {
+            "successful": len(iam_roles),
+            "failed": 0,
+            "skipped": len(regional_resources),
+        }
+        assert accumulator.tagging_result() == tagger.tag_all()
+
+    def test_should_combine_skipped_arns_of_taggers(
+        self, mocker, tags, resources_from_two_regions
+    ):
+        eu_west_resources = [
+            resource
+            for resource in resources_from_two_regions
+            if resource.region == "eu-west-1"
+        ]
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(
+            RegionTagger,
+            "tag_streaming",
+            autospec=True,
+            side_effect=streaming(
+                [
+                    TaggingResult([eu_west_resources[0].arn], {}),
+                    TaggingResult([], {}, [eu_west_resources[1].arn]),
+                ]
+            ),
+        )
+        mocker.patch.object(GlobalTagger, "tag_streaming", autospec=True)
+
+        tagger = SuperTagger(eu_west_resources, tags, only_missing_tags=True)
+        actual = tagger.tag_all()
+
+        assert tagger.region_taggers[0].plan() == (
+            [
+                (
+                    {tag.key: tag.value for tag in tags},
+                    [resource.arn for resource in eu_west_resources],
+                )
+            ],
+            [],
+        )
+        assert actual == TaggingResult(
+            [eu_west_resources[0].arn], {}, [eu_west_resources[1].arn]
+        )
+
+    def test_should_tag_ec2_resources_with_ec2_tagger(
+        self, mocker, account_and_profile_configured, regional_resources, tags
+    ):
+        key_pair = Resource(
+            "arn:aws:ec2:eu-central-1:111111111111:key-pair/some-key",
+            "some-key",
+            "key-pair",
+            [],
+        )
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+
+        tagger = SuperTagger(regional_resources + [key_pair], tags)
+
+        assert isinstance(tagger.service_taggers[0], Ec2Tagger)
+        assert tagger.service_taggers[0].resources == [regional_resources[2]]
+        assert tagger.region_taggers[0].resources_to_tag == regional_resources[:2] + [
+            key_pair
+        ]
+
+    def test_should_pass_options_to_ec2_tagger(
+        self, mocker, account_and_profile_configured, regional_resources, tags
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+
+        tagger = SuperTagger(
+            regional_resources, tags, max_workers_per_tagger=4, only_missing_tags=True
+        )
+
+        assert isinstance(tagger.service_taggers[0], Ec2Tagger)
+        assert tagger.service_taggers[0]._max_workers == 4
+        assert tagger.service_taggers[0]._only_missing_tags
+
+    def test_should_pass_options_to_iam_tagger(
+        self, mocker, account_and_profile_configured, iam_roles, tags
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocker.patch.object(ServiceTagger, "init_session")
+        mocker.patch.object(IamTagger, "_init_client")
+
+        tagger = SuperTagger(iam_roles, tags, only_missing_tags=True)
+
+        assert isinstance(tagger.service_taggers[0], IamTagger)
+        assert tagger.service_taggers[0]._only_missing_tags
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2020 it-eXperts IT-Dienstleistungs GmbH.
+#
+# This file is part of tagger
+# (see https://github.com/IT-EXPERTS-AT/tagger).
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from taggercore.model import Resource, Tag
+from taggercore.tagger import group_by_missing_tags, plan_tags
+
+
+class TestTaggingPlanner:
+    def test_should_group_resources_by_missing_tags(self, tags):
+        resources = [
+            Resource("arn:aws:sqs:eu-central-1:111111111111:q1", "q1", "queue", []),
+            Resource(
+                "arn:aws:sqs:eu-central-1:111111111111:q2",
+                "q2",
+                "queue",
+                [Tag("Project", "CoolProject"), Tag("Owner", "Hans")],
+            ),
+            Resource("arn:aws:sqs:eu-central-1:111111111111:q3", "q3", "queue", []),
+            Resource(
+                "arn:aws:sqs:eu-central-1:111111111111:q4",
+                "q4",
+                "queue",
+                tags + [Tag("Other", "Value")],
+            ),
+        ]
+
+        groups, complete_arns = group_by_missing_tags(resources, tags)
+
+        assert groups == [
+            (
+                {"Project": "CoolProject", "Owner": "Fritz", "Created": "2020-08-01"},
+                [
+                    "arn:aws:sqs:eu-central-1:111111111111:q1",
+                    "arn:aws:sqs:eu-central-1:111111111111:q3",
+                ],
+            ),
+            (
+                {"Owner": "Fritz", "Created": "2020-08-01"},
+                ["arn:aws:sqs:eu-central-1:111111111111:q2"],
+            ),
+        ]
+        assert complete_arns == ["arn:aws:sqs:eu-central-1:111111111111:q4"]
+
+    def test_should_return_no_groups_without_resources(self, tags):
+        assert group_by_missing_tags([], tags) == ([], [])
+
+    def test_should_plan_all_tags_for_all_resources(self, tags):
+        resources = [
+            Resource("arn:aws:sqs:eu-central-1:111111111111:q1", "q1", "queue", tags),
+            Resource("arn:aws:sqs:eu-central-1:111111111111:q2", "q2", "queue", []),
+        ]
+
+        groups, complete_arns = plan_tags(resources, tags, only_missing_tags=False)
+
+        assert groups == [
+            (
+                {"Project": "CoolProject", "Owner": "Fritz", "Created": "2020-08-01"},
+                [resource.arn for resource in resources],
+            )
+        ]
+        assert complete_arns == []
@@ -21,9 +21,17 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from taggercore.model import TaggingResult
-from taggercore.tagger import SuperTagger, AbstractResourceGroupApiTagger, ServiceTagger
-from taggercore.usecase import perform_tagging
+import pytest
+
+from taggercore.cache import TaggingJournal, TaggingJournalMismatchError
+from taggercore.model import Tag, TaggingResult
+from taggercore.tagger import (
+    SuperTagger,
+    AbstractResourceGroupApiTagger,
+    RegionTagger,
+    ServiceTagger,
+)
+from taggercore.usecase import perform_tagging, resume_tagging
 
 
 class TestPerformTagging:
@@ -47,3 +55,69 @@ class TestPerformTagging:
         actual = perform_tagging(regional_resources + global_resources, tags)
 
         assert actual == expected_tagging_result
+
+    def test_perform_tagging_with_journal(
+        self, mocker, tmp_path, resources_from_two_regions, tags
+    ):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.return_value = {
+            "FailedResourcesMap": {}
+        }
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.start([Tag("Owner", "Hans")])
+        journal.record(TaggingResult([resources_from_two_regions[0].arn], {}))
+        recorded_arns = []
+        mocker.patch.object(
+            journal,
+            "record",
+            side_effect=lambda result: recorded_arns.extend(result.successful_arns),
+        )
+
+        actual = perform_tagging(resources_from_two_regions, tags, journal=journal)
+
+        assert sorted(recorded_arns) == sorted(actual.successful_arns)
+        assert len(actual.successful_arns) == len(resources_from_two_regions)
+        # the completed run needs no resume, a previous journal is not reused
+        assert not journal.exists()
+
+    def test_resume_tagging(self, mocker, tmp_path, resources_from_two_regions, tags):
+        mocker.patch.object(AbstractResourceGroupApiTagger, "init_session")
+        mocked_init_client = mocker.patch.object(RegionTagger, "init_client")
+        mocked_init_client.return_value.tag_resources.return_value = {
+            "FailedResourcesMap": {}
+        }
+        arns = [resource.arn for resource in resources_from_two_regions]
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.start(tags)
+        journal.record(TaggingResult(arns[:2], {arns[2]: "Rate exceeded"}))
+        journal.record(
+            TaggingResult(["arn:aws:sqs:eu-central-1:111111111111:deleted"], {})
+        )
+
+        actual = resume_tagging(resources_from_two_regions, tags, journal)
+
+        sent_arns = [
+            arn
+            for call in mocked_init_client.return_value.tag_resources.call_args_list
+            for arn in call.kwargs["ResourceARNList"]
+        ]
+        assert sorted(sent_arns) == sorted(arns[2:])
+        assert sorted(actual.successful_arns) == sorted(arns)
+        assert actual.failed_arns == {}
+        assert not journal.exists()
+
+    def test_resume_tagging_with_other_tags(
+        self, mocker, tmp_path, resources_from_two_regions, tags
+    ):
+        mocked_super_tagger = mocker.patch(
+            "taggercore.usecase.perform_tagging.SuperTagger"
+        )
+        journal = TaggingJournal(tmp_path / "journal.ndjson")
+        journal.start([Tag("Owner", "Hans")])
+
+        with pytest.raises(TaggingJournalMismatchError):
+            resume_tagging(resources_from_two_regions, tags, journal)
+
+        mocked_super_tagger.assert_not_called()
+        assert journal.exists()
@@ -21,8 +21,20 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+from datetime import timedelta
+
+from taggercore import usecase
+from taggercore.cache import SnapshotStore
+from taggercore.model import Resource
 from taggercore.scanner import RegionScanner, GlobalScanner
-from taggercore.usecase import scan_region, scan_region_and_global
+from taggercore.usecase import (
+    scan_region,
+    scan_region_and_global,
+    scan_regions,
+    scan_all_regions,
+    iter_scan_region,
+    iter_scan_global,
+)
 
 
 class TestScan:
@@ -43,3 +55,63 @@ class TestScan:
         actual = scan_region_and_global(region)
         assert actual[region] == regional_resources
         assert actual["global"] == global_resources
+
+    def test_scan_regions(self, mocker, regional_resources):
+        bucket = Resource(
+            "arn:aws:s3:eu-central-1:111111111111:bucket/b", "b", "bucket", []
+        )
+        west_queue = Resource(
+            "arn:aws:sqs:eu-west-1:111111111111:someq", "someq", "queue", []
+        )
+        mocked_region_scanner_scan = mocker.patch.object(RegionScanner, "scan")
+        mocked_region_scanner_scan.side_effect = lambda _: [bucket] + (
+            regional_resources
+            if mocked_region_scanner_scan.call_count == 1
+            else [west_queue]
+        )
+
+        actual = scan_regions(["eu-central-1", "eu-west-1"], max_workers=1)
+
+        assert actual == {
+            "eu-central-1": [bucket] + regional_resources,
+            "eu-west-1": [west_queue],
+        }
+
+    def test_scan_all_regions(self, mocker, regional_resources):
+        mocker.patch.object(
+            usecase.scan, "enabled_regions", return_value=["eu-central-1", "eu-west-1"]
+        )
+        mocked_region_scanner_scan = mocker.patch.object(RegionScanner, "scan")
+        mocked_region_scanner_scan.return_value = []
+
+        actual = scan_all_regions()
+
+        assert actual == {"eu-central-1": [], "eu-west-1": []}
+        assert mocked_region_scanner_scan.call_count == 2
+
+    def test_iter_scan_region_and_global(
+        self, mocker, regional_resources, global_resources
+    ):
+        mocker.patch.object(
+            RegionScanner, "iter_scan", return_value=iter(regional_resources)
+        )
+        mocker.patch.object(
+            GlobalScanner, "iter_scan", return_value=iter(global_resources)
+        )
+
+        assert list(iter_scan_region("eu-central-1")) == regional_resources
+        assert list(iter_scan_global()) == global_resources
+
+    def test_scan_region_uses_snapshot(
+        self, mocker, tmp_path, account_and_profile_configured, regional_resources
+    ):
+        mocked_region_scanner_scan = mocker.patch.object(RegionScanner, "scan")
+        mocked_region_scanner_scan.return_value = regional_resources
+        snapshot_store = SnapshotStore(timedelta(minutes=5), tmp_path)
+
+        first = scan_region("eu-central-1", snapshot_store=snapshot_store)
+        second = scan_region("eu-central-1", snapshot_store=snapshot_store)
+        scan_region("eu-central-1", snapshot_store=snapshot_store, force_refresh=True)
+
+        assert first == second == regional_resources
+        assert mocked_region_scanner_scan.call_count == 2
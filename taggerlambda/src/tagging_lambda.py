@@ -29,6 +29,7 @@ import boto3
 from botocore.exceptions import ClientError
 from taggercore.config import set_config, Config, Credentials
 from taggercore.model import Tag, TaggingResult
+from taggercore.scanner import ScanBackend
 from taggercore.usecase import perform_tagging, scan_region, scan_global
 
 LOGLEVEL = os.environ.get("LOGLEVEL", "INFO").upper()
@@ -39,6 +40,7 @@ logger.setLevel(LOGLEVEL)
 
 def lambda_handler(event, context):
     lambda_config = fetch_lambda_env_config()
+    backend = fetch_scan_backend(lambda_config)
     tags = fetch_tags(lambda_config)
     credentials = get_iam_credentials_for_role(
         lambda_config["ACCOUNT_ROLE"], "ACCOUNT_ROLE_SESSION"
@@ -50,12 +52,17 @@ def lambda_handler(event, context):
             profile="ignored",
         )
     )
-    regional_resources = scan_region(lambda_config["REGION"])
+    regional_resources = scan_region(lambda_config["REGION"], backend=backend)
     if lambda_config["TAG_GLOBAL_RES"] == "TRUE":
-        global_resources = scan_global()
+        global_resources = scan_global(backend=backend)
     else:
         global_resources = []
-    tagging_result = perform_tagging(regional_resources + global_resources, tags)
+    tagging_result = perform_tagging(
+        regional_resources + global_resources,
+        tags,
+        skip_compliant=lambda_config["SKIP_COMPLIANT"] == "TRUE",
+        only_missing_tags=lambda_config["ONLY_MISSING_TAGS"] == "TRUE",
+    )
     log_tagging_result(tagging_result)
 
 
@@ -68,9 +75,21 @@ def fetch_lambda_env_config() -> Dict[str, Any]:
         "TAG_GLOBAL_RES": os.environ.get("TAG_GLOBAL_RES", "TRUE").upper(),
         "TAG_MODE": os.environ.get("TAG_MODE", "ACCOUNT").upper(),
         "TAGS": os.environ.get("TAGS", ""),
+        "SCAN_BACKEND": os.environ.get("SCAN_BACKEND", "SKEW").upper(),
+        "SKIP_COMPLIANT": os.environ.get("SKIP_COMPLIANT", "FALSE").upper(),
+        "ONLY_MISSING_TAGS": os.environ.get("ONLY_MISSING_TAGS", "FALSE").upper(),
     }
 
 
+def fetch_scan_backend(config: Dict[str, Any]) -> ScanBackend:
+    try:
+        return ScanBackend[config["SCAN_BACKEND"]]
+    except KeyError:
+        raise ConfigurationError(
+            f"Please provide one of {', '.join(ScanBackend.__members__)} via ENV variable SCAN_BACKEND"
+        )
+
+
 def fetch_tags(config: Dict[str, Any]) -> List[Tag]:
     tags = []
     tag_mode = config["TAG_MODE"]
@@ -144,6 +163,9 @@ def remove_whitespace(input_str: str) -> str:
 def log_tagging_result(tagging_result: TaggingResult) -> None:
     logger.info(f"Tagged {len(tagging_result.successful_arns)} resources successfully")
     logger.info(f"Failed to tag {len(tagging_result.failed_arns)} resources")
+    logger.info(
+        f"Skipped {len(tagging_result.skipped_arns)} resources which already had all tags"
+    )
     for failed_resource, error_msg in tagging_result.failed_arns.items():
         logger.error(f"Resource {failed_resource}: {error_msg}")
 
@@ -22,11 +22,13 @@
 # under the License.
 #
 from typing import List
+from unittest.mock import ANY
 
 import boto3
 import pytest
 from botocore.exceptions import ClientError
 from taggercore.model import Resource, Tag, TaggingResult
+from taggercore.scanner import ScanBackend
 
 from src import ConfigurationError
 from src import lambda_handler
@@ -175,7 +177,9 @@ class TestLambda:
 
         lambda_handler(None, None)
 
-        mocked_region_scan.assert_called_once_with(env_for_tag_mode_env["REGION"])
+        mocked_region_scan.assert_called_once_with(
+            env_for_tag_mode_env["REGION"], backend=ScanBackend.SKEW
+        )
         mocked_global_scan.assert_called_once()
         mocked_perform_tagging.assert_called_once()
 
@@ -208,7 +212,7 @@ class TestLambda:
         lambda_handler(None, None)
 
         mocked_region_scan.assert_called_once_with(
-            env_tag_mode_env_without_global_res["REGION"]
+            env_tag_mode_env_without_global_res["REGION"], backend=ScanBackend.SKEW
         )
         mocked_global_scan.assert_not_called()
         mocked_perform_tagging.assert_called_once()
@@ -259,14 +263,121 @@ class TestLambda:
         mocked_list_tags_for_resource.assert_called_with(
             ResourceId=env_for_tag_mode_account["ACCOUNT_ID"]
         )
-        mocked_region_scan.assert_called_once_with(env_for_tag_mode_account["REGION"])
+        mocked_region_scan.assert_called_once_with(
+            env_for_tag_mode_account["REGION"], backend=ScanBackend.SKEW
+        )
         mocked_global_scan.assert_called_once()
         mocked_perform_tagging.assert_called_once_with(
-            regional_resources + global_resources, expected_tags
+            regional_resources + global_resources,
+            expected_tags,
+            skip_compliant=False,
+            only_missing_tags=False,
         )
         for failed_res in tagging_result_with_failed_res.failed_arns.keys():
             assert failed_res in caplog.text
 
+    def test_lambda_with_skip_compliant(
+        self,
+        mocker,
+        monkeypatch,
+        env_for_tag_mode_env,
+        regional_resources,
+        global_resources,
+        tagging_result,
+    ):
+        monkeypatch.setenv("SKIP_COMPLIANT", "true")
+        mocker.patch("src.tagging_lambda.scan_region", return_value=regional_resources)
+        mocker.patch("src.tagging_lambda.scan_global", return_value=global_resources)
+        mocked_perform_tagging = mocker.patch("src.tagging_lambda.perform_tagging")
+        mocked_perform_tagging.return_value = tagging_result
+        mocked_boto_client = mocker.patch.object(boto3, "client")
+        mocked_boto_client.return_value.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "access_key",
+                "SecretAccessKey": "secret_key",
+                "SessionToken": "token1",
+            }
+        }
+
+        lambda_handler(None, None)
+
+        mocked_perform_tagging.assert_called_once_with(
+            regional_resources + global_resources,
+            ANY,
+            skip_compliant=True,
+            only_missing_tags=False,
+        )
+
+    def test_lambda_with_only_missing_tags(
+        self,
+        mocker,
+        monkeypatch,
+        env_for_tag_mode_env,
+        regional_resources,
+        global_resources,
+        tagging_result,
+    ):
+        monkeypatch.setenv("ONLY_MISSING_TAGS", "true")
+        mocker.patch("src.tagging_lambda.scan_region", return_value=regional_resources)
+        mocker.patch("src.tagging_lambda.scan_global", return_value=global_resources)
+        mocked_perform_tagging = mocker.patch("src.tagging_lambda.perform_tagging")
+        mocked_perform_tagging.return_value = tagging_result
+        mocked_boto_client = mocker.patch.object(boto3, "client")
+        mocked_boto_client.return_value.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "access_key",
+                "SecretAccessKey": "secret_key",
+                "SessionToken": "token1",
+            }
+        }
+
+        lambda_handler(None, None)
+
+        mocked_perform_tagging.assert_called_once_with(
+            regional_resources + global_resources,
+            ANY,
+            skip_compliant=False,
+            only_missing_tags=True,
+        )
+
+    def test_lambda_with_invalid_scan_backend(self, monkeypatch, env_for_tag_mode_env):
+        monkeypatch.setenv("SCAN_BACKEND", "unknown")
+
+        with pytest.raises(ConfigurationError):
+            lambda_handler(None, None)
+
+    def test_lambda_with_tagging_api_backend(
+        self,
+        mocker,
+        monkeypatch,
+        env_for_tag_mode_env,
+        regional_resources,
+        global_resources,
+        tagging_result,
+    ):
+        monkeypatch.setenv("SCAN_BACKEND", "tagging_api")
+        mocked_region_scan = mocker.patch("src.tagging_lambda.scan_region")
+        mocked_region_scan.return_value = regional_resources
+        mocked_global_scan = mocker.patch("src.tagging_lambda.scan_global")
+        mocked_global_scan.return_value = global_resources
+        mocked_perform_tagging = mocker.patch("src.tagging_lambda.perform_tagging")
+        mocked_perform_tagging.return_value = tagging_result
+        mocked_boto_client = mocker.patch.object(boto3, "client")
+        mocked_boto_client.return_value.assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "access_key",
+                "SecretAccessKey": "secret_key",
+                "SessionToken": "token1",
+            }
+        }
+
+        lambda_handler(None, None)
+
+        mocked_region_scan.assert_called_once_with(
+            env_for_tag_mode_env["REGION"], backend=ScanBackend.TAGGING_API
+        )
+        mocked_global_scan.assert_called_once_with(backend=ScanBackend.TAGGING_API)
+
     def test_lambda_in_tag_mode_account_without_orga_role(
         self, env_for_tag_mode_account_without_orga_role
     ):